@@ -12,7 +12,7 @@ from maya.app.general.mayaMixin import MayaQWidgetBaseMixin
 from maya.app.general.mayaMixin import MayaQWidgetDockableMixin
 
 from RenderSetupUtility._dev.overrideWidgets import ShaderOverrideWidget, PropertyOverrideWidget
-from RenderSetupUtility._dev.shadersWidget import ShadersWidget
+from RenderSetupUtility.main.shadersWidget import ShadersWidget
 
 
 class RenderSetupUtilityWidget(QtWidgets.QWidget, MayaQWidgetDockableMixin):
@@ -189,6 +189,7 @@ class RenderSetupUtilityWidget(QtWidgets.QWidget, MayaQWidgetDockableMixin):
 
         # row5 : ListView
         self._shadersWidget = ShadersWidget()
+        self._shadersWidget.refresh()
         self.layout().addWidget(self._shadersWidget)
 
         # row6: Arnold Properties
@@ -4,7 +4,6 @@ Autoconnect.
 
 # pylint: disable=C0103, E0401
 
-import base64
 import os
 import os.path as path
 import string
@@ -18,53 +17,12 @@ import _winreg
 import maya.cmds as cmds
 import maya.OpenMayaUI as OpenMayaUI
 
+import RenderSetupUtility.ac.sourceImages as sourceImages
 import RenderSetupUtility.ac.templates as templates
 import RenderSetupUtility.main.renderOutput as renderOutput
 from RenderSetupUtility.main.shaderUtility import ShaderUtility
 
 
-# When parsing directories look for these extensions types.
-ACCEPT_TYPES = (
-    'jpg',
-    'tx',
-    'exr',
-    'jpeg',
-    'gif',
-    'exr',
-    'png',
-    'pic',
-    'hdr',
-    'sgi',
-    'tif',
-    'tiff',
-    'bmp',
-    'xpm'
-)
-
-ATTRIBTE_TYPES = (
-    {'attribute': 'color', 'type': 'float3', 'name': 'Diffuse Color'},
-    {'attribute': 'Kd', 'type': 'float1', 'name': 'Diffuse Color Weight'},
-    {'attribute': 'diffuseRoughness', 'type': 'float1', 'name': 'Diffuse Roughness'},
-    {'attribute': 'directDiffuse', 'type': 'float1',
-        'name': 'Direct Diffuse Weight'},
-    {'attribute': 'indirectDiffuse', 'type': 'float1',
-        'name': 'Indirect Diffuse Weight'},
-    {'attribute': 'KsColor', 'type': 'float3', 'name': 'Specular Color'},
-    {'attribute': 'Ks', 'type': 'float1', 'name': 'Specular Weight'},
-    {'attribute': 'specularRoughness', 'type': 'float1', 'name': 'Specular Roughness'},
-    {'attribute': 'specularAnisotropy',
-        'type': 'float1', 'name': 'Specular Anisotropy'},
-    {'attribute': 'specularRotation', 'type': 'float1', 'name': 'Specular Rotation'},
-    {'attribute': 'KrColor', 'type': 'float3', 'name': 'Reflection Color'},
-    {'attribute': 'Kr', 'type': 'float1', 'name': 'Reflection Weight'},
-    {'attribute': 'KtColor', 'type': 'float3', 'name': 'Refraction Color'},
-    {'attribute': 'Kt', 'type': 'float1', 'name': 'Refraction Weight'},
-    {'attribute': 'emissionColor', 'type': 'float3', 'name': 'Emission Color'},
-    {'attribute': 'opacity', 'type': 'float3', 'name': 'Opacity'}
-)
-
-
-
 def find_project_folder(key):
     """Return the relative path of a project folder.
 
@@ -271,6 +229,8 @@ class AutoConnect(SceneInfo):
         AFTER_EFFECTS_PATH = os.path.normpath(
             os.path.join(obj['path'], 'AfterFX.exe'))
 
+    sourceImagesIndex = sourceImages.SourceImagesIndex()
+
     def __init__(self):
         super(AutoConnect, self).__init__()
         self.DATA = {}
@@ -278,48 +238,11 @@ class AutoConnect(SceneInfo):
         if self.isSceneSaved is False:
             return None
 
-        directories = [d for d in os.listdir(self.sourceImages) if os.path.isdir(
-            os.path.join(self.sourceImages, d))]
         shaderList = ShaderUtility().getShaderList(
             excludeOverrides=True, excludeUnused=False)
-
-        for directory in directories:
-            if not (f for f in shaderList if f == directory):
-                continue
-
-            children = {}
-            psdFile = None
-
-            for item in os.listdir(path.join(self.sourceImages, directory)):
-                if item.endswith(".psd"):
-                    psdFile = item
-                    continue
-                if item.endswith(ACCEPT_TYPES) is False:
-                    continue
-
-                # Match name suffixes with the attributes list
-
-                attributesFound = [f for f in ATTRIBTE_TYPES if str(
-                    '_' + f['attribute'].lower()) in item.lower()]
-                if attributesFound == []:
-                    continue
-
-                children[item] = {
-                    'destination': directory + '.' + attributesFound[0]['attribute'],
-                    'type': attributesFound[0]['type'],
-                    'name': item.split('.')[0],
-                    'ext': item.split('.')[1],
-                    'path': path.normpath(path.join(self.sourceImages, directory, item))
-                }
-
-            if psdFile is not None:
-                self.DATA[directory] = {
-                    'psdPath': path.normpath(path.join(self.sourceImages, directory, psdFile)),
-                    'shaderName': directory,
-                    'name': directory,
-                    'children': children,
-                    'path': path.normpath(path.join(self.sourceImages, directory))
-                }
+        snapshot = self.sourceImagesIndex.snapshot(
+            self.sourceImages, set(shaderList))
+        self.DATA = sourceImages.shaderFolders(self.sourceImages, snapshot)
 
     def update(self):
         self.__init__()
@@ -432,6 +355,8 @@ class AutoConnect(SceneInfo):
                 os.makedirs(newFolderName)
             except:
                 print 'Error making folder'
+            self.sourceImagesIndex.invalidate(self.sourceImages)
+            self.sourceImagesIndex.invalidate(newFolderName)
             print '%s -> %s' % (os.path.basename(
                 self.DATA[shaderName]['path']), newFolderName)
 
@@ -486,14 +411,17 @@ class AutoConnect(SceneInfo):
             print 'A folder already exists at this location. No files were created.'
 
         if os.path.isfile('%s/%s.psd' % (dirPath, shaderName)) is not True:
-            f = open('%s/%s.psd' % (dirPath, shaderName), 'w')
-            PSD_TEMPLATE = base64.b64decode(templates.PSD_TEMPLATE_BASE64)
+            f = open('%s/%s.psd' % (dirPath, shaderName), 'wb')
+            PSD_TEMPLATE = templates.psdTemplate()
             f.write(PSD_TEMPLATE)
             f.close()
             print 'PSD file created.'
         else:
             print 'A PSD file already exists at this location. No files were created.'
 
+        # Within the mtime resolution the listings would look unchanged
+        self.sourceImagesIndex.invalidate(self.sourceImages)
+        self.sourceImagesIndex.invalidate(dirPath)
         self.update()
 
 #####################################
@@ -0,0 +1,137 @@
+"""
+Writes black placeholder exr files of any size.
+
+The files are single part scanline images with ZIP compression, 16
+scanlines per chunk. Every full chunk of a black image compresses to the
+same few hundred bytes, so a file is the header, the offset table and that
+chunk repeated, the last one shorter if the height isn't a multiple of 16.
+The headers and the last PLACEHOLDER_CACHE_SIZE files built are cached.
+
+    data = placeholder(1920, 1080)  # RGBA half
+    data = placeholder(1920, 1080, aovChannels('Z'))
+
+See the OpenEXR file layout documentation for the format.
+"""
+
+# pylint: disable=C0103
+
+import collections
+import struct
+import threading
+import zlib
+
+MAGIC = b'\x76\x2f\x31\x01'
+VERSION = 2  # single part scanline file, no flags
+
+# Pixel types
+UINT = 0
+HALF = 1
+FLOAT = 2
+PIXEL_SIZE = {UINT: 4, HALF: 2, FLOAT: 4}
+
+ZIP_COMPRESSION = 3
+ZIP_SCANLINES = 16  # scanlines per ZIP_COMPRESSION chunk
+INCREASING_Y = 0
+
+RGBA = (('R', HALF), ('G', HALF), ('B', HALF), ('A', HALF))
+RGB = (('R', HALF), ('G', HALF), ('B', HALF))
+
+# Channel layout of the AOVs that aren't RGBA, by aov name
+AOV_CHANNELS = {
+    'Z': (('Z', FLOAT),),
+    'N': RGB,
+    'P': RGB,
+    'motionvector': RGB,
+}
+
+PLACEHOLDER_CACHE_SIZE = 4
+
+_headers = {}  # (width, height, channels): header
+_placeholders = collections.OrderedDict()  # (width, height, channels): file
+_lock = threading.Lock()
+
+
+def aovChannels(aov):
+    """The channel layout of `aov`, RGBA for the beauty (None)."""
+    return AOV_CHANNELS.get(aov, RGBA)
+
+
+def _attribute(name, attributeType, value):
+    return b''.join((name, b'\0', attributeType, b'\0',
+                     struct.pack('<i', len(value)), value))
+
+
+def header(width, height, channels=RGBA):
+    """Returns the magic number, version and header of a `width` by
+    `height` image of `channels`, a sequence of (name, pixel type)."""
+    key = (width, height, tuple(channels))
+    if key in _headers:
+        return _headers[key]
+
+    # Channels are listed, and stored, in alphabetical order
+    chlist = b''.join(
+        name.encode('ascii') + b'\0' + struct.pack('<iB3xii', pixelType, 0, 1, 1)
+        for name, pixelType in sorted(channels)) + b'\0'
+    window = struct.pack('<4i', 0, 0, width - 1, height - 1)
+
+    data = b''.join((
+        MAGIC,
+        struct.pack('<i', VERSION),
+        _attribute(b'channels', b'chlist', chlist),
+        _attribute(b'compression', b'compression', struct.pack('<B', ZIP_COMPRESSION)),
+        _attribute(b'dataWindow', b'box2i', window),
+        _attribute(b'displayWindow', b'box2i', window),
+        _attribute(b'lineOrder', b'lineOrder', struct.pack('<B', INCREASING_Y)),
+        _attribute(b'pixelAspectRatio', b'float', struct.pack('<f', 1.0)),
+        _attribute(b'screenWindowCenter', b'v2f', struct.pack('<2f', 0.0, 0.0)),
+        _attribute(b'screenWindowWidth', b'float', struct.pack('<f', 1.0)),
+        b'\0',
+    ))
+    _headers[key] = data
+    return data
+
+
+def blackChunk(width, scanlines, channels=RGBA):
+    """Returns the stored data of `scanlines` black scanlines.
+
+    Before compressing, OpenEXR interleaves the bytes and replaces each by
+    its difference to the previous one, plus 128. For zeros that gives a 0
+    followed by 128s. Chunks that don't get smaller are stored raw.
+    """
+    size = width * scanlines * sum(PIXEL_SIZE[f[1]] for f in channels)
+    compressed = zlib.compress(b'\0' + b'\x80' * (size - 1), 9)
+    if len(compressed) >= size:
+        return b'\0' * size
+    return compressed
+
+
+def placeholder(width, height, channels=RGBA):
+    """Returns the bytes of a black `width` by `height` exr file."""
+    width = int(width)
+    height = int(height)
+    if width < 1 or height < 1:
+        raise ValueError('Invalid image size: {}x{}'.format(width, height))
+
+    key = (width, height, tuple(channels))
+    with _lock:
+        data = _placeholders.pop(key, None)
+        if data is None:
+            head = header(width, height, channels)
+            rows = range(0, height, ZIP_SCANLINES)
+
+            # Chunks are the first row, the data size and the data
+            full = blackChunk(width, ZIP_SCANLINES, channels)
+            last = blackChunk(width, height - rows[-1], channels)
+            chunks = [struct.pack('<ii', y, len(full)) + full for y in rows[:-1]]
+            chunks.append(struct.pack('<ii', rows[-1], len(last)) + last)
+
+            offsets = []
+            offset = len(head) + 8 * len(chunks)
+            for chunk in chunks:
+                offsets.append(offset)
+                offset += len(chunk)
+            data = b''.join([head, struct.pack('<%dQ' % len(offsets), *offsets)] + chunks)
+        _placeholders[key] = data
+        while len(_placeholders) > PLACEHOLDER_CACHE_SIZE:
+            _placeholders.popitem(last=False)
+    return data
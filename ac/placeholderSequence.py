@@ -0,0 +1,178 @@
+"""
+Writes placeholder image sequences.
+
+Every frame of a placeholder sequence holds the same bytes, so only the
+first frame is written. The other frames are cloned from it:
+
+    reflink   copy-on-write clone (Linux, eg. btrfs, XFS), no data written
+    hardlink  the frames share the first one's file, opt-in
+    write     buffered writes in WRITE_THREADS worker threads
+
+Hardlinks are opt-in because writing into one frame in place, instead of
+replacing the file, changes every frame of the sequence, eg. a renderer
+writing over the placeholders. The window's Hardlink Placeholder Frames
+option turns them on, HARDLINKS is its default. Without them, on file
+systems without reflinks, eg. NFS and SMB shares, every frame is written
+in full. The ``ac.exr`` placeholders are ZIP compressed to keep those
+writes small.
+
+    report = writeSequence(data, ['/renders/beauty_0001.exr', ...])
+    print(report)
+
+"""
+
+# pylint: disable=C0103, E0401
+
+import errno
+import os
+import os.path as path
+import threading
+import timeit
+from multiprocessing.pool import ThreadPool
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Windows
+
+HARDLINKS = False  # default of the window's Hardlink Placeholder Frames
+WRITE_THREADS = 8  # workers cloning, linking or writing the frames
+FICLONE = 0x40049409  # linux/fs.h
+
+_pool = None
+_lock = threading.Lock()
+
+
+class Report(object):
+    """
+    What writeSequence did: the method used for the frames after the first,
+    the number of files, their total size, the bytes actually written and
+    the time it took.
+    """
+
+    __slots__ = ('method', 'files', 'bytes', 'written', 'seconds')
+
+    def __init__(self, method, files, size, written, seconds):
+        self.method = method
+        self.files = files
+        self.bytes = size
+        self.written = written
+        self.seconds = seconds
+
+    @property
+    def throughput(self):
+        """Megabytes of sequence per second."""
+        if not self.seconds:
+            return 0.0
+        return self.bytes / 1048576.0 / self.seconds
+
+    def __str__(self):
+        return '{} files, {:.1f} MB ({:.1f} MB written) in {:.2f}s, {:.1f} MB/s ({})'.format(
+            self.files, self.bytes / 1048576.0, self.written / 1048576.0,
+            self.seconds, self.throughput, self.method)
+
+
+def _remove(destination):
+    # Frames may be linked to each other from an earlier run, writing into
+    # one would change the others.
+    try:
+        os.remove(destination)
+    except OSError as e:
+        if e.errno != errno.ENOENT:
+            raise
+
+
+def _write(source, destination, data):  # pylint: disable=W0613
+    _remove(destination)
+    with open(destination, 'wb') as f:
+        f.write(data)
+    return len(data)
+
+
+def _reflink(source, destination, data):  # pylint: disable=W0613
+    if fcntl is None:
+        raise OSError(errno.EOPNOTSUPP, 'Reflinks are not supported')
+    _remove(destination)
+    with open(source, 'rb') as s:
+        with open(destination, 'wb') as d:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+    return 0
+
+
+def _hardlink(source, destination, data):  # pylint: disable=W0613
+    _remove(destination)
+    if hasattr(os, 'link'):
+        os.link(source, destination)
+        return 0
+
+    # Python 2 on Windows
+    import ctypes
+    if not ctypes.windll.kernel32.CreateHardLinkW(
+            unicode(destination), unicode(source), None):
+        raise ctypes.WinError()
+    return 0
+
+
+def _getPool():
+    # Kept for the session, joining a pool takes a tenth of a second
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = ThreadPool(WRITE_THREADS)
+        return _pool
+
+
+METHODS = (
+    ('reflink', _reflink),
+    ('hardlink', _hardlink),
+    ('write', _write),
+)
+
+
+def writeSequence(data, paths, hardlinks=None):
+    """Writes `data` to every file of `paths`, creating missing folders.
+
+    The first path is written, the others are cloned from it with the first
+    method of METHODS the file system supports. hardlinks defaults to
+    HARDLINKS. Returns a Report.
+    """
+    start = timeit.default_timer()
+    paths = list(paths)
+    if not paths:
+        return Report('write', 0, 0, 0, 0.0)
+    if hardlinks is None:
+        hardlinks = HARDLINKS
+
+    for folder in set(path.dirname(f) for f in paths):
+        if folder and not path.isdir(folder):
+            os.makedirs(folder)
+
+    source = paths[0]
+    written = _write(None, source, data)
+
+    # The first clone picks the method for the rest
+    method, func = 'write', _write
+    if len(paths) > 1:
+        for name, clone in METHODS[:-1]:
+            if name == 'hardlink' and not hardlinks:
+                continue
+            try:
+                written += clone(source, paths[1], data)
+            except (IOError, OSError):
+                continue
+            method, func = name, clone
+            break
+        else:
+            written += _write(source, paths[1], data)
+
+    def _clone(destination):
+        try:
+            return func(source, destination, data)
+        except (IOError, OSError):
+            return _write(source, destination, data)
+
+    if len(paths) > 2:
+        written += sum(_getPool().map(_clone, paths[2:]))
+
+    return Report(method, len(paths), len(data) * len(paths), written,
+                  timeit.default_timer() - start)
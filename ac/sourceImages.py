@@ -0,0 +1,236 @@
+"""
+Lists the texture folders of the project sourceImages folder.
+
+Each shader has a folder named after it, holding a psd file and the
+exported textures named `<anything>_<attribute>.<ext>`. Nothing in here
+touches Maya, so scanning can run in worker threads and be timed without
+it (see ``bench.textureScan``).
+"""
+
+# pylint: disable=C0103, E0401
+
+import os
+import os.path as path
+import re
+import threading
+from multiprocessing.pool import ThreadPool
+
+try:
+    from os import scandir
+except ImportError:
+    try:
+        from scandir import scandir  # backport, if installed
+    except ImportError:
+        scandir = None
+
+SCAN_THREADS = 8  # workers listing the sourceImages folders
+
+# When parsing directories look for these extensions types.
+ACCEPT_TYPES = (
+    'jpg',
+    'tx',
+    'exr',
+    'jpeg',
+    'gif',
+    'exr',
+    'png',
+    'pic',
+    'hdr',
+    'sgi',
+    'tif',
+    'tiff',
+    'bmp',
+    'xpm'
+)
+
+ATTRIBTE_TYPES = (
+    {'attribute': 'color', 'type': 'float3', 'name': 'Diffuse Color'},
+    {'attribute': 'Kd', 'type': 'float1', 'name': 'Diffuse Color Weight'},
+    {'attribute': 'diffuseRoughness', 'type': 'float1', 'name': 'Diffuse Roughness'},
+    {'attribute': 'directDiffuse', 'type': 'float1',
+        'name': 'Direct Diffuse Weight'},
+    {'attribute': 'indirectDiffuse', 'type': 'float1',
+        'name': 'Indirect Diffuse Weight'},
+    {'attribute': 'KsColor', 'type': 'float3', 'name': 'Specular Color'},
+    {'attribute': 'Ks', 'type': 'float1', 'name': 'Specular Weight'},
+    {'attribute': 'specularRoughness', 'type': 'float1', 'name': 'Specular Roughness'},
+    {'attribute': 'specularAnisotropy',
+        'type': 'float1', 'name': 'Specular Anisotropy'},
+    {'attribute': 'specularRotation', 'type': 'float1', 'name': 'Specular Rotation'},
+    {'attribute': 'KrColor', 'type': 'float3', 'name': 'Reflection Color'},
+    {'attribute': 'Kr', 'type': 'float1', 'name': 'Reflection Weight'},
+    {'attribute': 'KtColor', 'type': 'float3', 'name': 'Refraction Color'},
+    {'attribute': 'Kt', 'type': 'float1', 'name': 'Refraction Weight'},
+    {'attribute': 'emissionColor', 'type': 'float3', 'name': 'Emission Color'},
+    {'attribute': 'opacity', 'type': 'float3', 'name': 'Opacity'}
+)
+
+# The `_<attribute>` suffix of a file name without extensions, optionally
+# followed by a frame or version number, eg. `_color_1001` or `_color_v002`.
+# Longer attributes are tried first, eg. `_kscolor` before `_ks`.
+ATTRIBUTE_PATTERN = re.compile(r'_(%s)(?:_\d+|_v\d+)?$' % '|'.join(
+    re.escape(f) for f in sorted(
+        set(a['attribute'].lower() for a in ATTRIBTE_TYPES),
+        key=len, reverse=True)))
+_ATTRIBUTES = dict((f['attribute'].lower(), f) for f in ATTRIBTE_TYPES)
+
+
+def matchAttribute(fileName):
+    """Returns the ATTRIBTE_TYPES item a texture file name is for.
+
+    Only the `_<attribute>` suffix before the extension counts, optionally
+    followed by a `_<frame>` or `_v<version>` number, so attribute names
+    elsewhere in the name, eg. in the shader name, are ignored. Returns
+    None if the name has no such suffix.
+    """
+    match = ATTRIBUTE_PATTERN.search(fileName.lower().split('.')[0])
+    if match is None:
+        return None
+    return _ATTRIBUTES[match.group(1)]
+
+
+def _listDirectory(dirPath, directories=False):
+    """Returns the names of the folders, or the files, in `dirPath`.
+
+    Without scandir only the folders are stat'ed, files are every other
+    entry of the listing.
+    """
+    if scandir is not None:
+        return [f.name for f in scandir(dirPath) if f.is_dir() == directories]
+    names = os.listdir(dirPath)
+    if directories:
+        return [f for f in names if os.path.isdir(path.join(dirPath, f))]
+    return names
+
+
+class SourceImagesIndex(object):
+    """
+    Caches the listings of the sourceImages folders, keyed by folder mtime.
+
+    snapshot() stats the shader folders in a pool of SCAN_THREADS threads and
+    only lists the folders that changed since the last scan. prefetch()
+    takes the snapshot in the background, eg. when the window opens, so the
+    next AutoConnect finds the listings cached.
+    """
+
+    def __init__(self, threads=SCAN_THREADS):
+        self._threads = threads
+        self._pool = None
+        self._cache = {}  # (path, directories): (mtime, names)
+        self._lock = threading.Lock()
+        self._prefetching = {}  # root: thread
+
+    def _getPool(self):
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPool(self._threads)
+            return self._pool
+
+    def _list(self, dirPath, directories=False):
+        key = (dirPath, directories)
+        try:
+            mtime = os.stat(dirPath).st_mtime
+        except OSError:
+            with self._lock:
+                self._cache.pop(key, None)
+            return []
+
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        names = _listDirectory(dirPath, directories=directories)
+        with self._lock:
+            self._cache[key] = (mtime, names)
+        return names
+
+    def snapshot(self, root, names=None):
+        """Returns {folder: [file names]} of the folders in `root`.
+
+        names: only scan the folders of these names, eg. the scene shaders.
+        The lists are shared with the cache and must not be modified.
+        """
+        thread = self._prefetching.get(root)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+        directories = self._list(root, directories=True)
+        if names is not None:
+            directories = [f for f in directories if f in names]
+        if not directories:
+            return {}
+
+        listings = self._getPool().map(
+            lambda f: self._list(path.join(root, f)), directories)
+        return dict(zip(directories, listings))
+
+    def prefetch(self, root, names=None):
+        """Takes a snapshot of `root` in a background thread."""
+        thread = self._prefetching.get(root)
+        if thread is not None and thread.is_alive():
+            return thread
+
+        def _prefetch():
+            try:
+                self.snapshot(root, names)
+            finally:
+                self._prefetching.pop(root, None)
+
+        thread = threading.Thread(
+            target=_prefetch, name='RenderSetupUtilitySourceImages')
+        thread.daemon = True
+        self._prefetching[root] = thread
+        thread.start()
+        return thread
+
+    def invalidate(self, dirPath=None):
+        """Drops the cached listing of `dirPath`, or of every folder."""
+        with self._lock:
+            if dirPath is None:
+                self._cache = {}
+                return
+            self._cache.pop((dirPath, False), None)
+            self._cache.pop((dirPath, True), None)
+
+
+def shaderFolders(root, snapshot):
+    """Returns the AutoConnect.DATA of the shader folders in a snapshot.
+
+    Folders without a psd file are skipped.
+    """
+    data = {}
+    for directory, items in snapshot.iteritems():
+        children = {}
+        psdFile = None
+
+        for item in items:
+            if item.endswith(".psd"):
+                psdFile = item
+                continue
+            if item.endswith(ACCEPT_TYPES) is False:
+                continue
+
+            # Match name suffixes with the attributes list
+
+            attribute = matchAttribute(item)
+            if attribute is None:
+                continue
+
+            children[item] = {
+                'destination': directory + '.' + attribute['attribute'],
+                'type': attribute['type'],
+                'name': item.split('.')[0],
+                'ext': item.split('.')[1],
+                'path': path.normpath(path.join(root, directory, item))
+            }
+
+        if psdFile is not None:
+            data[directory] = {
+                'psdPath': path.normpath(path.join(root, directory, psdFile)),
+                'shaderName': directory,
+                'name': directory,
+                'children': children,
+                'path': path.normpath(path.join(root, directory))
+            }
+    return data
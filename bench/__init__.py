@@ -0,0 +1,137 @@
+"""
+Performance benchmarks for the Render Setup Utility.
+
+The modules in this package build synthetic scenes and time the current
+implementation against the one it replaced (kept in ``bench.legacy``).
+They are meant to be run from a Maya session or mayapy, eg.:
+
+    import RenderSetupUtility.bench.shaderScan as shaderScan
+    shaderScan.run(engines=500, members=20)
+
+Without Maya, eg. in CI, the in-memory stand-in in ``bench.fakeMaya`` is
+installed instead and the same benchmarks run against it.
+"""
+
+import collections
+import contextlib
+import sys
+import timeit
+
+try:
+    import maya.cmds as cmds
+except ImportError:
+    from RenderSetupUtility.bench import fakeMaya
+    fakeMaya.install()
+    import maya.cmds as cmds
+
+
+def timeIt(func, repeat=3):
+    """Returns the best wall-clock time of `repeat` calls of `func`."""
+    best = None
+    for _ in xrange(repeat):
+        start = timeit.default_timer()
+        func()
+        elapsed = timeit.default_timer() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def newScene(force=False):
+    """Opens an empty scene to build the benchmark scene in.
+
+    Refuses to discard unsaved changes in the current scene, unless `force`
+    is set, eg. to replace a scene the benchmark built itself.
+    """
+    if not force and cmds.file(query=True, modified=True):
+        raise RuntimeError(
+            'The current scene has unsaved changes. Save it before running the benchmark.')
+    cmds.file(new=True, force=True)
+
+
+def report(title, rows):
+    """Prints a result table. `rows` is a list of (label, seconds) tuples."""
+    print('# {}'.format(title))
+    baseline = rows[0][1]
+    for label, seconds in rows:
+        print('#   {:<24} {:>10.4f}s {:>8.2f}x'.format(
+            label, seconds, baseline / seconds if seconds else 0.0))
+
+
+class CallCounter(object):
+    """Wraps a module and counts the calls made to each of its functions."""
+
+    def __init__(self, module):
+        self._module = module
+        self.calls = collections.Counter()
+
+    def __getattr__(self, name):
+        attr = getattr(self._module, name)
+        if not callable(attr):
+            return attr
+
+        def _counted(*args, **kwargs):
+            self.calls[name] += 1
+            return attr(*args, **kwargs)
+        return _counted
+
+    def total(self):
+        """Returns the number of calls made through the counter."""
+        return sum(self.calls.values())
+
+
+@contextlib.contextmanager
+def countCalls(*modules):
+    """Routes the `cmds` of the given modules through a CallCounter.
+
+        with bench.countCalls(shaderUtility) as counter:
+            ...
+        print(counter.calls)
+
+    """
+    counter = CallCounter(cmds)
+    originals = [m.cmds for m in modules]
+    for module in modules:
+        module.cmds = counter
+    try:
+        yield counter
+    finally:
+        for module, original in zip(modules, originals):
+            module.cmds = original
+
+
+def asDicts(data):
+    """Returns a copy of ShaderUtility.data with plain dict entries.
+
+    Member order is not guaranteed to match between implementations, so
+    usedBy is sorted. Records and the legacy dicts compare equal this way.
+    """
+    return dict(
+        (k, dict(v, usedBy=sorted(v['usedBy']))) for k, v in data.items())
+
+
+def sizeOf(obj):
+    """Returns the deep size of `obj` in bytes.
+
+    Walks dicts, lists, tuples, sets and __slots__ objects. Objects
+    referenced more than once, eg. shared strings, are counted once.
+    """
+    seen = set()
+    stack = [obj]
+    size = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif hasattr(item, '__slots__'):
+            stack.extend(getattr(item, f) for f in item.__slots__
+                         if hasattr(item, f))
+    return size
@@ -0,0 +1,86 @@
+"""
+Benchmarks parsing the custom strings of the shader list.
+
+The window turns list items back into shader names, properties and the
+active flag many times per refresh. This compares the two uncompiled
+regexes per call it used to run with the single compiled pattern, and
+with the table shaderList fills in when it builds the strings, over
+`count` custom strings. No scene is needed.
+
+    import RenderSetupUtility.bench.customString as customString
+    customString.run(count=100000)
+
+"""
+
+# pylint: disable=C0103, E0401, W0212
+
+import RenderSetupUtility.bench as bench
+import RenderSetupUtility.bench.legacy as legacy
+from RenderSetupUtility.main.shaderList import ACTIVEITEM_PREFIX
+from RenderSetupUtility.main.shaderUtility import ShaderUtility
+
+
+def makeStrings(count):
+    """Returns `count` custom strings, every other one active, with the
+    parse each should give."""
+    strings = []
+    for i in xrange(count):
+        shaderName = 'asset%03d:part%03d_aiStandardSurface' % (i // 1000, i % 1000)
+        if i % 2:
+            properties = 'prim-dr-v-%s!!' % (i % 50)
+            string = '%s%s   %s' % (ACTIVEITEM_PREFIX, shaderName, properties)
+        else:
+            properties = '(%s)' % (i % 50)
+            string = '%s %s' % (shaderName, properties)
+        strings.append((string, shaderName, properties, bool(i % 2)))
+    return strings
+
+
+def run(count=100000, repeat=3):
+    """Prints the time to get the name, properties and active flag of each
+    custom string."""
+    strings = makeStrings(count)
+    items = [f[0] for f in strings]
+
+    def _parse(name, active):
+        for string in items:
+            name(string)
+            name(string, properties=True)
+            active(string)
+
+    def _legacy():
+        _parse(legacy.customStringToShaderName, legacy.isActive)
+
+    def _compiled():
+        ShaderUtility.resetCustomStrings()
+        _parse(ShaderUtility.customStringToShaderName, ShaderUtility.isActive)
+
+    def _table():
+        _parse(ShaderUtility.customStringToShaderName, ShaderUtility.isActive)
+
+    # Both give the same answers, and the table what shaderList registered
+    ShaderUtility.resetCustomStrings()
+    for string, shaderName, properties, active in strings:
+        expected = (legacy.customStringToShaderName(string),
+                    legacy.customStringToShaderName(string, properties=True),
+                    legacy.isActive(string))
+        if expected != (shaderName, properties, active) or expected != (
+                ShaderUtility.customStringToShaderName(string),
+                ShaderUtility.customStringToShaderName(string, properties=True),
+                ShaderUtility.isActive(string)):
+            raise RuntimeError('Parsing differs for {!r}'.format(string))
+
+    ShaderUtility.resetCustomStrings()
+    for string, shaderName, properties, active in strings:
+        ShaderUtility.registerCustomString(string, shaderName, properties, active)
+    table = bench.timeIt(_table, repeat=repeat)
+
+    bench.report(
+        'Custom string parsing: {} strings'.format(count),
+        [
+            ('two regexes (legacy)', bench.timeIt(_legacy, repeat=repeat)),
+            ('compiled, first parse', bench.timeIt(_compiled, repeat=repeat)),
+            ('registered table', table),
+        ]
+    )
+    ShaderUtility.resetCustomStrings()
@@ -0,0 +1,134 @@
+"""
+Validates and times the placeholder exr writer, ``ac.exr``.
+
+The header of a 960x540 RGBA half file is compared byte for byte with the
+header of the PIZ compressed template rsMakeComp used to ship, apart from
+the compression. The files of every renderOutput.SIZE_TEMPLATE size are
+then read back: the header attributes, the offset table and each ZIP
+chunk, which must decode to zeros. No scene is needed.
+
+    import RenderSetupUtility.bench.exr as exr
+    exr.run()
+
+"""
+
+# pylint: disable=C0103, E0401, W0212
+
+import struct
+import zlib
+
+import RenderSetupUtility.ac.exr as exr
+import RenderSetupUtility.bench as bench
+from RenderSetupUtility.main.renderOutput import SIZE_TEMPLATE
+
+# The header of the shipped 540.exr template, compression set to ZIP (03)
+HEADER_540 = (
+    '762f3101020000006368616e6e656c730063686c6973740049000000410001000000'
+    '0000000001000000010000004200010000000000000001000000010000004700010000'
+    '0000000000010000000100000052000100000000000000010000000100000000636f6d'
+    '7072657373696f6e00636f6d7072657373696f6e0001000000036461746157696e646f'
+    '7700626f78326900100000000000000000000000bf0300001b020000646973706c6179'
+    '57696e646f7700626f78326900100000000000000000000000bf0300001b0200006c69'
+    '6e654f72646572006c696e654f72646572000100000000706978656c41737065637452'
+    '6174696f00666c6f617400040000000000803f73637265656e57696e646f7743656e74'
+    '6572007632660008000000000000000000000073637265656e57696e646f7757696474'
+    '6800666c6f617400040000000000803f00'
+).decode('hex')
+
+
+def readHeader(data):
+    """Returns the {name: (type, value)} attributes and the offset table
+    position of an exr file."""
+    if data[:4] != exr.MAGIC or struct.unpack('<i', data[4:8])[0] != exr.VERSION:
+        raise RuntimeError('Not a single part scanline exr file')
+    attributes = {}
+    i = 8
+    while data[i] != '\0':
+        end = data.index('\0', i)
+        name = data[i:end]
+        i = end + 1
+        end = data.index('\0', i)
+        attributeType = data[i:end]
+        size = struct.unpack('<i', data[end + 1:end + 5])[0]
+        attributes[name] = (attributeType, data[end + 5:end + 5 + size])
+        i = end + 5 + size
+    return attributes, i + 1
+
+
+def unpredict(data):
+    """Undoes the predictor and the byte interleaving of the ZIP codec."""
+    values = [ord(data[0])]
+    for byte in data[1:]:
+        values.append((values[-1] + ord(byte) - 128) & 0xff)
+    half = (len(values) + 1) // 2
+    out = []
+    for i in xrange(half):
+        out.append(values[i])
+        if half + i < len(values):
+            out.append(values[half + i])
+    return ''.join(chr(f) for f in out)
+
+
+def validate(width, height, channels=exr.RGBA):
+    """Reads back a placeholder file, raises RuntimeError if it's invalid."""
+    data = exr.placeholder(width, height, channels)
+    attributes, offsetTable = readHeader(data)
+
+    window = struct.pack('<4i', 0, 0, width - 1, height - 1)
+    expected = {
+        'compression': ('compression', chr(exr.ZIP_COMPRESSION)),
+        'dataWindow': ('box2i', window),
+        'displayWindow': ('box2i', window),
+        'lineOrder': ('lineOrder', chr(exr.INCREASING_Y)),
+    }
+    for name, value in expected.iteritems():
+        if attributes.get(name) != value:
+            raise RuntimeError('{}x{}: invalid {}'.format(width, height, name))
+
+    lineSize = width * sum(exr.PIXEL_SIZE[f[1]] for f in channels)
+    count = (height + exr.ZIP_SCANLINES - 1) // exr.ZIP_SCANLINES
+    offsets = struct.unpack('<%dQ' % count,
+                            data[offsetTable:offsetTable + 8 * count])
+    chunks = {}
+    for i, offset in enumerate(offsets):
+        row = i * exr.ZIP_SCANLINES
+        y, length = struct.unpack('<ii', data[offset:offset + 8])
+        if y != row:
+            raise RuntimeError('{}x{}: chunk {} is row {}'.format(width, height, i, y))
+        size = lineSize * min(exr.ZIP_SCANLINES, height - row)
+        chunk = data[offset + 8:offset + 8 + length]
+        if (chunk, size) not in chunks:
+            raw = chunk if length >= size else unpredict(zlib.decompress(chunk))
+            chunks[chunk, size] = raw == '\0' * size
+        if not chunks[chunk, size]:
+            raise RuntimeError('{}x{}: row {} isn\'t black'.format(width, height, row))
+    if offsets[-1] + 8 + length != len(data):
+        raise RuntimeError('{}x{}: unexpected file size'.format(width, height))
+    return len(data)
+
+
+def run(repeat=3):
+    """Validates the files of every output size and prints the time to
+    build them."""
+    if exr.header(960, 540) != HEADER_540:
+        raise RuntimeError('The 960x540 header differs from the template')
+
+    sizes = sorted(set((f['width'], f['height']) for f in SIZE_TEMPLATE))
+    fileSizes = dict((f, validate(*f)) for f in sizes)
+    for channels in set(exr.AOV_CHANNELS.values()):
+        validate(*sizes[0], channels=channels)
+    validate(1, 1)
+    validate(3, 7, exr.AOV_CHANNELS['Z'])
+
+    def _build(width, height):
+        def _run():
+            exr._headers.clear()
+            exr._placeholders.clear()
+            exr.placeholder(width, height)
+        return _run
+
+    bench.report(
+        'Placeholder exr files: {} sizes valid'.format(len(sizes)),
+        [('{}x{} ({:.1f} KB)'.format(f[0], f[1], fileSizes[f] / 1024.0),
+          bench.timeIt(_build(*f), repeat=repeat)) for f in sizes]
+    )
@@ -0,0 +1,56 @@
+"""
+Headless stand-in for Maya, so the render setup logic can be benchmarked
+and profiled without a Maya session, eg. in CI.
+
+It provides an in-memory scene graph behind the subset of ``maya.cmds``,
+``maya.api.OpenMaya`` and ``maya.app.renderSetup.model`` that
+``main.utility``, ``main.shaderUtility`` and ``main.renderOutput`` use.
+The modules run unchanged against it:
+
+    import RenderSetupUtility.bench.fakeMaya as fakeMaya
+    fakeMaya.install()
+
+    from RenderSetupUtility.main.shaderUtility import ShaderUtility
+
+``RenderSetupUtility.bench`` installs it on import when Maya is not
+available. ``RenderSetupUtility.bench.generator`` builds synthetic
+production-sized scenes through the same commands.
+
+It models what the tool relies on, not Maya: names are unique scene-wide,
+set members are whole objects, attribute values are not type checked,
+undo is not recorded and there are no ui commands.
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def isInstalled():
+    """True if the fake modules are the ones imported as `maya`."""
+    module = sys.modules.get('maya')
+    return module is not None and \
+        os.path.dirname(os.path.abspath(module.__file__)).startswith(ROOT)
+
+
+def install():
+    """Makes `import maya` import the fake modules.
+
+    Raises RuntimeError if the real Maya modules are already imported.
+    """
+    if isInstalled():
+        return
+    if 'maya' in sys.modules:
+        raise RuntimeError('maya is already imported: {}'.format(
+            sys.modules['maya'].__file__))
+    sys.path.insert(0, ROOT)
+    import maya.cmds  # pylint: disable=E0401, W0612
+    import maya.api.OpenMaya  # pylint: disable=E0401, W0612
+
+
+def scene():
+    """Returns the in-memory scene of the fake modules."""
+    install()
+    import maya._scene  # pylint: disable=E0401
+    return maya._scene.SCENE
@@ -0,0 +1,5 @@
+"""
+In-memory stand-in for the parts of Maya the Render Setup Utility uses.
+
+Installed by RenderSetupUtility.bench.fakeMaya.install(); see there.
+"""
@@ -0,0 +1,494 @@
+"""
+The in-memory scene graph shared by the fake maya modules.
+
+It holds the nodes, their dag hierarchy, attribute values and connections,
+the shading engine memberships and the registered callbacks. maya.cmds,
+maya.api.OpenMaya and the render setup model are thin views on top of it.
+
+Only the behaviour the Render Setup Utility relies on is modelled:
+node names are unique scene-wide (Maya only requires unique names among
+siblings), set members are whole objects (no components) and attribute
+values are plain Python values without type checking.
+"""
+
+# pylint: disable=C0103
+
+import collections
+import itertools
+import re
+
+try:
+    basestring = basestring  # pylint: disable=W0622
+except NameError:  # Python 3
+    basestring = str  # pylint: disable=W0622
+
+
+# node type: parent type
+TYPE_PARENTS = {
+    'dependNode': None,
+
+    # Dag
+    'dagNode': 'dependNode',
+    'transform': 'dagNode',
+    'shape': 'dagNode',
+    'camera': 'shape',
+    'geometryShape': 'shape',
+    'mesh': 'geometryShape',
+    'nurbsSurface': 'geometryShape',
+    'nurbsCurve': 'geometryShape',
+    'aiStandIn': 'geometryShape',
+    'light': 'shape',
+    'renderLight': 'light',
+    'pointLight': 'renderLight',
+    'directionalLight': 'renderLight',
+    'spotLight': 'renderLight',
+    'areaLight': 'renderLight',
+    'aiAreaLight': 'light',
+    'aiSkyDomeLight': 'light',
+    'aiMeshLight': 'light',
+    'aiPhotometricLight': 'light',
+    'aiLightPortal': 'light',
+    'aiSky': 'light',
+
+    # Shading
+    'shadingDependNode': 'dependNode',
+    'lambert': 'shadingDependNode',
+    'reflect': 'lambert',
+    'phong': 'reflect',
+    'blinn': 'reflect',
+    'surfaceShader': 'shadingDependNode',
+    'THdependNode': 'dependNode',
+    'standardSurface': 'THdependNode',
+    'aiStandardSurface': 'THdependNode',
+    'aiUtility': 'THdependNode',
+    'aiToon': 'THdependNode',
+    'aiAmbientOcclusion': 'THdependNode',
+    'aiMotionVector': 'THdependNode',
+    'aiShadowMatte': 'THdependNode',
+    'aiRaySwitch': 'THdependNode',
+    'aiSkin': 'THdependNode',
+    'aiHair': 'THdependNode',
+    'aiPhysicalSky': 'THdependNode',
+    'aiFog': 'THdependNode',
+    'aiVolumeScattering': 'THdependNode',
+    'file': 'THdependNode',
+    'place2dTexture': 'dependNode',
+    'objectSet': 'dependNode',
+    'shadingEngine': 'objectSet',
+
+    # Render settings
+    'renderGlobals': 'dependNode',
+    'resolution': 'dependNode',
+    'aiOptions': 'dependNode',
+    'aiAOV': 'dependNode',
+    'aiAOVDriver': 'dependNode',
+    'aiAOVFilter': 'dependNode',
+
+    # Render setup
+    'renderSetup': 'dependNode',
+    'renderLayer': 'dependNode',
+    'renderSetupLayer': 'dependNode',
+    'collection': 'dependNode',
+    'renderSettingsCollection': 'collection',
+    'aovCollection': 'collection',
+    'lightsCollection': 'collection',
+    'simpleSelector': 'dependNode',
+    'absOverride': 'dependNode',
+    'relOverride': 'dependNode',
+    'shaderOverride': 'dependNode',
+}
+
+# Types listed by ls(materials=True)
+MATERIAL_TYPES = frozenset((
+    'lambert', 'phong', 'blinn', 'surfaceShader', 'standardSurface',
+    'aiStandardSurface', 'aiUtility', 'aiToon', 'aiAmbientOcclusion',
+    'aiMotionVector', 'aiShadowMatte', 'aiRaySwitch', 'aiSkin', 'aiHair',
+))
+
+# Attribute values a new node starts with, by (inherited) type
+DEFAULT_ATTRIBUTES = {
+    'geometryShape': {
+        'primaryVisibility': True,
+        'castsShadows': True,
+        'receiveShadows': True,
+        'visibleInReflections': True,
+        'visibleInRefractions': True,
+        'doubleSided': True,
+        'aiOpaque': True,
+        'aiSelfShadows': True,
+        'aiMatte': False,
+        'aiVisibleInDiffuseReflection': True,
+        'aiVisibleInDiffuseTransmission': True,
+        'aiVisibleInSpecularReflection': True,
+        'aiVisibleInSpecularTransmission': True,
+        'aiVisibleInVolume': True,
+    },
+    'camera': {
+        'renderable': False,
+    },
+    'renderGlobals': {
+        'imageFilePrefix': '',
+        'renderVersion': '',
+        'extensionPadding': 1,
+        'animation': 0,
+        'putFrameBeforeExt': 0,
+        'periodInExt': 1,
+        'useFrameExt': 0,
+        'outFormatControl': 0,
+        'imageFormat': 7,
+    },
+    'resolution': {
+        'width': 960,
+        'height': 540,
+        'deviceAspectRatio': 1.778,
+        'pixelAspect': 1.0,
+    },
+    'aiAOVDriver': {
+        'mergeAOVs': True,
+    },
+    'aiAOV': {
+        'name': '',
+        'enabled': True,
+    },
+}
+
+
+def inheritance(nodeType):
+    """Returns the type and its parents, base type first."""
+    chain = []
+    while nodeType is not None:
+        chain.append(nodeType)
+        nodeType = TYPE_PARENTS.get(nodeType)
+    chain.reverse()
+    return chain
+
+
+class Connection(object):
+    """A connection from a source plug to a destination plug."""
+
+    __slots__ = ('source', 'sourceAttr', 'destination', 'destinationAttr')
+
+    def __init__(self, source, sourceAttr, destination, destinationAttr):
+        self.source = source
+        self.sourceAttr = sourceAttr
+        self.destination = destination
+        self.destinationAttr = destinationAttr
+
+
+class Node(object):
+    """A scene node."""
+
+    def __init__(self, name, nodeType):
+        self.name = name
+        self.type = nodeType
+        self.types = frozenset(inheritance(nodeType))
+        self.alive = True
+        self.parent = None
+        self.children = []
+        self.attributes = {}
+        for base in inheritance(nodeType):
+            self.attributes.update(DEFAULT_ATTRIBUTES.get(base, {}))
+
+        # Connection: None, in connection order
+        self.connections = collections.OrderedDict()
+        self.inputs = {}  # destination attribute: Connection
+
+        # Shading engines and sets: member Node: Connection
+        self.members = collections.OrderedDict()
+        self.nextMemberIndex = 0
+
+    def isA(self, nodeType):
+        """True if the node is of, or inherits from, nodeType."""
+        return nodeType in self.types
+
+    @property
+    def isDag(self):
+        return 'dagNode' in self.types
+
+    @property
+    def path(self):
+        """The long dag path of the node, or its name for dependency nodes."""
+        if not self.isDag:
+            return self.name
+        names = []
+        node = self
+        while node is not None:
+            names.append(node.name)
+            node = node.parent
+        names.reverse()
+        return '|' + '|'.join(names)
+
+    def descendants(self):
+        """Returns the dag children of the node, depth first."""
+        result = []
+        stack = list(reversed(self.children))
+        while stack:
+            node = stack.pop()
+            result.append(node)
+            stack.extend(reversed(node.children))
+        return result
+
+    def __repr__(self):
+        return '<Node %s (%s)>' % (self.name, self.type)
+
+
+class Scene(object):
+    """The nodes of the open scene and the registered callbacks."""
+
+    def __init__(self):
+        self.callbacks = {}  # callback id: (kind, func, clientData, filter)
+        self._callbackIds = itertools.count(1)
+        self.workspace = ''
+        self.reset()
+
+    def reset(self):
+        """Empties the scene and creates the default nodes."""
+        for node in getattr(self, 'nodes', {}).values():
+            node.alive = False
+        self.nodes = {}  # name: Node
+        self.order = []  # creation order, may contain deleted nodes
+        self.namespaces = set()
+        self.modified = False
+        self.currentTime = 1.0
+        self.playbackOptions = {
+            'animationStartTime': 1.0,
+            'animationEndTime': 120.0,
+            'minTime': 1.0,
+            'maxTime': 120.0,
+        }
+        self._counters = {}
+
+        for nodeType, name in (
+                ('renderGlobals', 'defaultRenderGlobals'),
+                ('resolution', 'defaultResolution'),
+                ('aiOptions', 'defaultArnoldRenderOptions'),
+                ('aiAOVDriver', 'defaultArnoldDriver'),
+                ('aiAOVFilter', 'defaultArnoldFilter'),
+                ('lambert', 'lambert1'),
+                ('shadingEngine', 'initialShadingGroup'),
+        ):
+            self.create(nodeType, name, notify=False)
+        self.connect(self.nodes['lambert1'], 'outColor',
+                     self.nodes['initialShadingGroup'], 'surfaceShader',
+                     notify=False)
+
+        persp = self.create('transform', 'persp', notify=False)
+        camera = self.create('camera', 'perspShape', parent=persp, notify=False)
+        camera.attributes['renderable'] = True
+        self.modified = False
+
+    # Nodes
+
+    def uniqueName(self, name):
+        """Resolves a trailing '#' and name clashes the way Maya does."""
+        if name.endswith('#'):
+            base = name[:-1]
+        elif name not in self.nodes:
+            return name
+        else:
+            base = re.sub(r'\d+$', '', name)
+
+        i = self._counters.get(base, 1)
+        while '%s%s' % (base, i) in self.nodes:
+            i += 1
+        self._counters[base] = i + 1
+        return '%s%s' % (base, i)
+
+    def find(self, name):
+        """Returns the node called `name`, a long or a partial dag path."""
+        if not isinstance(name, basestring):
+            return None
+        node = self.nodes.get(name)
+        if node is not None:
+            return node
+        if '|' not in name:
+            return None
+        node = self.nodes.get(name.rsplit('|', 1)[-1])
+        if node is None:
+            return None
+        if name.startswith('|'):
+            return node if node.path == name else None
+        return node if node.path.endswith('|' + name) else None
+
+    def get(self, name):
+        """Returns the node called `name` or raises ValueError."""
+        node = self.find(name)
+        if node is None:
+            raise ValueError('No object matches name: %s' % name)
+        return node
+
+    def all(self):
+        """Returns the nodes in creation order."""
+        if len(self.order) > 2 * len(self.nodes) + 64:
+            self.order = [f for f in self.order if f.alive]
+        return [f for f in self.order if f.alive]
+
+    def create(self, nodeType, name=None, parent=None, notify=True):
+        """Creates a node; shapes without a parent get a new transform."""
+        if nodeType not in TYPE_PARENTS:
+            raise RuntimeError('Unknown object type: %s' % nodeType)
+
+        node = Node(self.uniqueName(name or '%s#' % nodeType), nodeType)
+        if node.isDag and parent is None and node.isA('shape'):
+            parent = self.create('transform', 'transform#', notify=notify)
+        self._add(node, notify)
+        if parent is not None:
+            self.parent(node, parent)
+        return node
+
+    def _add(self, node, notify):
+        self.nodes[node.name] = node
+        self.order.append(node)
+        self.modified = True
+        if notify:
+            self.emit('nodeAdded', node, node)
+
+    def parent(self, node, parent):
+        """Parents a dag node under another dag node, or the world."""
+        if node.parent is not None:
+            self.emit('parentRemoved', node, node, node.parent)
+            node.parent.children.remove(node)
+        node.parent = parent
+        if parent is not None:
+            parent.children.append(node)
+            self.emit('parentAdded', node, node, parent)
+        self.modified = True
+
+    def delete(self, node):
+        """Deletes a node together with its dag children."""
+        if not node.alive:
+            return
+        for child in reversed(node.descendants()):
+            self._delete(child)
+        self._delete(node)
+        if node.parent is not None:
+            node.parent.children.remove(node)
+            node.parent = None
+
+    def _delete(self, node):
+        self.emit('nodeRemoved', node, node)
+        for connection in list(node.connections):
+            self.disconnect(connection)
+        node.alive = False
+        node.children = []
+        del self.nodes[node.name]
+        self.modified = True
+
+    def rename(self, node, name):
+        """Renames a node and returns its new name."""
+        previous = node.name
+        if name == previous:
+            return previous
+        del self.nodes[previous]
+        node.name = self.uniqueName(name)
+        self.nodes[node.name] = node
+        self.modified = True
+        self.emit('nameChanged', node, node, previous)
+        return node.name
+
+    # Connections
+
+    def connect(self, source, sourceAttr, destination, destinationAttr,
+                notify=True):
+        """Connects two plugs, replacing the destination's input."""
+        existing = self.input(destination, destinationAttr)
+        if existing is not None:
+            if existing.source is source and existing.sourceAttr == sourceAttr:
+                return existing
+            self.disconnect(existing, notify=notify)
+
+        connection = Connection(source, sourceAttr, destination, destinationAttr)
+        source.connections[connection] = None
+        destination.connections[connection] = None
+        destination.inputs[destinationAttr] = connection
+        self.modified = True
+        if notify:
+            self.emit('connection', None, connection, True)
+        return connection
+
+    def disconnect(self, connection, notify=True):
+        """Breaks a connection."""
+        if notify:
+            self.emit('connection', None, connection, False)
+        connection.source.connections.pop(connection, None)
+        connection.destination.connections.pop(connection, None)
+        if connection.destination.inputs.get(
+                connection.destinationAttr) is connection:
+            del connection.destination.inputs[connection.destinationAttr]
+        member = connection.source
+        owner = connection.destination
+        if owner.members.get(member) is connection:
+            del owner.members[member]
+        self.modified = True
+
+    @staticmethod
+    def input(node, attr):
+        """Returns the connection into node.attr, if any."""
+        return node.inputs.get(attr)
+
+    # Sets
+
+    def addMember(self, objectSet, member):
+        """Adds a member to a set through a connection, as Maya does."""
+        if member in objectSet.members:
+            return
+        if member.isDag:
+            attr = 'dagSetMembers[%s]' % objectSet.nextMemberIndex
+            sourceAttr = 'instObjGroups[0]'
+        else:
+            attr = 'dnSetMembers[%s]' % objectSet.nextMemberIndex
+            sourceAttr = 'message'
+        objectSet.nextMemberIndex += 1
+        objectSet.members[member] = self.connect(
+            member, sourceAttr, objectSet, attr)
+
+    def removeMember(self, objectSet, member):
+        """Removes a member from a set."""
+        connection = objectSet.members.get(member)
+        if connection is not None:
+            self.disconnect(connection)
+
+    def shadingEngines(self, member):
+        """Returns the shading engines a node is a member of."""
+        return [c.destination for c in member.connections
+                if c.source is member and c.destination.isA('shadingEngine')
+                and c.destination.members.get(member) is c]
+
+    # Callbacks
+
+    def addCallback(self, kind, func, clientData=None, nodeFilter=None):
+        """Registers a callback and returns its id."""
+        callbackId = next(self._callbackIds)
+        self.callbacks[callbackId] = (kind, func, clientData, nodeFilter)
+        return callbackId
+
+    def removeCallback(self, callbackId):
+        """Removes a registered callback."""
+        self.callbacks.pop(callbackId, None)
+
+    def emit(self, kind, node, *args):
+        """Calls the callbacks registered for `kind`.
+
+        `args` are converted to OpenMaya objects by the maya.api.OpenMaya
+        module, which registers itself as the converter on import.
+        """
+        if not self.callbacks:
+            return
+        matching = [f for f in self.callbacks.values() if f[0] == kind]
+        if not matching:
+            return
+        for _, func, clientData, nodeFilter in matching:
+            if nodeFilter is not None and not nodeFilter(node):
+                continue
+            func(*(CONVERTERS.get(kind, _identity)(*args) + (clientData,)))
+
+
+def _identity(*args):
+    return args
+
+
+# kind: function converting the emit() arguments to the callback arguments.
+# Filled in by maya.api.OpenMaya.
+CONVERTERS = {}
+
+SCENE = Scene()
@@ -0,0 +1,453 @@
+"""
+Fake maya.api.OpenMaya.
+
+Covers the classes the Render Setup Utility uses to scan shading engines
+and to track scene changes: MObject, MObjectHandle, MPlug, MDagPath,
+MSelectionList, the MFnDependencyNode, MFnDagNode and MFnSet function
+sets, MItDependencyNodes and the message classes. The attribute function
+sets used to copy shader attributes are not provided.
+"""
+
+# pylint: disable=C0103, W0212
+
+from maya._scene import SCENE, CONVERTERS, basestring
+
+
+class MFn(object):
+    """Function set types. Node types map to the node type they match."""
+
+    kInvalid = 0
+    kDependencyNode = 4
+    kDagNode = 107
+    kTransform = 110
+    kShape = 248
+    kMesh = 296
+    kCamera = 250
+    kLight = 302
+    kSet = 459
+    kShadingEngine = 320
+    kLambert = 362
+
+    kAttribute = 554
+    kNumericAttribute = 555
+    kTypedAttribute = 565
+    kEnumAttribute = 563
+    kCompoundAttribute = 564
+    kMatrixAttribute = 566
+    kDoubleAngleAttribute = 557
+    kDoubleLinearAttribute = 558
+    kFloatAngleAttribute = 560
+    kFloatLinearAttribute = 561
+
+
+_NODE_TYPES = {
+    MFn.kDependencyNode: 'dependNode',
+    MFn.kDagNode: 'dagNode',
+    MFn.kTransform: 'transform',
+    MFn.kShape: 'shape',
+    MFn.kMesh: 'mesh',
+    MFn.kCamera: 'camera',
+    MFn.kLight: 'light',
+    MFn.kSet: 'objectSet',
+    MFn.kShadingEngine: 'shadingEngine',
+    MFn.kLambert: 'lambert',
+}
+
+
+class MFnNumericData(object):
+    kInvalid = 0
+    kBoolean = 1
+    kByte = 2
+    kChar = 3
+    kShort = 4
+    kInt = 7
+    kLong = 7
+    kFloat = 11
+    kDouble = 14
+    kAddr = 20
+
+
+class MFnData(object):
+    kInvalid = 0
+    kNumeric = 1
+    kString = 4
+    kMatrix = 5
+
+
+class MObject(object):
+    """A handle to a scene node."""
+
+    kNullObj = None
+
+    def __init__(self, node=None):
+        if isinstance(node, MObject):
+            node = node._node
+        self._node = node
+
+    def isNull(self):
+        return self._node is None
+
+    def hasFn(self, fn):
+        if self._node is None:
+            return False
+        nodeType = _NODE_TYPES.get(fn)
+        return nodeType is not None and self._node.isA(nodeType)
+
+    def apiTypeStr(self):
+        return self._node.type if self._node is not None else 'kInvalid'
+
+    def __eq__(self, other):
+        return isinstance(other, MObject) and self._node is other._node
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return id(self._node)
+
+
+MObject.kNullObj = MObject()
+
+
+def _node(obj):
+    if isinstance(obj, MObject):
+        return obj._node
+    if isinstance(obj, MDagPath):
+        return obj._node
+    raise TypeError('Expected an MObject, got %r' % (obj,))
+
+
+class MObjectHandle(object):
+    """A handle that stays valid until its node is deleted."""
+
+    def __init__(self, obj=None):
+        self._node = _node(obj) if obj is not None else None
+
+    def hashCode(self):
+        return id(self._node) & 0xffffffff
+
+    def isValid(self):
+        return self._node is not None and self._node.alive
+
+    def isAlive(self):
+        return self.isValid()
+
+    def object(self):
+        return MObject(self._node if self.isValid() else None)
+
+
+class MPlug(object):
+    """An attribute of a node."""
+
+    def __init__(self, node=None, attr=''):
+        self._node = node
+        self._attr = attr
+
+    def node(self):
+        return MObject(self._node)
+
+    def isNull(self):
+        return self._node is None
+
+    def name(self):
+        return '%s.%s' % (self._node.name, self._attr)
+
+    def partialName(self, *args, **kwargs):
+        return self._attr
+
+    def connectedTo(self, asDst, asSrc):
+        plugs = []
+        for c in self._node.connections:
+            if asDst and c.destination is self._node \
+                    and c.destinationAttr == self._attr:
+                plugs.append(MPlug(c.source, c.sourceAttr))
+            if asSrc and c.source is self._node and c.sourceAttr == self._attr:
+                plugs.append(MPlug(c.destination, c.destinationAttr))
+        return plugs
+
+    def __eq__(self, other):
+        return isinstance(other, MPlug) and self._node is other._node \
+            and self._attr == other._attr
+
+    def __ne__(self, other):
+        return not self == other
+
+
+class MDagPath(object):
+    """A path to a dag node."""
+
+    def __init__(self, node=None):
+        self._node = node
+
+    def fullPathName(self):
+        return self._node.path
+
+    def partialPathName(self):
+        return self._node.name
+
+    def node(self):
+        return MObject(self._node)
+
+    def isValid(self):
+        return self._node is not None and self._node.alive
+
+
+class MSelectionList(object):
+    """A list of nodes."""
+
+    def __init__(self, other=None):
+        self._items = list(other._items) if other is not None else []
+
+    def add(self, item):
+        if isinstance(item, basestring):
+            node = SCENE.find(item.partition('.')[0])
+            if node is None:
+                raise RuntimeError('(kInvalidParameter): Object does not exist')
+        else:
+            node = _node(item)
+        self._items.append(node)
+        return self
+
+    def length(self):
+        return len(self._items)
+
+    def isEmpty(self):
+        return not self._items
+
+    def clear(self):
+        self._items = []
+
+    def getDependNode(self, index):
+        return MObject(self._items[index])
+
+    def getDagPath(self, index):
+        node = self._items[index]
+        if not node.isDag:
+            raise TypeError('item is not a DAG path')
+        return MDagPath(node)
+
+    def getComponent(self, index):
+        """Members are whole objects, so the component is always null."""
+        return self.getDagPath(index), MObject()
+
+    def getSelectionStrings(self, index=None):
+        items = self._items if index is None else [self._items[index]]
+        return [f.name for f in items]
+
+
+class MFnBase(object):
+
+    def __init__(self, obj=None):
+        self._node = None
+        if obj is not None:
+            self.setObject(obj)
+
+    def setObject(self, obj):
+        self._node = _node(obj)
+
+    def object(self):
+        return MObject(self._node)
+
+
+class MFnDependencyNode(MFnBase):
+
+    def name(self):
+        return self._node.name
+
+    def setName(self, name):
+        return SCENE.rename(self._node, name)
+
+    @property
+    def typeName(self):
+        return self._node.type
+
+    def create(self, nodeType, name=None):
+        self._node = SCENE.create(nodeType, name)
+        return MObject(self._node)
+
+    def getConnections(self):
+        """Returns a plug for each connected attribute of the node."""
+        plugs = []
+        seen = set()
+        for c in self._node.connections:
+            attr = c.sourceAttr if c.source is self._node else c.destinationAttr
+            if attr in seen:
+                continue
+            seen.add(attr)
+            plugs.append(MPlug(self._node, attr))
+        return plugs
+
+    def findPlug(self, attr, wantNetworkedPlug=True):
+        if attr not in self._node.attributes and attr not in self._node.inputs:
+            raise RuntimeError('(kInvalidParameter): No plug %s' % attr)
+        return MPlug(self._node, attr)
+
+    def hasAttribute(self, attr):
+        return attr in self._node.attributes
+
+
+class MFnDagNode(MFnDependencyNode):
+
+    def create(self, nodeType, name=None, parent=MObject.kNullObj):
+        """Returns the transform created for shapes without a parent,
+        as Maya does."""
+        parentNode = None if parent is None or parent.isNull() else _node(parent)
+        node = SCENE.create(nodeType, name, parent=parentNode)
+        self._node = node
+        if parentNode is None and node.parent is not None:
+            return MObject(node.parent)
+        return MObject(node)
+
+    def fullPathName(self):
+        return self._node.path
+
+    def partialPathName(self):
+        return self._node.name
+
+    def getPath(self):
+        return MDagPath(self._node)
+
+    def childCount(self):
+        return len(self._node.children)
+
+    def child(self, index):
+        return MObject(self._node.children[index])
+
+    def parentCount(self):
+        return 1 if self._node.parent is not None else 0
+
+    def parent(self, index):
+        return MObject(self._node.parent)
+
+
+class MFnSet(MFnDependencyNode):
+
+    def getMembers(self, flatten):
+        members = MSelectionList()
+        members._items = [f for f in self._node.members if f.alive]
+        return members
+
+    def isMember(self, obj):
+        return _node(obj) in self._node.members
+
+
+class MItDependencyNodes(object):
+    """Iterates the scene nodes matching a function set type."""
+
+    def __init__(self, filterType=MFn.kInvalid):
+        nodeType = _NODE_TYPES.get(filterType, 'dependNode')
+        self._nodes = [f for f in SCENE.all() if f.isA(nodeType)]
+        self._index = 0
+
+    def isDone(self):
+        return self._index >= len(self._nodes)
+
+    def next(self):
+        self._index += 1
+
+    def thisNode(self):
+        return MObject(self._nodes[self._index])
+
+    def reset(self):
+        self._index = 0
+
+
+# Messages
+
+class MMessage(object):
+
+    @staticmethod
+    def removeCallback(callbackId):
+        SCENE.removeCallback(callbackId)
+
+    @staticmethod
+    def removeCallbacks(callbackIds):
+        for callbackId in callbackIds:
+            SCENE.removeCallback(callbackId)
+
+
+def _typeFilter(nodeType):
+    if nodeType in (None, 'dependNode'):
+        return None
+    return lambda node: node.isA(nodeType)
+
+
+class MDGMessage(MMessage):
+
+    @staticmethod
+    def addNodeAddedCallback(func, nodeType='dependNode', clientData=None):
+        return SCENE.addCallback('nodeAdded', func, clientData, _typeFilter(nodeType))
+
+    @staticmethod
+    def addNodeRemovedCallback(func, nodeType='dependNode', clientData=None):
+        return SCENE.addCallback('nodeRemoved', func, clientData, _typeFilter(nodeType))
+
+    @staticmethod
+    def addConnectionCallback(func, clientData=None):
+        return SCENE.addCallback('connection', func, clientData)
+
+
+class MNodeMessage(MMessage):
+
+    @staticmethod
+    def addNameChangedCallback(node, func, clientData=None):
+        if node is None or node.isNull():
+            nodeFilter = None
+        else:
+            watched = _node(node)
+            nodeFilter = lambda n: n is watched  # pylint: disable=C3001
+        return SCENE.addCallback('nameChanged', func, clientData, nodeFilter)
+
+
+class MDagMessage(MMessage):
+
+    @staticmethod
+    def addParentAddedCallback(func, clientData=None):
+        return SCENE.addCallback('parentAdded', func, clientData)
+
+    @staticmethod
+    def addParentRemovedCallback(func, clientData=None):
+        return SCENE.addCallback('parentRemoved', func, clientData)
+
+
+class MSceneMessage(MMessage):
+    kAfterNew = 1
+    kBeforeImport = 2
+    kAfterImport = 3
+    kBeforeOpen = 4
+    kAfterOpen = 5
+    kBeforeNew = 9
+    kBeforeReference = 21
+    kAfterReference = 22
+    kBeforeRemoveReference = 23
+    kAfterRemoveReference = 24
+
+    _KINDS = {
+        kAfterNew: 'scene:afterNew',
+        kBeforeNew: 'scene:beforeNew',
+        kBeforeImport: 'scene:beforeImport',
+        kAfterImport: 'scene:afterImport',
+        kBeforeOpen: 'scene:beforeOpen',
+        kAfterOpen: 'scene:afterOpen',
+        kBeforeReference: 'scene:beforeReference',
+        kAfterReference: 'scene:afterReference',
+        kBeforeRemoveReference: 'scene:beforeRemoveReference',
+        kAfterRemoveReference: 'scene:afterRemoveReference',
+    }
+
+    @staticmethod
+    def addCallback(message, func, clientData=None):
+        return SCENE.addCallback(MSceneMessage._KINDS[message], func, clientData)
+
+
+# Callback arguments, see maya._scene.Scene.emit()
+
+CONVERTERS['nodeAdded'] = lambda node: (MObject(node),)
+CONVERTERS['nodeRemoved'] = lambda node: (MObject(node),)
+CONVERTERS['nameChanged'] = lambda node, previous: (MObject(node), previous)
+CONVERTERS['connection'] = lambda c, made: (
+    MPlug(c.source, c.sourceAttr), MPlug(c.destination, c.destinationAttr), made)
+CONVERTERS['parentAdded'] = lambda child, parent: (MDagPath(child), MDagPath(parent))
+CONVERTERS['parentRemoved'] = CONVERTERS['parentAdded']
+for _kind in MSceneMessage._KINDS.values():
+    CONVERTERS[_kind] = lambda: ()
@@ -0,0 +1,3 @@
+"""
+Fake maya.api.
+"""
@@ -0,0 +1,3 @@
+"""
+Fake maya.app.renderSetup.
+"""
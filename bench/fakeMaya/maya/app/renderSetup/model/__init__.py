@@ -0,0 +1,5 @@
+"""
+Fake render setup model: render setup, layers, collections, selectors
+and overrides. Each object is backed by a scene node, so its name is unique
+in the scene and gets incremented by Maya's rules on clashes.
+"""
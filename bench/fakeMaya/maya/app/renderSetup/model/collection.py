@@ -0,0 +1,106 @@
+"""
+Fake render setup collections.
+"""
+
+# pylint: disable=C0103, W0212
+
+import maya.app.renderSetup.model.override as override
+import maya.app.renderSetup.model.selector as selector
+from maya._scene import SCENE
+
+
+class Collection(object):
+    """A selector with overrides and child collections."""
+
+    kTypeName = 'collection'
+
+    def __init__(self, name, parent):
+        self._node = SCENE.create(self.kTypeName, name)
+        self._parent = parent
+        self._enabled = True
+        self._children = []  # overrides and collections, in creation order
+        self._selector = selector.SimpleSelector(
+            '%sSelector' % self._node.name, self)
+
+    def name(self):
+        return self._node.name
+
+    def setName(self, name):
+        SCENE.rename(self._node, name)
+
+    def typeName(self):
+        return self.kTypeName
+
+    def parent(self):
+        return self._parent
+
+    def getSelector(self):
+        return self._selector
+
+    def setSelfEnabled(self, value):
+        self._enabled = bool(value)
+        self._changed()
+
+    def isSelfEnabled(self):
+        return self._enabled
+
+    def isEnabled(self):
+        return self._enabled and self._parent.isEnabled()
+
+    def hasChildren(self):
+        return bool(self._children)
+
+    def getChildren(self):
+        return list(self._children)
+
+    def getOverrides(self):
+        return [f for f in self._children if isinstance(f, override.Override)]
+
+    def getCollections(self):
+        return [f for f in self._children if isinstance(f, Collection)]
+
+    def createOverride(self, overrideName, overrideType):
+        """overrideType is a type name, eg. 'absOverride'."""
+        cls = override.TYPES.get(overrideType)
+        if cls is None:
+            raise RuntimeError('Unknown override type: %s' % overrideType)
+        o = cls(overrideName, self)
+        self._children.append(o)
+        self._changed()
+        return o
+
+    def createCollection(self, collectionName):
+        c = Collection(collectionName, self)
+        self._children.append(c)
+        self._changed()
+        return c
+
+    def _changed(self):
+        self._parent._changed()
+
+    def _delete(self):
+        for child in self._children:
+            child._delete()
+        self._children = []
+        self._selector._delete()
+        SCENE.delete(self._node)
+
+
+class RenderSettingsCollection(Collection):
+    kTypeName = 'renderSettingsCollection'
+
+
+class AOVCollection(Collection):
+    kTypeName = 'aovCollection'
+
+
+class LightsCollection(Collection):
+    kTypeName = 'lightsCollection'
+
+
+def delete(collection):
+    """Removes the collection from its parent and deletes it."""
+    parent = collection.parent()
+    parent._children.remove(collection)
+    collection._delete()
+    parent._changed()
@@ -0,0 +1,101 @@
+"""
+Fake render setup overrides.
+"""
+
+# pylint: disable=C0103
+
+from maya._scene import SCENE
+
+
+class Override(object):
+    """Base class of the overrides. Each override is backed by a scene node."""
+
+    kTypeName = 'override'
+
+    def __init__(self, name, parent):
+        self._node = SCENE.create(self.kTypeName, name)
+        self._parent = parent
+        self._attributeName = None
+        self._value = None
+        self._enabled = True
+
+    def name(self):
+        return self._node.name
+
+    def typeName(self):
+        return self.kTypeName
+
+    def parent(self):
+        return self._parent
+
+    def attributeName(self):
+        if self._attributeName is None:
+            raise RuntimeError('%s is not finalized.' % self.name())
+        return self._attributeName
+
+    def setSelfEnabled(self, value):
+        self._enabled = bool(value)
+        self._changed()
+
+    def isSelfEnabled(self):
+        return self._enabled
+
+    def isEnabled(self):
+        return self._enabled and self._parent.isEnabled()
+
+    def _changed(self):
+        self._parent._changed()
+
+    def _delete(self):
+        SCENE.delete(self._node)
+
+
+class AbsOverride(Override):
+    """Sets an attribute of the collection members to a value."""
+
+    kTypeName = 'absOverride'
+
+    def finalize(self, plugName):
+        """Takes the attribute, and its value, from an existing plug."""
+        nodeName, _, attr = plugName.partition('.')
+        node = SCENE.get(nodeName)
+        self._attributeName = attr
+        self._value = node.attributes.get(attr)
+        self._changed()
+
+    def setAttrValue(self, value):
+        self._value = value
+        self._changed()
+
+    def getAttrValue(self):
+        return self._value
+
+
+class RelOverride(AbsOverride):
+    """Offsets an attribute of the collection members."""
+
+    kTypeName = 'relOverride'
+
+
+class ShaderOverride(Override):
+    """Assigns a shader to the collection members."""
+
+    kTypeName = 'shaderOverride'
+
+    def __init__(self, name, parent):
+        super(ShaderOverride, self).__init__(name, parent)
+        self._attributeName = 'surfaceShader'
+
+    def setSource(self, plugName):
+        nodeName, _, attr = plugName.partition('.')
+        SCENE.connect(SCENE.get(nodeName), attr, self._node, 'attrValue')
+        self._changed()
+
+    def getSource(self):
+        connection = SCENE.input(self._node, 'attrValue')
+        if connection is None:
+            return ''
+        return '%s.%s' % (connection.source.name, connection.sourceAttr)
+
+
+TYPES = dict((f.kTypeName, f) for f in (AbsOverride, RelOverride, ShaderOverride))
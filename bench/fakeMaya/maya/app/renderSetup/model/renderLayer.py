@@ -0,0 +1,98 @@
+"""
+Fake render setup layers.
+"""
+
+# pylint: disable=C0103, W0212
+
+import maya.app.renderSetup.model.collection as collection
+from maya._scene import SCENE
+
+
+class RenderLayer(object):
+    """A render layer and its collections."""
+
+    kTypeName = 'renderSetupLayer'
+
+    def __init__(self, name, renderSetup):
+        self._node = SCENE.create(self.kTypeName, name)
+        self._renderSetup = renderSetup
+        self._children = []
+        self._needsRefresh = False
+        self._renderSettings = None
+        self._aovs = None
+        self._lights = None
+
+    def name(self):
+        return self._node.name
+
+    def setName(self, name):
+        SCENE.rename(self._node, name)
+
+    def typeName(self):
+        return self.kTypeName
+
+    def parent(self):
+        return self._renderSetup
+
+    def isEnabled(self):
+        return True
+
+    def isVisible(self):
+        return self._renderSetup.getVisibleRenderLayer() is self
+
+    def getCollections(self):
+        return list(self._children)
+
+    def getChildren(self):
+        return list(self._children)
+
+    def hasChildren(self):
+        return bool(self._children)
+
+    def createCollection(self, collectionName):
+        c = collection.Collection(collectionName, self)
+        self._children.append(c)
+        self._changed()
+        return c
+
+    def _instance(self, attr, cls, name):
+        if getattr(self, attr) is None:
+            c = cls('%s%s' % (self.name(), name), self)
+            setattr(self, attr, c)
+            self._children.insert(0, c)
+        return getattr(self, attr)
+
+    def renderSettingsCollectionInstance(self):
+        return self._instance(
+            '_renderSettings', collection.RenderSettingsCollection, '_RenderSettings')
+
+    def aovCollectionInstance(self):
+        return self._instance('_aovs', collection.AOVCollection, '_AOVs')
+
+    def lightsCollectionInstance(self):
+        return self._instance('_lights', collection.LightsCollection, '_Lights')
+
+    def needsRefresh(self):
+        return self._needsRefresh
+
+    def apply(self):
+        self._renderSetup._apply(self)
+
+    def _changed(self):
+        """Edits of the visible layer are applied straight away."""
+        if self.isVisible():
+            self._renderSetup._apply(self)
+        else:
+            self._needsRefresh = True
+
+
+class DefaultRenderLayer(RenderLayer):
+    """The master layer. It has no collections."""
+
+    kTypeName = 'renderLayer'
+
+    def __init__(self, renderSetup):
+        super(DefaultRenderLayer, self).__init__('defaultRenderLayer', renderSetup)
+
+    def createCollection(self, collectionName):
+        raise RuntimeError('The default render layer has no collections.')
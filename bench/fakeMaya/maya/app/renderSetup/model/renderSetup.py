@@ -0,0 +1,78 @@
+"""
+Fake render setup.
+
+The visible layer is re-applied after every edit of its collections,
+selectors or overrides, as in Maya. `applyCount` counts these applies so
+benchmarks can compare how often a code path triggers them.
+"""
+
+# pylint: disable=C0103, W0212
+
+import maya.app.renderSetup.model.renderLayer as renderLayer
+from maya._scene import SCENE
+
+_instance = None
+
+
+class RenderSetup(object):
+    """The render layers of the scene."""
+
+    kTypeName = 'renderSetup'
+
+    def __init__(self):
+        self._node = SCENE.create(self.kTypeName, 'renderSetup')
+        self._defaultLayer = renderLayer.DefaultRenderLayer(self)
+        self._layers = []
+        self._visible = self._defaultLayer
+        self.applyCount = 0
+
+    def name(self):
+        return self._node.name
+
+    def getRenderLayers(self):
+        return list(self._layers)
+
+    def getRenderLayer(self, renderLayerName):
+        for layer in self._layers:
+            if layer.name() == renderLayerName:
+                return layer
+        raise Exception('Render layer %s not found.' % renderLayerName)  # pylint: disable=W0719
+
+    def getDefaultRenderLayer(self):
+        return self._defaultLayer
+
+    def getVisibleRenderLayer(self):
+        return self._visible
+
+    def createRenderLayer(self, renderLayerName):
+        layer = renderLayer.RenderLayer(renderLayerName, self)
+        self._layers.append(layer)
+        return layer
+
+    def detachRenderLayer(self, layer):
+        if layer is self._visible:
+            self.switchToLayer(self._defaultLayer)
+        self._layers.remove(layer)
+
+    def switchToLayer(self, layer):
+        if layer is self._visible:
+            return
+        self._visible = layer
+        self._apply(layer)
+
+    def _apply(self, layer):
+        layer._needsRefresh = False
+        if layer is not self._defaultLayer:
+            self.applyCount += 1
+
+
+def instance():
+    """Returns the render setup of the scene, creating it if needed."""
+    global _instance
+    if _instance is None or not _instance._node.alive:
+        _instance = RenderSetup()
+    return _instance
+
+
+def hasInstance():
+    return _instance is not None and _instance._node.alive
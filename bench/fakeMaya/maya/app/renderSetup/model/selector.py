@@ -0,0 +1,113 @@
+"""
+Fake render setup selectors.
+"""
+
+# pylint: disable=C0103
+
+from maya._scene import SCENE, basestring
+
+
+class StaticSelection(object):
+    """The explicit list of objects of a selector."""
+
+    def __init__(self, selector):
+        self._selector = selector
+        self._names = []
+        self._set = set()
+
+    def asList(self):
+        return list(self._names)
+
+    def set(self, objectNames):
+        self._names = []
+        self._set = set()
+        self._add(objectNames)
+        self._selector._changed()
+
+    def add(self, objectNames):
+        self._add(objectNames)
+        self._selector._changed()
+
+    def _add(self, objectNames):
+        if isinstance(objectNames, basestring):
+            objectNames = [objectNames]
+        for name in objectNames:
+            if name not in self._set:
+                self._set.add(name)
+                self._names.append(name)
+
+    def remove(self, objectNames):
+        if isinstance(objectNames, basestring):
+            objectNames = [objectNames]
+        remove = set(objectNames) & self._set
+        if not remove:
+            return
+        self._set -= remove
+        self._names = [f for f in self._names if f not in remove]
+        self._selector._changed()
+
+    def hasMissingObjects(self):
+        return any(SCENE.find(f.partition('.')[0]) is None for f in self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __contains__(self, name):
+        return name in self._set
+
+
+class SimpleSelector(object):
+    """Selects objects by pattern, by static selection and by type."""
+
+    kTypeName = 'simpleSelector'
+
+    kAll = 0
+    kTransforms = 1
+    kShapes = 2
+    kShaders = 3
+    kLights = 4
+    kSets = 5
+    kCameras = 7
+    kCustom = 8
+
+    def __init__(self, name, parent):
+        self._node = SCENE.create(self.kTypeName, name)
+        self._parent = parent
+        self._pattern = ''
+        self._filterType = self.kAll
+        self.staticSelection = StaticSelection(self)
+
+    def name(self):
+        return self._node.name
+
+    def typeName(self):
+        return self.kTypeName
+
+    def parent(self):
+        return self._parent
+
+    def setPattern(self, pattern):
+        self._pattern = pattern
+        self._changed()
+
+    def getPattern(self):
+        return self._pattern
+
+    def setFilterType(self, filterType):
+        self._filterType = filterType
+        self._changed()
+
+    def getFilterType(self):
+        return self._filterType
+
+    def hasMissingObjects(self):
+        return self.staticSelection.hasMissingObjects()
+
+    def _changed(self):
+        self._parent._changed()
+
+    def _delete(self):
+        SCENE.delete(self._node)
@@ -0,0 +1,403 @@
+"""
+Fake maya.cmds.
+
+Implements the commands, and the flags of those commands, used by the
+Render Setup Utility modules on top of the in-memory scene. Flags can be
+given by their long or short names. Ui commands are not provided.
+"""
+
+# pylint: disable=C0103, W0622
+
+import fnmatch
+
+from maya._scene import SCENE, TYPE_PARENTS, MATERIAL_TYPES, basestring
+from maya._scene import inheritance
+
+
+def _flag(kwargs, name, short=None, default=None):
+    if name in kwargs:
+        return kwargs[name]
+    if short is not None and short in kwargs:
+        return kwargs[short]
+    return default
+
+
+def _names(args):
+    """Flattens the positional arguments of a command to a list of names."""
+    names = []
+    for arg in args:
+        if isinstance(arg, basestring):
+            names.append(arg)
+        elif arg is not None:
+            names.extend(arg)
+    return names
+
+
+def _split(name):
+    """Splits 'node.attr' to ('node', 'attr')."""
+    node, _, attr = name.partition('.')
+    return node, attr.strip()
+
+
+def _displayName(node, long):
+    return node.path if long else node.name
+
+
+# Scene
+
+def file(*args, **kwargs):
+    """Supports new=True, force=True and query=True, modified=True."""
+    if _flag(kwargs, 'query', 'q'):
+        if _flag(kwargs, 'modified', 'amf'):
+            return SCENE.modified
+        raise NotImplementedError('file: unsupported query %s' % kwargs)
+    if _flag(kwargs, 'new', 'new'):
+        if SCENE.modified and not _flag(kwargs, 'force', 'f'):
+            raise RuntimeError('Unsaved changes.')
+        SCENE.emit('scene:beforeNew', None)
+        SCENE.reset()
+        SCENE.emit('scene:afterNew', None)
+        return 'untitled'
+    raise NotImplementedError('file: unsupported flags %s' % kwargs)
+
+
+def workspace(*args, **kwargs):
+    if _flag(kwargs, 'query', 'q') and _flag(kwargs, 'rootDirectory', 'rd'):
+        return SCENE.workspace
+    raise NotImplementedError('workspace: unsupported flags %s' % kwargs)
+
+
+def undoInfo(*args, **kwargs):
+    """Undo is not recorded; chunks are accepted and ignored."""
+    if _flag(kwargs, 'query', 'q'):
+        return False
+    return None
+
+
+def allNodeTypes(**kwargs):
+    return sorted(TYPE_PARENTS)
+
+
+def currentTime(*args, **kwargs):
+    if _flag(kwargs, 'query', 'q'):
+        return SCENE.currentTime
+    if args:
+        SCENE.currentTime = float(args[0])
+    return SCENE.currentTime
+
+
+def playbackOptions(**kwargs):
+    query = _flag(kwargs, 'query', 'q')
+    for key, short in (
+            ('animationStartTime', 'ast'),
+            ('animationEndTime', 'aet'),
+            ('minTime', 'min'),
+            ('maxTime', 'max'),
+    ):
+        value = _flag(kwargs, key, short)
+        if value is None:
+            continue
+        if query:
+            return SCENE.playbackOptions[key]
+        SCENE.playbackOptions[key] = float(value)
+    return None
+
+
+def namespace(*args, **kwargs):
+    """Supports add and exists. Namespaces are only part of the node names."""
+    name = _flag(kwargs, 'add', 'add')
+    if name is not None:
+        SCENE.namespaces.add(name)
+        return name
+    name = _flag(kwargs, 'exists', 'ex')
+    if name is not None:
+        return name in SCENE.namespaces
+    raise NotImplementedError('namespace: unsupported flags %s' % kwargs)
+
+
+# Nodes
+
+def objExists(name):
+    if not isinstance(name, basestring):
+        return False
+    node, attr = _split(name)
+    found = SCENE.find(node)
+    if found is None:
+        return False
+    if attr and '[' not in attr:
+        return attr in found.attributes or attr in found.inputs
+    return True
+
+
+def createNode(nodeType, **kwargs):
+    name = _flag(kwargs, 'name', 'n')
+    parent = _flag(kwargs, 'parent', 'p')
+    if parent is not None:
+        parent = SCENE.get(parent)
+    return SCENE.create(nodeType, name, parent=parent).name
+
+
+def shadingNode(nodeType, **kwargs):
+    return createNode(nodeType, name=_flag(kwargs, 'name', 'n'))
+
+
+def delete(*args, **kwargs):
+    for name in _names(args):
+        node = SCENE.find(_split(name)[0])
+        if node is None:
+            raise ValueError('No object matches name: %s' % name)
+        SCENE.delete(node)
+
+
+def rename(*args, **kwargs):
+    if len(args) == 2:
+        return SCENE.rename(SCENE.get(args[0]), args[1])
+    raise NotImplementedError('rename: expected the old and the new name')
+
+
+def parent(*args, **kwargs):
+    """Supports parent(children..., parent) and parent(children..., world=True)."""
+    names = _names(args)
+    if _flag(kwargs, 'world', 'w'):
+        newParent = None
+    else:
+        newParent = SCENE.get(names.pop())
+    result = []
+    for name in names:
+        node = SCENE.get(name)
+        SCENE.parent(node, newParent)
+        result.append(node.name)
+    return result
+
+
+def nodeType(name, **kwargs):
+    node = SCENE.get(_split(name)[0])
+    if _flag(kwargs, 'inherited', 'i'):
+        return inheritance(node.type)[1:]  # without dependNode, like Maya
+    return node.type
+
+
+def objectType(name, **kwargs):
+    node = SCENE.get(_split(name)[0])
+    isType = _flag(kwargs, 'isType', 'i')
+    if isType is not None:
+        return node.type == isType
+    return node.type
+
+
+def ls(*args, **kwargs):
+    """Supports names and wildcards, type, shapes, dagObjects, transforms,
+    materials, long and showType."""
+    long = _flag(kwargs, 'long', 'l', False)
+    showType = _flag(kwargs, 'showType', 'st', False)
+
+    names = _names(args)
+    components = []
+    if names:
+        nodes = []
+        for name in names:
+            node, attr = _split(name)
+            if any(c in node for c in '*?['):
+                nodes += [f for f in SCENE.all()
+                          if fnmatch.fnmatchcase(f.name, node)]
+                continue
+            found = SCENE.find(node)
+            if found is None:
+                continue
+            if attr:
+                components.append(
+                    (found, '%s.%s' % (_displayName(found, long), attr)))
+            else:
+                nodes.append(found)
+    else:
+        nodes = SCENE.all()
+
+    filters = []
+    types = _flag(kwargs, 'type', 'typ')
+    if types is not None:
+        types = [types] if isinstance(types, basestring) else list(types)
+        filters.append(lambda n: any(n.isA(t) for t in types))
+    if _flag(kwargs, 'shapes', 's'):
+        filters.append(lambda n: n.isA('shape'))
+    if _flag(kwargs, 'transforms', 'tr'):
+        filters.append(lambda n: n.isA('transform'))
+    if _flag(kwargs, 'dagObjects', 'dag'):
+        filters.append(lambda n: n.isDag)
+    if _flag(kwargs, 'materials', 'mat'):
+        filters.append(lambda n: n.type in MATERIAL_TYPES)
+    for f in filters:
+        nodes = [n for n in nodes if f(n)]
+        components = [c for c in components if f(c[0])]
+
+    result = []
+    seen = set()
+    for node in nodes:
+        if node in seen:
+            continue
+        seen.add(node)
+        result.append(_displayName(node, long))
+        if showType:
+            result.append(node.type)
+    for node, name in components:
+        result.append(name)
+        if showType:
+            result.append(node.type)
+    return result
+
+
+def listRelatives(*args, **kwargs):
+    """Supports parent, allParents, children, shapes, allDescendents,
+    type, path and fullPath. Returns None when nothing is found."""
+    fullPath = _flag(kwargs, 'fullPath', 'f', False)
+
+    def _name(node):
+        # Names are unique, so the shortest unique path is the name
+        return node.path if fullPath else node.name
+
+    result = []
+    for name in _names(args):
+        node = SCENE.get(_split(name)[0])
+        if _flag(kwargs, 'parent', 'p') or _flag(kwargs, 'allParents', 'ap'):
+            if node.parent is not None:
+                result.append(node.parent)
+            continue
+        if _flag(kwargs, 'allDescendents', 'ad'):
+            related = node.descendants()
+        else:
+            related = list(node.children)
+        if _flag(kwargs, 'shapes', 's'):
+            related = [f for f in related if f.isA('shape')]
+        nodeType = _flag(kwargs, 'type', 'typ')
+        if nodeType is not None:
+            related = [f for f in related if f.isA(nodeType)]
+        result += related
+
+    return [_name(f) for f in result] or None
+
+
+# Attributes
+
+def getAttr(name, **kwargs):
+    nodeName, attr = _split(name)
+    node = SCENE.get(nodeName)
+    if attr not in node.attributes:
+        raise ValueError('No attribute matches name: %s' % name)
+    return node.attributes[attr]
+
+
+def setAttr(name, *args, **kwargs):
+    nodeName, attr = _split(name)
+    node = SCENE.get(nodeName)
+    if not args:
+        value = None
+    elif len(args) == 1:
+        value = args[0]
+    else:
+        value = tuple(args)
+    node.attributes[attr] = value
+    SCENE.modified = True
+
+
+# Connections
+
+def connectAttr(source, destination, **kwargs):
+    sourceNode, sourceAttr = _split(source)
+    destinationNode, destinationAttr = _split(destination)
+    destinationNode = SCENE.get(destinationNode)
+    existing = SCENE.input(destinationNode, destinationAttr)
+    if existing is not None and not _flag(kwargs, 'force', 'f'):
+        raise RuntimeError('%s is already connected.' % destination)
+    SCENE.connect(SCENE.get(sourceNode), sourceAttr,
+                  destinationNode, destinationAttr)
+
+
+def disconnectAttr(source, destination, **kwargs):
+    destinationNode, destinationAttr = _split(destination)
+    connection = SCENE.input(SCENE.get(destinationNode), destinationAttr)
+    if connection is None or '%s.%s' % (
+            connection.source.name, connection.sourceAttr) != \
+            '%s.%s' % (SCENE.get(_split(source)[0]).name, _split(source)[1]):
+        raise RuntimeError('%s is not connected to %s.' % (source, destination))
+    SCENE.disconnect(connection)
+
+
+def isConnected(source, destination, **kwargs):
+    destinationNode, destinationAttr = _split(destination)
+    connection = SCENE.input(SCENE.get(destinationNode), destinationAttr)
+    if connection is None:
+        return False
+    sourceNode, sourceAttr = _split(source)
+    return connection.source is SCENE.get(sourceNode) \
+        and connection.sourceAttr == sourceAttr
+
+
+def listConnections(*args, **kwargs):
+    """Supports source, destination, plugs, connections and type."""
+    source = _flag(kwargs, 'source', 's', True)
+    destination = _flag(kwargs, 'destination', 'd', True)
+    plugs = _flag(kwargs, 'plugs', 'p', False)
+    connections = _flag(kwargs, 'connections', 'c', False)
+    nodeType = _flag(kwargs, 'type', 't')
+
+    result = []
+    for name in _names(args):
+        nodeName, attr = _split(name)
+        node = SCENE.get(nodeName)
+        for c in node.connections:
+            if c.destination is node and source:
+                local, other, otherAttr = c.destinationAttr, c.source, c.sourceAttr
+            elif c.source is node and destination:
+                local, other, otherAttr = c.sourceAttr, c.destination, c.destinationAttr
+            else:
+                continue
+            if attr and local != attr:
+                continue
+            if nodeType is not None and not other.isA(nodeType):
+                continue
+            if connections:
+                result.append('%s.%s' % (node.name, local))
+            result.append('%s.%s' % (other.name, otherAttr)
+                          if plugs else other.name)
+    return result
+
+
+# Sets
+
+def sets(*args, **kwargs):
+    """Supports creating sets and shading engines, query, and
+    edit with forceElement, addElement and remove."""
+    names = _names(args)
+
+    if _flag(kwargs, 'query', 'q'):
+        objectSet = SCENE.get(names[0])
+        return [f.name for f in objectSet.members] or None
+
+    if _flag(kwargs, 'edit', 'e'):
+        force = _flag(kwargs, 'forceElement', 'fe')
+        add = _flag(kwargs, 'addElement', 'add')
+        remove = _flag(kwargs, 'remove', 'rm')
+        objectSet = SCENE.get(force or add or remove)
+        for name in names:
+            member = SCENE.get(_split(name)[0])
+            if remove:
+                SCENE.removeMember(objectSet, member)
+                continue
+            if objectSet.isA('shadingEngine'):
+                # Objects can only be in one shading engine
+                for other in SCENE.shadingEngines(member):
+                    if other is not objectSet:
+                        if not force:
+                            raise RuntimeError(
+                                '%s is already in %s.' % (name, other.name))
+                        SCENE.removeMember(other, member)
+            SCENE.addMember(objectSet, member)
+        return None
+
+    renderable = _flag(kwargs, 'renderable', 'r', False)
+    objectSet = SCENE.create(
+        'shadingEngine' if renderable else 'objectSet',
+        _flag(kwargs, 'name', 'n') or ('set#' if not renderable else None))
+    if not _flag(kwargs, 'empty', 'em'):
+        for name in names:
+            SCENE.addMember(objectSet, SCENE.get(_split(name)[0]))
+    return objectSet.name
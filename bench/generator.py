@@ -0,0 +1,95 @@
+"""
+Builds synthetic production-sized scenes for the benchmarks.
+
+The scene is made of assets, each a group of meshes in its own namespace
+with its own shaders, plus lights, standins and render layers with one
+collection per shader. Only maya.cmds and the render setup model are used,
+so the same scene can be built in Maya (with mtoa loaded) or against
+``bench.fakeMaya``.
+
+    import RenderSetupUtility.bench.generator as generator
+    generator.buildScene(assets=100, shaders=20, shapes=25)
+
+"""
+
+# pylint: disable=C0103, E0401
+
+import maya.app.renderSetup.model.renderSetup as renderSetup
+import maya.cmds as cmds
+
+SHADER_TYPES = ('aiStandardSurface', 'lambert', 'aiUtility', 'phong')
+LIGHT_TYPES = ('aiAreaLight', 'pointLight', 'directionalLight',
+               'aiSkyDomeLight', 'spotLight')
+
+
+def buildAsset(index, shaders, shapes, namespace=True):
+    """Creates an asset with `shaders` shaders, each assigned to `shapes`
+    meshes. Returns {shader name: [mesh long names]}."""
+    prefix = ''
+    if namespace:
+        prefix = 'asset%03d:' % index
+        if not cmds.namespace(exists=prefix[:-1]):
+            cmds.namespace(add=prefix[:-1])
+
+    group = cmds.createNode('transform', name='%sasset_grp' % prefix)
+    assignments = {}
+    for i in xrange(shaders):
+        shaderType = SHADER_TYPES[i % len(SHADER_TYPES)]
+        shader = cmds.shadingNode(
+            shaderType, asShader=True, name='%spart%03d_%s' % (prefix, i, shaderType))
+        shadingEngine = cmds.sets(
+            renderable=True, noSurfaceShader=True, empty=True,
+            name='%sSG' % shader)
+        cmds.connectAttr('%s.outColor' % shader,
+                         '%s.surfaceShader' % shadingEngine, force=True)
+
+        meshes = []
+        for n in xrange(shapes):
+            transform = cmds.createNode(
+                'transform', name='%spart%03d_geo%03d' % (prefix, i, n),
+                parent=group)
+            meshes.append(cmds.createNode(
+                'mesh', name='%sShape' % transform, parent=transform))
+        cmds.sets(meshes, edit=True, forceElement=shadingEngine)
+        assignments[shader] = cmds.ls(meshes, long=True)
+    return assignments
+
+
+def buildScene(assets=10, shaders=20, shapes=25, lights=10, standIns=5,
+               layers=2, namespace=True, collections=None):
+    """Builds the scene in the current file and returns a summary dict.
+
+    Each layer gets a collection per shader of the first assets, until it
+    has `collections` collections (`shaders` by default).
+    """
+    assignments = {}
+    for index in xrange(assets):
+        assignments.update(buildAsset(index, shaders, shapes, namespace))
+
+    for i in xrange(lights):
+        cmds.createNode(LIGHT_TYPES[i % len(LIGHT_TYPES)],
+                        name='light%03dShape' % i)
+    for i in xrange(standIns):
+        cmds.createNode('aiStandIn', name='standIn%03dShape' % i)
+
+    rs = renderSetup.instance()
+    if collections is None:
+        collections = shaders
+    names = sorted(assignments)[:collections]
+    for i in xrange(layers):
+        layer = rs.createRenderLayer('layer%02d' % i)
+        for name in names:
+            c = layer.createCollection(
+                '%s_collection' % name.replace(':', '_'))
+            c.getSelector().setFilterType(2)
+            c.getSelector().staticSelection.set(assignments[name])
+
+    return {
+        'assets': assets,
+        'shaders': len(assignments),
+        'shapes': sum(len(f) for f in assignments.values()),
+        'lights': lights,
+        'standIns': standIns,
+        'layers': layers,
+        'collections': layers * len(names),
+    }
@@ -0,0 +1,301 @@
+"""
+Reference copies of implementations that have been replaced by faster ones.
+
+They are only kept so the benchmarks can compare the old and the new code
+path against the same scene. Do not use them in the tool itself.
+"""
+
+# pylint: disable=C0103, E0401
+
+import copy
+import os
+import os.path as path
+import re
+
+import maya.cmds as cmds
+
+from RenderSetupUtility.ac.sourceImages import ACCEPT_TYPES
+from RenderSetupUtility.ac.sourceImages import ATTRIBTE_TYPES
+from RenderSetupUtility.main.shaderUtility import ENVIRONMENT_NODES
+from RenderSetupUtility.main.shaderUtility import LIGHT_NODES
+from RenderSetupUtility.main.shaderUtility import SHADER_NODES
+from RenderSetupUtility.main.shaderUtility import SHADER_TYPES
+
+
+def setShadersToData(shaderUtility):
+    """ShaderUtility._setShadersToData before the OpenMaya scanner."""
+    for shEngine in cmds.ls(type='shadingEngine'):
+        if cmds.sets(shEngine, q=True) is None:
+            continue
+
+        shaderName = None
+        for connection in [x for x in cmds.listConnections(shEngine)]:
+            if [f for f in SHADER_NODES if f in cmds.nodeType(connection, i=True)]:
+                if cmds.objectType(connection) not in SHADER_TYPES:
+                    continue
+
+                # Check for namespace:
+                split = shaderUtility.stripSuffix(connection).split(':')
+                if len(split) == 1:  # no namespace
+                    shaderName = split[0]
+                    nameSpace = ''
+                if len(split) > 1:
+                    shaderName = shaderUtility.stripSuffix(
+                        connection).split(':')[-1]
+                    nameSpace = shaderUtility.stripSuffix(
+                        connection).split(':')[0]
+                if len(nameSpace) >= 1:
+                    shaderName = '%s:%s' % (nameSpace, shaderName)
+
+                shaderUtility.data[shaderName] = {
+                    'name': shaderName,
+                    'nameSpace': nameSpace,
+                    'type': cmds.objectType(connection),
+                    'usedBy': [],
+                    'count': 0,
+                    'shadingGroup': shEngine,
+                    'customString': '',
+                    'shader': True,
+                    'environment': False,
+                    'standIn': False,
+                    'light': False,
+                    'autoConnect': False
+                }
+
+                for sh_connection in cmds.sets(shEngine, q=True):
+                    if not cmds.ls(sh_connection, long=True):
+                        continue
+                    shaderUtility.data[shaderName]['usedBy'].append(
+                        cmds.ls(sh_connection, long=True)[0]
+                    )
+                    shaderUtility.data[shaderName]['count'] = len(
+                        shaderUtility.data[shaderName]['usedBy']
+                    )
+
+
+def setEnvironmentsToData(shaderUtility):
+    """ShaderUtility._setEnvironmentsToData before the typed scene query."""
+    shapes = cmds.ls(dagObjects=True, shapes=True, long=True)
+    for item in [f for f in shapes if cmds.nodeType(f) in ENVIRONMENT_NODES]:
+        # Checking for namespace:
+        split = str(item).split('|')[-1].split(':')
+        if len(split) == 1:  # no namespace
+            shaderName = split[0]
+            nameSpace = ''
+        if len(split) > 1:
+            nameSpace = shaderName = str(item).split('|')[-1].split(':')[0]
+            shaderName = shaderName = str(
+                item).split('|')[-1].split(':')[-1]
+        if len(nameSpace) >= 1:
+            shaderName = '%s:%s' % (nameSpace, shaderName)
+
+        shaderUtility.data[shaderName] = {
+            'name': shaderName,
+            'nameSpace': nameSpace,
+            'type': cmds.nodeType(item),
+            'usedBy': [cmds.ls(shaderName, long=True)[0]],
+            'count': 1,
+            'shadingGroup': 'renderSettings',
+            'customString': '%s (1)' % shaderName,
+            'shader': False,
+            'environment': True,
+            'standIn': False,
+            'light': False,
+            'autoConnect': False
+        }
+
+
+def setStandinsToData(shaderUtility):
+    """ShaderUtility._setStandinsToData before the typed scene query."""
+    # StandIns
+    for item in cmds.ls(type='aiStandIn'):
+
+        # Checking for namespace:
+        split = str(item).split('|')[-1].split(':')
+        if len(split) == 1:  # no namespace
+            shaderName = split[0]
+            nameSpace = ''
+        if len(split) > 1:
+            nameSpace = shaderName = str(item).split('|')[-1].split(':')[0]
+            shaderName = shaderName = str(
+                item).split('|')[-1].split(':')[-1]
+        if len(nameSpace) >= 1:
+            shaderName = '%s:%s' % (nameSpace, shaderName)
+
+        shaderUtility.data[shaderName] = {
+            'name': shaderName,
+            'nameSpace': nameSpace,
+            'type': cmds.nodeType(item),
+            'usedBy': [cmds.ls(shaderName, long=True)[0]],
+            'count': 1,
+            'shadingGroup': 'renderSettings',
+            'customString': '%s (1)' % shaderName,
+            'shader': False,
+            'environment': False,
+            'standIn': True,
+            'light': False,
+            'autoConnect': False
+        }
+
+
+def setLightsToData(shaderUtility):
+    """ShaderUtility._setLightsToData before the typed scene query."""
+    shapes = cmds.ls(dagObjects=True, shapes=True, long=True)
+    # Lights
+    for item in [f for f in shapes if cmds.nodeType(f) in LIGHT_NODES]:
+
+        # Checking for namespace:
+        split = str(item).split('|')[-1].split(':')
+        if len(split) == 1:  # no namespace
+            shaderName = split[0]
+            nameSpace = ''
+        if len(split) > 1:
+            nameSpace = shaderName = str(item).split('|')[-1].split(':')[0]
+            shaderName = shaderName = str(
+                item).split('|')[-1].split(':')[-1]
+        if len(nameSpace) >= 1:
+            shaderName = '%s:%s' % (nameSpace, shaderName)
+
+        shaderUtility.data[shaderName] = {
+            'name': shaderName,
+            'nameSpace': nameSpace,
+            'type': cmds.nodeType(item),
+            'usedBy': [cmds.ls(shaderName, long=True)[0]],
+            'count': 1,
+            'shadingGroup': 'renderSettings',
+            'customString': '%s (1)' % shaderName,
+            'shader': False,
+            'environment': False,
+            'standIn': False,
+            'light': True,
+            'autoConnect': False
+        }
+
+
+def setSceneNodesToData(shaderUtility):
+    """The three scene passes in the order ShaderUtility.update ran them."""
+    setEnvironmentsToData(shaderUtility)
+    setStandinsToData(shaderUtility)
+    setLightsToData(shaderUtility)
+
+
+def customStringToShaderName(string, properties=False):
+    """ShaderUtility.customStringToShaderName before the custom string table."""
+    m = re.match(r'(.*\s+)([a-zA-Z0-9_:]+)(\s+)(.*)', string)
+    if m is None:
+        m = re.match(r'([a-zA-Z0-9_:]+)(\s+)(.*)', string)
+        if m is None:
+            return None
+        if properties:
+            return m.group(3)
+        return m.group(1)
+    else:
+        if properties:
+            return m.group(4)
+        return m.group(2)
+
+
+def isActive(string):
+    """ShaderUtility.isActive before the custom string table."""
+    m = re.match(r'(.*\s+)([a-zA-Z0-9_:]+)(\s+)(.*)', string)
+    if m is None:
+        m = re.match(r'([a-zA-Z0-9_:]+)(\s+)(.*)', string)
+        if m is None:
+            return None
+        return False
+    else:
+        return True
+
+
+def natsort(inList, filterOn=False):
+    """utilities.natsort before the key based sort."""
+    def try_int(s):
+        """ Is it an integer? """
+        try:
+            return int(s)
+        except:
+            return s
+
+    def natsort_key(s):
+        """"""
+        return map(try_int, re.findall(r'(\d+|\D+)', s))
+
+    def natcmp(a, b):
+        """"""
+        return (natsort_key(a) > natsort_key(b)) - (natsort_key(a) < natsort_key(b))
+
+    def natsorted(seq, cmp=natcmp):
+        """"""
+        temp = copy.copy(seq)
+        temp.sort(cmp)
+        return temp
+
+    first = []
+    second = []
+    for s in inList:
+        if s[:1] == ' ':
+            first.append(s)
+        else:
+            second.append(s)
+    if filterOn is True:
+        return natsorted(first) + natsorted(second)
+    else:
+        return natsorted(inList)
+
+
+def shaderFolders(sourceImages, shaderList):
+    """AutoConnect.__init__ before the sourceImages index: lists every
+    folder and takes the first attribute found in each file name."""
+    data = {}
+    directories = [d for d in os.listdir(sourceImages) if os.path.isdir(
+        os.path.join(sourceImages, d))]
+
+    for directory in directories:
+        if not (f for f in shaderList if f == directory):
+            continue
+
+        children = {}
+        psdFile = None
+
+        for item in os.listdir(path.join(sourceImages, directory)):
+            if item.endswith(".psd"):
+                psdFile = item
+                continue
+            if item.endswith(ACCEPT_TYPES) is False:
+                continue
+
+            # Match name suffixes with the attributes list
+
+            attributesFound = [f for f in ATTRIBTE_TYPES if str(
+                '_' + f['attribute'].lower()) in item.lower()]
+            if attributesFound == []:
+                continue
+
+            children[item] = {
+                'destination': directory + '.' + attributesFound[0]['attribute'],
+                'type': attributesFound[0]['type'],
+                'name': item.split('.')[0],
+                'ext': item.split('.')[1],
+                'path': path.normpath(path.join(sourceImages, directory, item))
+            }
+
+        if psdFile is not None:
+            data[directory] = {
+                'psdPath': path.normpath(path.join(sourceImages, directory, psdFile)),
+                'shaderName': directory,
+                'name': directory,
+                'children': children,
+                'path': path.normpath(path.join(sourceImages, directory))
+            }
+    return data
+
+
+def writeExrs(data, paths):
+    """rsMakeComp.write_exrs before the placeholder sequence writer."""
+    for image_path in paths:
+        if not os.path.exists(os.path.dirname(image_path)):
+            os.makedirs(os.path.dirname(image_path))
+
+        with open(image_path, 'w') as exr_file:
+            exr_file = open(image_path, 'w')
+            exr_file.write(data)
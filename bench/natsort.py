@@ -0,0 +1,50 @@
+"""
+Benchmarks utilities.natsort.
+
+Compares the cmp based sort it replaced, which rebuilt both keys on every
+comparison, with the key based sort, with and without the shared key
+cache, on `count` shader list items. No scene is needed.
+
+    import RenderSetupUtility.bench.natsort as natsort
+    natsort.run(count=50000)
+
+"""
+
+# pylint: disable=C0103, E0401, W0212
+
+import random
+
+import RenderSetupUtility.bench as bench
+import RenderSetupUtility.bench.customString as customString
+import RenderSetupUtility.bench.legacy as legacy
+import RenderSetupUtility.main.utilities as util
+
+
+def run(count=50000, repeat=3):
+    """Prints the time to sort `count` custom strings with filterOn."""
+    items = [f[0] for f in customString.makeStrings(count)]
+    random.Random(0).shuffle(items)
+
+    expected = legacy.natsort(items, filterOn=True)
+    if util.natsort(items, filterOn=True) != expected or \
+            util.natsort(items, filterOn=True, cache=True) != expected:
+        raise RuntimeError('The two implementations sorted differently.')
+
+    def _cached():
+        util.natsort(items, filterOn=True, cache=True)
+
+    util._natsortKeys.clear()
+    _cached()  # warm the cache, as on a refresh after the first one
+    cached = bench.timeIt(_cached, repeat=repeat)
+    util._natsortKeys.clear()
+
+    bench.report(
+        'util.natsort: {} items'.format(count),
+        [
+            ('cmp (legacy)', bench.timeIt(
+                lambda: legacy.natsort(items, filterOn=True), repeat=repeat)),
+            ('key', bench.timeIt(
+                lambda: util.natsort(items, filterOn=True), repeat=repeat)),
+            ('key, cached', cached),
+        ]
+    )
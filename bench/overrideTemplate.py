@@ -0,0 +1,53 @@
+"""
+Benchmarks adding the Arnold property overrides to new collections.
+
+Compares creating and deleting the override template mesh for every
+collection with keeping one template for the whole batch
+(Utility.overrideTemplate), and prints the collections per second.
+Only the mesh create and delete cycle is saved, the overrides of every
+collection are still created and finalized one by one, so the gain is
+modest.
+
+    import RenderSetupUtility.bench.overrideTemplate as overrideTemplate
+    overrideTemplate.run(collections=200)
+
+"""
+
+# pylint: disable=C0103, E0401
+
+import itertools
+
+import RenderSetupUtility.bench as bench
+from RenderSetupUtility.main.utility import Utility
+
+
+def run(collections=100, repeat=3):
+    """Adds `collections` collections to a new layer per run, both ways."""
+    bench.newScene()
+    rsUtility = Utility()
+    counter = itertools.count()
+
+    def _addCollections():
+        layer = rsUtility.addLayer('benchLayer%s' % next(counter))
+        for i in xrange(collections):
+            c = layer.createCollection('%s_bench%s' % (layer.name(), i))
+            rsUtility._extendActiveCollection(c, valid=True)
+            rsUtility._addArnoldPropertyOverrides()
+
+    def _perCollection():
+        _addCollections()
+
+    def _template():
+        with rsUtility.overrideTemplate():
+            _addCollections()
+
+    rows = [
+        ('template per collection', bench.timeIt(_perCollection, repeat=repeat)),
+        ('shared template', bench.timeIt(_template, repeat=repeat)),
+    ]
+    bench.report(
+        'Utility._addArnoldPropertyOverrides: {} collections'.format(
+            collections), rows)
+    for label, seconds in rows:
+        print('#   {:<24} {:>10.1f} collections/s'.format(
+            label, collections / seconds if seconds else 0.0))
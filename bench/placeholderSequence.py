@@ -0,0 +1,66 @@
+"""
+Benchmarks writing the rsMakeComp placeholder sequences.
+
+Writes `aovs` sequences of `frames` frames of a black exr to a
+temporary folder, or `root`, the way rsMakeComp used to, writing every
+frame twice, then with ``ac.placeholderSequence``, forcing each method.
+Methods the file system doesn't support fall back to writes. No scene is
+needed.
+
+    import RenderSetupUtility.bench.placeholderSequence as placeholderSequence
+    placeholderSequence.run(frames=200, aovs=4)
+
+"""
+
+# pylint: disable=C0103, E0401
+
+import os.path as path
+import shutil
+import tempfile
+
+import RenderSetupUtility.ac.exr as exr
+import RenderSetupUtility.ac.placeholderSequence as placeholderSequence
+import RenderSetupUtility.bench as bench
+import RenderSetupUtility.bench.legacy as legacy
+
+
+def run(frames=200, aovs=4, width=1920, height=1080, repeat=1, root=None):
+    """Prints the time to write the sequences with each method."""
+    temporary = root is None
+    if temporary:
+        root = tempfile.mkdtemp(prefix='rsu_placeholderSequence')
+    data = exr.placeholder(width, height)
+
+    def _paths(case):
+        return [[path.join(root, case, 'aov%02d' % a, 'aov%02d_%04d.exr' % (a, f))
+                 for f in xrange(1, frames + 1)] for a in xrange(aovs)]
+
+    def _legacy():
+        for paths in _paths('legacy'):
+            legacy.writeExrs(data, paths)
+
+    def _method(name):
+        def _run():
+            methods = placeholderSequence.METHODS
+            placeholderSequence.METHODS = tuple(
+                f for f in methods if f[0] in (name, 'write'))
+            try:
+                reports.extend(placeholderSequence.writeSequence(
+                    data, paths, hardlinks=True) for paths in _paths(name))
+            finally:
+                placeholderSequence.METHODS = methods
+        return _run
+
+    try:
+        rows = [('per frame, twice (legacy)', bench.timeIt(_legacy, repeat=repeat))]
+        for name, _ in placeholderSequence.METHODS:
+            reports = []
+            rows.append((name, bench.timeIt(_method(name), repeat=repeat)))
+            print('# {}: {}'.format(name, reports[-1]))
+        bench.report(
+            'Placeholder sequences: {} x {} frames of {:.0f} KB'.format(
+                aovs, frames, len(data) / 1024.0),
+            rows)
+    finally:
+        if temporary:
+            shutil.rmtree(root)
@@ -0,0 +1,67 @@
+"""
+Benchmarks the scene node pass of ShaderUtility.update.
+
+Compares the single typed query that collects lights, environments and
+standins with the three full-DAG scans it replaced, against a synthetic
+scene of `shapes` meshes and `lights` light shapes. Besides the timings it
+reports the number of maya.cmds calls each path makes.
+
+    import RenderSetupUtility.bench.sceneQuery as sceneQuery
+    sceneQuery.run(shapes=100000, lights=100)
+
+"""
+
+# pylint: disable=C0103, E0401
+
+import maya.cmds as cmds
+
+import RenderSetupUtility.bench as bench
+import RenderSetupUtility.bench.legacy as legacy
+import RenderSetupUtility.main.shaderUtility as shaderUtilityModule
+from RenderSetupUtility.main.shaderUtility import ShaderUtility
+
+
+def buildScene(shapes, lights, lightType='pointLight'):
+    """Creates `shapes` meshes and `lights` lights of `lightType`."""
+    for i in xrange(shapes):
+        cmds.createNode('mesh', name='bench%sShape' % i)
+    for i in xrange(lights):
+        cmds.createNode(lightType, name='benchLight%sShape' % i)
+
+
+def run(shapes=100000, lights=100, repeat=3):
+    """Builds the scene in a new file and prints the timings of both paths."""
+    bench.newScene()
+    buildScene(shapes, lights)
+
+    shaderUtility = ShaderUtility()
+
+    def _legacy():
+        shaderUtility.data = {}
+        legacy.setSceneNodesToData(shaderUtility)
+
+    def _current():
+        shaderUtility.data = {}
+        shaderUtility._setSceneNodesToData()
+
+    with bench.countCalls(legacy) as counter:
+        _legacy()
+    legacyCalls = counter.total()
+    expected = bench.asDicts(shaderUtility.data)
+
+    with bench.countCalls(shaderUtilityModule) as counter:
+        _current()
+    currentCalls = counter.total()
+    if bench.asDicts(shaderUtility.data) != expected:
+        raise RuntimeError('The two implementations returned different data.')
+
+    print('# maya.cmds calls: {} (legacy), {} (typed query)'.format(
+        legacyCalls, currentCalls))
+    bench.report(
+        'ShaderUtility scene nodes: {} shapes, {} lights'.format(
+            shapes, lights),
+        [
+            ('three DAG scans (legacy)', bench.timeIt(_legacy, repeat=repeat)),
+            ('typed query', bench.timeIt(_current, repeat=repeat)),
+        ]
+    )
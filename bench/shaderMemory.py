@@ -0,0 +1,44 @@
+"""
+Measures the memory held by ShaderUtility.data.
+
+Compares the ShaderRecord entries with the 12-key dicts they replaced,
+against a synthetic scene of `engines` shading engines with `members`
+mesh assignments each (50k assignments by default).
+
+    import RenderSetupUtility.bench.shaderMemory as shaderMemory
+    shaderMemory.run(engines=500, members=100)
+
+"""
+
+# pylint: disable=C0103, E0401
+
+import RenderSetupUtility.bench as bench
+import RenderSetupUtility.bench.legacy as legacy
+import RenderSetupUtility.bench.shaderScan as shaderScan
+from RenderSetupUtility.main.shaderUtility import ShaderUtility
+
+
+def run(engines=500, members=100):
+    """Builds the scene in a new file and prints the size of both layouts."""
+    bench.newScene()
+    shaderScan.buildScene(engines, members)
+
+    shaderUtility = ShaderUtility()
+
+    shaderUtility.data = {}
+    legacy.setShadersToData(shaderUtility)
+    before = bench.sizeOf(shaderUtility.data)
+    expected = bench.asDicts(shaderUtility.data)
+
+    shaderUtility.update()
+    shaderUtility.data = dict(
+        (k, v) for k, v in shaderUtility.data.items() if v['shader'])
+    after = bench.sizeOf(shaderUtility.data)
+    if bench.asDicts(shaderUtility.data) != expected:
+        raise RuntimeError('The two implementations returned different data.')
+
+    print('# ShaderUtility.data: {} engines x {} members'.format(
+        engines, members))
+    print('#   {:<24} {:>12,d} bytes'.format('dict entries (legacy)', before))
+    print('#   {:<24} {:>12,d} bytes {:>8.2f}x'.format(
+        'ShaderRecord', after, float(before) / after if after else 0.0))
@@ -0,0 +1,66 @@
+"""
+Benchmarks ShaderUtility._setShadersToData.
+
+Compares the OpenMaya shading engine scanner with the per-node cmds
+implementation it replaced, against a synthetic scene of
+`engines` shading engines with `members` mesh assignments each.
+
+    import RenderSetupUtility.bench.shaderScan as shaderScan
+    shaderScan.run(engines=500, members=20)
+
+"""
+
+# pylint: disable=C0103, E0401
+
+import maya.cmds as cmds
+
+import RenderSetupUtility.bench as bench
+import RenderSetupUtility.bench.legacy as legacy
+from RenderSetupUtility.main.shaderUtility import ShaderUtility
+
+
+def buildScene(engines, members, shaderType='lambert'):
+    """Creates `engines` shaders, each assigned to `members` meshes."""
+    for i in xrange(engines):
+        shader = cmds.shadingNode(
+            shaderType, asShader=True, name='bench%s_shader' % i)
+        shadingEngine = cmds.sets(
+            renderable=True, noSurfaceShader=True, empty=True,
+            name='%sSG' % shader)
+        cmds.connectAttr('%s.outColor' % shader,
+                         '%s.surfaceShader' % shadingEngine, force=True)
+
+        meshes = [cmds.createNode('mesh', name='bench%s_%sShape' % (i, n))
+                  for n in xrange(members)]
+        cmds.sets(meshes, edit=True, forceElement=shadingEngine)
+
+
+def run(engines=200, members=10, repeat=3):
+    """Builds the scene in a new file and prints the timings of both paths."""
+    bench.newScene()
+    buildScene(engines, members)
+
+    shaderUtility = ShaderUtility()
+
+    def _legacy():
+        shaderUtility.data = {}
+        legacy.setShadersToData(shaderUtility)
+
+    def _current():
+        shaderUtility.data = {}
+        shaderUtility._setShadersToData()
+
+    _legacy()
+    expected = bench.asDicts(shaderUtility.data)
+    _current()
+    if bench.asDicts(shaderUtility.data) != expected:
+        raise RuntimeError('The two implementations returned different data.')
+
+    bench.report(
+        'ShaderUtility._setShadersToData: {} engines x {} members'.format(
+            engines, members),
+        [
+            ('cmds (legacy)', bench.timeIt(_legacy, repeat=repeat)),
+            ('OpenMaya', bench.timeIt(_current, repeat=repeat)),
+        ]
+    )
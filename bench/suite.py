@@ -0,0 +1,163 @@
+"""
+Scaling benchmark of the code paths the window runs on refresh and edits.
+
+Builds a generated scene per tier of 100 to 50k shaders and times
+ShaderUtility.update, Utility.collection, Utility.addCollection(s),
+removeMissingSelections, getShaderGroups, util.natsort and the shader list
+updateUI builds (``main.shaderList``). The results are printed and can be
+written as JSON so runs can be compared across changes:
+
+    import RenderSetupUtility.bench.suite as suite
+    suite.run(tiers=(100, 1000), output='/tmp/rsu_suite.json')
+
+or from a shell, with Maya or the ``bench.fakeMaya`` stand-in:
+
+    mayapy -m RenderSetupUtility.bench.suite --output rsu_suite.json
+
+"""
+
+# pylint: disable=C0103, E0401
+
+import argparse
+import datetime
+import json
+import sys
+
+import maya.cmds as cmds
+
+import RenderSetupUtility.bench as bench
+import RenderSetupUtility.bench.fakeMaya as fakeMaya
+import RenderSetupUtility.bench.generator as generator
+import RenderSetupUtility.main.shaderList as shaderList
+import RenderSetupUtility.main.utilities as util
+import RenderSetupUtility.main.utility as utility
+from RenderSetupUtility.main.shaderUtility import ShaderUtility
+
+TIERS = (100, 1000, 10000, 50000)
+SHADERS_PER_ASSET = 50
+SHAPES_PER_SHADER = 2
+COLLECTION_RATIO = 0.1  # shaders with a collection in the benchmark layer
+ADD_COLLECTIONS = 100  # collections added by each of the add cases
+MISSING_RATIO = 0.01  # collected meshes deleted before removeMissingSelections
+LAYER = 'layer00'
+
+
+def buildTier(shaders, shapes=SHAPES_PER_SHADER):
+    """Builds a scene of about `shaders` shaders in the current file."""
+    return generator.buildScene(
+        assets=max(1, shaders // SHADERS_PER_ASSET),
+        shaders=min(shaders, SHADERS_PER_ASSET),
+        shapes=shapes,
+        lights=10,
+        standIns=5,
+        layers=1,
+        collections=max(1, int(shaders * COLLECTION_RATIO)),
+    )
+
+
+def runTier(shaders, repeat=3):
+    """Times each case against a new scene of `shaders` shaders.
+
+    Returns {case: {'seconds': best time, 'items': items processed}}.
+    """
+    shaderUtility = ShaderUtility()
+    rsUtility = utility.Utility()
+    rsUtility.switchLayer(LAYER, switchLayer=True)
+    results = {}
+
+    def _time(case, func, items, repeat=repeat):
+        results[case] = {
+            'seconds': bench.timeIt(func, repeat=repeat), 'items': items}
+
+    _time('ShaderUtility.update', shaderUtility.update, len(cmds.ls(type='shadingEngine')))
+    names = sorted(shaderUtility.data)
+
+    def _collection():
+        rsUtility.invalidateCollections()
+        for name in names:
+            rsUtility.activeLayer.collection(name.replace(':', '_'), isQuery=True)
+    _time('Utility.collection', _collection, len(names))
+
+    _time('ShaderUtility.getShaderGroups', shaderUtility.getShaderGroups, len(names))
+
+    _time('shaderList.buildRows',
+          lambda: shaderList.buildRows(rsUtility, shaderUtility), len(names))
+
+    customStrings = [
+        f.customString for f in shaderList.setCustomStrings(rsUtility, shaderUtility)]
+    _time('util.natsort',
+          lambda: util.natsort(customStrings, filterOn=True), len(customStrings))
+
+    # Edits only run once, they change the scene
+    free = [f for f in names if shaderUtility.data[f]['shader'] and
+            rsUtility.activeLayer.collection(f.replace(':', '_'), isQuery=True) is None]
+    # Both cases add the same number of collections
+    count = min(ADD_COLLECTIONS, len(free) // 2)
+    single, batch = free[:count], free[count:count * 2]
+
+    def _addCollection():
+        for name in single:
+            rsUtility.activeLayer.collection(name.replace(':', '_'), isQuery=False)
+            rsUtility.activeCollection.setSelection(
+                list(shaderUtility.data[name]['usedBy']), 2)
+    _time('Utility.addCollection', _addCollection, len(single), repeat=1)
+
+    def _addCollections():
+        rsUtility.addCollections(
+            [{'name': f.replace(':', '_'),
+              'members': list(shaderUtility.data[f]['usedBy'])} for f in batch])
+    _time('Utility.addCollections', _addCollections, len(batch), repeat=1)
+
+    collected = set()
+    for c in rsUtility.activeLayer.getCollections():
+        if c.typeName() == 'collection':
+            collected.update(c.getSelector().staticSelection.asList())
+    missing = sorted(collected)[::int(1 / MISSING_RATIO)]
+    if missing:
+        cmds.delete(missing)
+    _time('Utility.removeMissingSelections',
+          rsUtility.removeMissingSelections, len(missing), repeat=1)
+
+    return results
+
+
+def run(tiers=TIERS, output=None, repeat=3):
+    """Runs every tier, prints the timings and returns the results.
+
+    The results are also written to `output` as JSON, if given. Tiers above
+    1000 shaders are timed once.
+    """
+    report = {
+        'created': datetime.datetime.now().isoformat(),
+        'backend': 'fakeMaya' if fakeMaya.isInstalled() else 'maya',
+        'python': sys.version.split()[0],
+        'tiers': [],
+    }
+
+    for i, shaders in enumerate(tiers):
+        bench.newScene(force=i > 0)
+        scene = buildTier(shaders)
+        results = runTier(shaders, repeat=repeat if shaders <= 1000 else 1)
+        report['tiers'].append(
+            {'shaders': shaders, 'scene': scene, 'results': results})
+
+        print('# {} shaders, {} shapes, {} collections'.format(
+            scene['shaders'], scene['shapes'], scene['collections']))
+        for case in sorted(results):
+            print('#   {:<34} {:>10.4f}s {:>8} items'.format(
+                case, results[case]['seconds'], results[case]['items']))
+
+    if output:
+        with open(output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print('# Results written to {}'.format(output))
+    return report
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--tiers', type=int, nargs='+', default=TIERS)
+    parser.add_argument('--output', default=None)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    run(tiers=args.tiers, output=args.output, repeat=args.repeat)
@@ -0,0 +1,122 @@
+"""
+Benchmarks scanning the sourceImages texture folders.
+
+AutoConnect lists the texture folders each time it is created. This builds
+a stand-in sourceImages folder of `files` files in a temporary folder and
+compares the listdir scan of every folder it used to run with the
+sourceImages index, cold and cached, and the first-match substring test
+with the attribute suffix pattern. Half of the folders are named
+after shaders. No scene is needed.
+
+    import RenderSetupUtility.bench.textureScan as textureScan
+    textureScan.run(files=100000)
+
+"""
+
+# pylint: disable=C0103, E0401
+
+import os
+import os.path as path
+import shutil
+import tempfile
+
+import RenderSetupUtility.ac.sourceImages as sourceImages
+import RenderSetupUtility.bench as bench
+import RenderSetupUtility.bench.legacy as legacy
+
+FILES_PER_FOLDER = 50
+
+# Texture suffixes, including ones the first-match test gets wrong
+SUFFIXES = ('color', 'Kd', 'KsColor', 'Ks', 'specularRoughness', 'KrColor',
+            'Kr', 'KtColor', 'opacity', 'emissionColor', 'bump', 'Kd_opacity',
+            'Kd_v02', 'color_1001')
+EXTENSIONS = ('tx', 'exr', 'png', 'tif', 'json')
+
+
+def makeTree(root, files, perFolder=FILES_PER_FOLDER):
+    """Writes about `files` empty textures to `root`.
+
+    Returns the shader names, the folders named after shaders.
+    """
+    shaderNames = set()
+    for i in xrange(max(1, files // perFolder)):
+        name = 'asset%03d_part%03d' % (i // 100, i % 100)
+        if i % 2 == 0:
+            shaderNames.add(name)
+        else:
+            name = 'unused_%s' % name
+        folder = path.join(root, name)
+        os.mkdir(folder)
+        open(path.join(folder, '%s.psd' % name), 'w').close()
+        for j in xrange(perFolder - 1):
+            open(path.join(folder, '%s_v%02d_%s.%s' % (
+                name, j, SUFFIXES[j % len(SUFFIXES)],
+                EXTENSIONS[j % len(EXTENSIONS)])), 'w').close()
+    return shaderNames
+
+
+def run(files=100000, repeat=3, root=None):
+    """Prints the time to scan and classify a tree of `files` textures.
+
+    The tree is written to `root`, or a temporary folder removed after.
+    """
+    temporary = root is None
+    if temporary:
+        root = tempfile.mkdtemp(prefix='rsu_textureScan')
+    try:
+        shaderNames = makeTree(root, files)
+        names = [f for d in os.listdir(root) for f in os.listdir(path.join(root, d))]
+
+        def _cold():
+            index = sourceImages.SourceImagesIndex()
+            sourceImages.shaderFolders(root, index.snapshot(root, shaderNames))
+
+        index = sourceImages.SourceImagesIndex()
+        index.snapshot(root, shaderNames)
+
+        def _cached():
+            sourceImages.shaderFolders(root, index.snapshot(root, shaderNames))
+
+        bench.report(
+            'sourceImages scan: {} files, {} shader folders'.format(
+                len(names), len(shaderNames)),
+            [
+                ('listdir, every folder (legacy)', bench.timeIt(
+                    lambda: legacy.shaderFolders(root, shaderNames), repeat=repeat)),
+                ('index, cold', bench.timeIt(_cold, repeat=repeat)),
+                ('index, cached', bench.timeIt(_cached, repeat=repeat)),
+            ]
+        )
+
+        def _firstMatch():
+            for name in names:
+                [f for f in sourceImages.ATTRIBTE_TYPES
+                 if str('_' + f['attribute'].lower()) in name.lower()]
+
+        def _suffixMatch():
+            for name in names:
+                sourceImages.matchAttribute(name)
+
+        bench.report(
+            'Attribute matching: {} file names'.format(len(names)),
+            [
+                ('substring tests (legacy)', bench.timeIt(_firstMatch, repeat=repeat)),
+                ('suffix pattern', bench.timeIt(_suffixMatch, repeat=repeat)),
+            ]
+        )
+
+        # The shader folders match, the attributes differ where the first
+        # match wasn't the suffix, eg. `_kd` for `_kd_opacity`.
+        old = legacy.shaderFolders(root, shaderNames)
+        new = sourceImages.shaderFolders(root, index.snapshot(root, shaderNames))
+        changed = sum(
+            1 for d in new for f in new[d]['children']
+            if old[d]['children'].get(f, {}).get('destination')
+            != new[d]['children'][f]['destination'])
+        print('# {} of {} folders scanned, {} textures reassigned'.format(
+            len(new), len(old), changed))
+        if set(new) != shaderNames & set(old):
+            raise RuntimeError('The shader folders differ')
+    finally:
+        if temporary:
+            shutil.rmtree(root)
@@ -0,0 +1,82 @@
+"""
+Coalesces ui refresh requests.
+
+A single user action often asks for a window refresh more than once, eg.
+an action refreshing the shader list and then the overrides it changed.
+Requests made before Maya is idle are merged and the window is refreshed
+once, with the sections and shaders of every request.
+"""
+
+# pylint: disable=C0103, E0401
+
+import maya.cmds as cmds
+
+
+class RefreshScheduler(object):
+    '''
+    Runs the requested refresh stages once per idle tick.
+
+    The window registers a single stage, 'window'. Stages run in the order
+    they were added. Flags given to request() are merged, booleans or'ed
+    and collections joined into a set, and passed to every stage as
+    keyword arguments.
+
+        scheduler = RefreshScheduler()
+        scheduler.addStage('window', refreshWindow)
+        scheduler.request('window', updateRenderSetup=True)
+
+    '''
+
+    def __init__(self, defer=None):
+        self._stages = []  # (name, func)
+        self._requested = set()
+        self._flags = {}
+        self._scheduled = False
+        self._defer = defer or cmds.evalDeferred
+
+    def addStage(self, name, func):
+        """Adds a stage, run after the ones already added."""
+        self._stages.append((name, func))
+
+    def request(self, *stages, **flags):
+        """Schedules `stages` to run when Maya is idle."""
+        unknown = set(stages) - set(f[0] for f in self._stages)
+        if unknown:
+            raise ValueError('Unknown refresh stages: {}'.format(
+                ', '.join(sorted(unknown))))
+
+        self._requested.update(stages)
+        for key, value in flags.iteritems():
+            if isinstance(value, (list, tuple, set, frozenset)):
+                self._flags[key] = self._flags.get(key, set()) | set(value)
+            else:
+                self._flags[key] = self._flags.get(key, False) or value
+
+        if not self._scheduled:
+            self._scheduled = True
+            self._defer(self.flush)
+
+    def isPending(self):
+        """True if a refresh is scheduled."""
+        return self._scheduled
+
+    def cancel(self):
+        """Drops the pending requests, eg. when the window is closed."""
+        self._requested = set()
+        self._flags = {}
+
+    def flush(self):
+        """Runs the requested stages now.
+
+        Requests made by the stages themselves are scheduled for the next
+        idle tick.
+        """
+        requested = self._requested
+        flags = self._flags
+        self._requested = set()
+        self._flags = {}
+        self._scheduled = False
+
+        for name, func in self._stages:
+            if name in requested:
+                func(**flags)
@@ -8,14 +8,25 @@ with a tidy-up/re-write.
 
 import os
 import re
+import threading
 
 import maya.cmds as cmds
 import RenderSetupUtility.main.utilities as util
 
+try:
+    from os import scandir
+except ImportError:
+    try:
+        from scandir import scandir  # backport, if installed
+    except ImportError:
+        scandir = None
+
 # pylint: disable=C0103
 
 windowID = 'RenderSetupUtilityWindow'
 IMAGES = 'renders'  # renders folder TODO: this needs to exposed as a preference
+PREFETCH_VERSIONS = True  # scan the versions of every layer when the window opens
+VERSION_PATTERN = re.compile(r'^v\d{3}$')
 
 OUTPUT_TEMPLATES = (
     'Not set',
@@ -214,10 +225,87 @@ DEFAULTS_NODE = 'defaultRenderGlobals'
 RESOLUTION_NODE = 'defaultResolution'
 
 
+def _listVersions(path):
+    """Returns the version folder names in `path`, unsorted.
+
+    scandir gets the folder flag from the directory listing. Without it
+    only the names matching VERSION_PATTERN are stat'ed.
+    """
+    if scandir is not None:
+        return [f.name for f in scandir(path)
+                if VERSION_PATTERN.match(f.name) and f.is_dir()]
+    return [f for f in os.listdir(path)
+            if VERSION_PATTERN.match(f) and os.path.isdir(os.path.join(path, f))]
+
+
+class VersionIndex(object):
+    """
+    Caches the version folders of the layer output folders.
+
+    A folder is only listed again when its mtime changes, so a refresh
+    costs a single stat per layer. Folders created within the mtime
+    resolution of the file system aren't picked up: invalidate() the folder
+    after adding a version.
+    """
+
+    def __init__(self):
+        self._cache = {}  # path: (mtime, versions)
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def versions(self, path):
+        """Returns the natsorted versions in `path`, None if it doesn't exist."""
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            self.invalidate(path)
+            return None
+
+        with self._lock:
+            cached = self._cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return list(cached[1])
+
+        versions = util.natsort(_listVersions(path))
+        with self._lock:
+            self._cache[path] = (mtime, versions)
+        return list(versions)
+
+    def invalidate(self, path=None):
+        """Drops the cached versions of `path`, or of every folder."""
+        with self._lock:
+            if path is None:
+                self._cache = {}
+            else:
+                self._cache.pop(path, None)
+
+    def prefetch(self, paths):
+        """Lists `paths` in a background thread.
+
+        Missing folders are skipped. Returns the thread, or None if a
+        prefetch is still running.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return None
+
+        def _prefetch():
+            for path in paths:
+                if os.path.isdir(path):
+                    self.versions(path)
+
+        self._thread = threading.Thread(
+            target=_prefetch, name='RenderSetupUtilityVersionIndex')
+        self._thread.daemon = True
+        self._thread.start()
+        return self._thread
+
+
 class RenderOutput(object):
     """
     """
 
+    versionIndex = VersionIndex()  # shared, the window recreates RenderOutput
+
     def __init__(self):
         self.defaultTemplate = OUTPUT_TEMPLATES[1]
         self.currentTemplate = None
@@ -298,31 +386,40 @@ class RenderOutput(object):
             else:
                 return None
 
-    def getVersions(self, lyr):
-        """TODO: fix"""
+    @staticmethod
+    def versionsPath(lyr):
+        """The folder the versions of `lyr` are rendered to."""
         workspace = cmds.workspace(query=True, rootDirectory=True)
 
         if not os.path.isdir(workspace):
             raise RuntimeError('# Workspace folder does not exists.')
 
-        path = os.path.normpath(os.path.join(workspace, IMAGES, 'render', lyr))
-        if not os.path.isdir(path):
+        return os.path.normpath(os.path.join(workspace, IMAGES, 'render', lyr))
+
+    def getVersions(self, lyr):
+        path = self.versionsPath(lyr)
+        versions = self.versionIndex.versions(path)
+        if versions is None:
             print '# Unable to check for versions.\n{} does not exist.'.format(
                 path)
             return
 
-        versions = [f for f in os.listdir(path) if os.path.isdir(
-            os.path.join(path, f)) and re.match('^v\d{3}$', f)]
+        return versions
 
-        return util.natsort(versions)
+    def invalidateVersions(self, lyr=None):
+        """Rescans the versions of `lyr`, or of every layer, on next use."""
+        if lyr is None:
+            self.versionIndex.invalidate()
+        else:
+            self.versionIndex.invalidate(self.versionsPath(lyr))
 
-    def addVersionDir(self, lyr, version):
-        workspace = cmds.workspace(query=True, rootDirectory=True)
+    def prefetchVersions(self, layers):
+        """Scans the versions of `layers` in a background thread."""
+        return self.versionIndex.prefetch(
+            [self.versionsPath(f) for f in layers])
 
-        if not os.path.isdir(workspace):
-            raise RuntimeError('# Workspace folder does not exists.')
-
-        path = os.path.normpath(os.path.join(workspace, IMAGES, 'render', lyr))
+    def addVersionDir(self, lyr, version):
+        path = self.versionsPath(lyr)
         if not os.path.isdir(path):
             print '# Unable to check for versions.\n{} does not exist.'.format(path)
             return
@@ -331,6 +428,7 @@ class RenderOutput(object):
         if not os.path.exists(versionFolder):
             os.makedirs(versionFolder)
             print '{version} folder created added.'.format(version=version)
+        self.versionIndex.invalidate(path)
 
     def setStartFrame(self, frame=1):
         frame = round(frame, 0)
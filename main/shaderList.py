@@ -0,0 +1,223 @@
+"""
+Builds the shader list shown by the Render Setup Utility window.
+
+Nothing in here touches the ui, so the list can be built, and timed,
+without the window (see ``bench.suite``).
+"""
+
+# pylint: disable=C0103, E0401
+
+import maya.cmds as cmds
+
+import RenderSetupUtility.main.utilities as util
+from RenderSetupUtility.main.shaderUtility import SHADER_OVERRIDE_OPTIONS
+from RenderSetupUtility.main.utility import COLLECTION_SUFFIX
+
+ACTIVEITEM_PREFIX = ' '
+
+# The group filters of the filter field and the data key they test
+FILTER_GROUPS = {
+    '<Lights>': 'light',
+    '<Environment>': 'environment',
+    '<Shaders>': 'shader',
+    '<StandIns>': 'standIn',
+}
+
+# Order the override attributes are listed in the custom string
+CUSTOMSTRING_ATTRIBUTES = (5, 0, 1, 2, 3, 4, 6, 7, 8, 9, 10)
+
+
+def hasShaderOverride(rsUtility, shaderUtility, shaderName):
+    """True if the collection of `shaderName` has a shader override."""
+    c = rsUtility.collection(shaderName.replace(':', '_'), isQuery=True)
+
+    if c.hasChildren():
+        pass
+    else:
+        return False
+
+    for child in c.getChildren():
+        if child.typeName() == 'collection' \
+            and '{0}{1}'.format(shaderName.replace(':', '_'),
+                                COLLECTION_SUFFIX) in child.name():
+            for o in child.getOverrides():
+                if o.typeName() == 'shaderOverride':
+                    cnxs = cmds.listConnections(o.name())
+
+                    overrideShader = [cnx for cnx in cnxs
+                                      if '_collection' not in cnx and '_msg'
+                                      not in cnx]
+                    if overrideShader:
+                        pass
+                    else:
+                        return False
+
+                    shaderName = \
+                        shaderUtility.stripSuffix(overrideShader[0])
+                    overrideShader = overrideShader[0]
+                    if [s for s in SHADER_OVERRIDE_OPTIONS if s['suffix'
+                                                                ] in overrideShader]:
+                        return True
+    return False
+
+
+def _spacer(inString):
+    num = int(30 - len(inString))
+    if num > 0:
+
+        # return util.addChars(' ', num)
+
+        return '   '
+    else:
+        return ' '
+
+
+class Row(object):
+    """What the list delegate paints for a shader, worked out once per
+    refresh so painting doesn't parse the custom string.
+
+    label is the type and override string drawn right aligned.
+    """
+
+    __slots__ = ('customString', 'shaderName', 'shortName', 'nameSpace',
+                 'type', 'active', 'environment', 'light', 'warning',
+                 'shaderOverride', 'mask', 'label')
+
+    def __init__(self, customString, shaderName, record, active=False,
+                 overrides='', warning=False, shaderOverride=False):
+        self.customString = customString
+        self.shaderName = shaderName
+        self.shortName = shaderName.split(':')[-1]
+        self.nameSpace = record['nameSpace']
+        self.type = record['type']
+        self.active = active
+        self.environment = record['environment']
+        self.light = record['light']
+        self.warning = warning
+        self.shaderOverride = shaderOverride
+        self.mask = 'M-' in overrides
+        self.label = '{0}-{1}{2}'.format(
+            self.type, overrides, len(record['usedBy']))
+
+
+def buildRow(rsUtility, shaderUtility, shaderName):
+    """Sets the customString of `shaderName` and returns its Row.
+
+    The custom string is the list item of the shader. Items of shaders with
+    a collection in the active layer are active, they are prefixed and
+    list the override values.
+    """
+    record = shaderUtility.data[shaderName]
+    c = rsUtility.activeLayer.collection(
+        shaderName.replace(':', '_'), isQuery=True)
+
+    # Mark item as inactive if not in the collections list
+
+    if c is None:
+        count = '(%s)' % len(record['usedBy'])
+        record['customString'] = '%s %s' % (shaderName, count)
+        shaderUtility.registerCustomString(
+            record['customString'], shaderName, count, False)
+        return Row(record['customString'], shaderName, record)
+
+    # Mark item as active if in the collections list
+
+    # Get current override values
+
+    values = c.getOverrideValues()
+    for (index, item) in \
+            enumerate(rsUtility.overrideAttributes):
+        rsUtility.overrideAttributes[index][item['default'
+                                                 ]] = values.get(item['long'])
+
+    def _get(item):
+        val = values.get(item['long'])
+        if val is None:
+            return ''
+        else:
+            return item['custom'][1 - val]
+
+    overrides = ''.join(_get(rsUtility.overrideAttributes[i])
+                        for i in CUSTOMSTRING_ATTRIBUTES)
+
+    # Add warning if usedBy doesn't match collection selection
+
+    warning = c.selection.asList() != list(record['usedBy'])
+    shaderOverride = hasShaderOverride(
+        rsUtility, shaderUtility, shaderName)
+
+    properties = ''.join((
+        overrides,
+        str(len(record['usedBy'])),
+        '!!' if warning else '',
+        '#' if shaderOverride else '',
+    ))
+    record['customString'] = ''.join((
+        ACTIVEITEM_PREFIX,
+        shaderName,
+        _spacer(ACTIVEITEM_PREFIX + shaderName),
+        properties,
+    ))
+    shaderUtility.registerCustomString(
+        record['customString'], shaderName, properties, True)
+    return Row(record['customString'], shaderName, record,
+               active=True, overrides=overrides, warning=warning,
+               shaderOverride=shaderOverride)
+
+
+def setCustomStrings(rsUtility, shaderUtility):
+    """Sets the customString of every shader in shaderUtility.data.
+
+    Returns a Row per shader, in data order.
+    """
+    shaderUtility.resetCustomStrings()
+    return [buildRow(rsUtility, shaderUtility, f)
+            for f in shaderUtility.data.keys()]
+
+
+def filterList(shaderUtility, rows, filterText):
+    """Returns the rows matching the text of the filter field.
+
+    `filterText` is either one of FILTER_GROUPS or a case-insensitive
+    substring of the custom string.
+    """
+    if filterText not in FILTER_GROUPS:
+        text = filterText.lower()
+        return [f for f in rows if text in f.customString.lower()]
+
+    key = FILTER_GROUPS[filterText]
+    return [f for f in rows if shaderUtility.data[f.shaderName][key]]
+
+
+class ShaderRows(object):
+    """The rows of the shader list, in display order.
+
+    items are the custom strings of the rows and names the shader name of
+    each row; indexing returns the Row. shaderNames holds every shader,
+    listed or filtered out.
+    """
+
+    __slots__ = ('items', 'names', 'shaderNames', '_rowList')
+
+    def __init__(self, rows, shaderNames):
+        self._rowList = rows
+        self.items = [f.customString for f in rows]
+        self.names = [f.shaderName for f in rows]
+        self.shaderNames = shaderNames
+
+    def __len__(self):
+        return len(self._rowList)
+
+    def __getitem__(self, index):
+        return self._rowList[index]
+
+
+def buildRows(rsUtility, shaderUtility, filterText=''):
+    """Returns the ShaderRows to list for the active layer and filter."""
+    rows = setCustomStrings(rsUtility, shaderUtility)
+    filtered = dict((f.customString, f)
+                    for f in filterList(shaderUtility, rows, filterText))
+    return ShaderRows(
+        [filtered[f] for f in util.natsort(filtered.keys(), filterOn=True, cache=True)],
+        [f.shaderName for f in rows])
+
@@ -6,6 +6,7 @@ used in the current maya scene.
 
 # pylint: disable=C0103, E0401
 
+import collections
 import re
 import maya.api.OpenMaya as OpenMaya
 import maya.cmds as cmds
@@ -180,6 +181,128 @@ LIGHT_NODES = (
     'areaLight'
 )
 
+# Node types collected by the non-shader passes of ShaderUtility.update()
+SCENE_NODES = frozenset(ENVIRONMENT_NODES + LIGHT_NODES + ('aiStandIn',))
+
+# Number of update() results kept for ShaderUtility.changesSince()
+CHANGE_LOG_SIZE = 64
+
+# Custom strings of active items, ' name   properties', then inactive items,
+# 'name (count)'. The alternatives are tried in order, in one pass.
+CUSTOMSTRING_PATTERN = re.compile(
+    r'(.*\s+)([a-zA-Z0-9_:]+)(\s+)(.*)|([a-zA-Z0-9_:]+)(\s+)(.*)')
+
+# Reloading the module leaves the callbacks of the previous instance
+# registered
+_previous = globals().get('ShaderUtility')
+if _previous is not None and _previous._instance is not None:  # pylint: disable=W0212
+    _previous._instance.removeCallbacks()  # pylint: disable=W0212
+del _previous
+
+
+class ShaderRecord(object):
+    """
+    A single entry of ShaderUtility.data.
+
+    Replaces the 12-key dict each entry used to be. The keys are still
+    readable (and writable) with the dict syntax, eg. record['usedBy'],
+    so the ui code doesn't need to change.
+
+    'usedBy' is a tuple of paths shared with ShaderUtility's string table
+    and 'count' is derived from it.
+    """
+
+    __slots__ = (
+        'name',
+        'nameSpace',
+        'type',
+        'usedBy',
+        'shadingGroup',
+        'customString',
+        'shader',
+        'environment',
+        'standIn',
+        'light',
+        'autoConnect'
+    )
+
+    KEYS = (
+        'name',
+        'nameSpace',
+        'type',
+        'usedBy',
+        'count',
+        'shadingGroup',
+        'customString',
+        'shader',
+        'environment',
+        'standIn',
+        'light',
+        'autoConnect'
+    )
+
+    def __init__(self, name, nameSpace, type, usedBy, shadingGroup,  # pylint: disable=W0622
+                 customString='', shader=False, environment=False,
+                 standIn=False, light=False, autoConnect=False):
+        self.name = name
+        self.nameSpace = nameSpace
+        self.type = type
+        self.usedBy = tuple(usedBy)
+        self.shadingGroup = shadingGroup
+        self.customString = customString
+        self.shader = shader
+        self.environment = environment
+        self.standIn = standIn
+        self.light = light
+        self.autoConnect = autoConnect
+
+    @property
+    def count(self):
+        """The number of shapes the shader is assigned to."""
+        return len(self.usedBy)
+
+    def __getitem__(self, key):
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key == 'count' or key not in self.KEYS:
+            raise KeyError(key)
+        if key == 'usedBy':
+            value = tuple(value)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self.KEYS
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self):
+        return len(self.KEYS)
+
+    def __repr__(self):
+        return '<ShaderRecord %s>' % self.name
+
+    def get(self, key, default=None):
+        """dict.get()"""
+        if key not in self.KEYS:
+            return default
+        return getattr(self, key)
+
+    def keys(self):
+        """dict.keys()"""
+        return list(self.KEYS)
+
+    def items(self):
+        """dict.items()"""
+        return [(k, getattr(self, k)) for k in self.KEYS]
+
+    def asDict(self):
+        """Returns the record as the dict ShaderUtility.data used to hold."""
+        return dict(self.items())
+
 
 class ShaderUtility(object):
     '''
@@ -190,6 +313,11 @@ class ShaderUtility(object):
         Provides utility methods for duplicating shaders.
 
         update() - Resets the 'data' dict.
+        addCallbacks() - Tracks scene changes so update() only rescans
+        the shading engines and nodes that changed.
+        revision - Incremented by every update(). Views that update
+        incrementally keep the revision they last read and pass it to
+        changesSince().
     '''
 
     _instance = None
@@ -208,201 +336,441 @@ class ShaderUtility(object):
             if self.__initialized__:
                 return
         self.data = {}
+        self._strings = {}  # shared copies of paths, namespaces and types
+
+        # Incremental update state
+        self._callbacks = []
+        self._isValid = False  # False forces a full rescan
+        self._engines = {}  # engine hash: (MObjectHandle, [shader names])
+        self._owners = {}  # shader name: set of engine hashes writing it
+        self._dirty = {}  # engine hash: MObjectHandle
+        self._dirtyScene = False  # lights, environments and standins
+        self._sceneNames = set()  # data keys of lights, environments and standins
+
+        # (added, removed, changed) shader names of the last updates, None
+        # for a full rescan
+        self.revision = 0
+        self._changeLog = collections.deque(maxlen=CHANGE_LOG_SIZE)
+
         self.shaderList = self.getShaderList(excludeOverrides=True)
         self.overrides = None
         self.autoConnectShaders = None
         self.update()
 
-    def _setShadersToData(self):
-        """Collects scene shaders."""
-        # iterate over shading engines
-        for shEngine in cmds.ls(type='shadingEngine'):
-            if cmds.sets(shEngine, q=True) is None:
+    def _intern(self, string):
+        """Returns the shared copy of `string`.
+
+        Paths, namespaces and node types repeat across records; keeping a
+        single copy of each keeps ShaderUtility.data small on big scenes.
+        """
+        return self._strings.setdefault(string, string)
+
+    @staticmethod
+    def _getSetMembers(shadingEngine):
+        """Returns the long names of the members of a shading engine.
+
+        Component assignments are returned in the same form as
+        ``cmds.ls(member, long=True)``, eg. '|pCube1|pCubeShape1.f[0:5]'.
+        """
+        members = OpenMaya.MFnSet(shadingEngine).getMembers(False)
+
+        names = []
+        for i in xrange(members.length()):
+            try:
+                dagPath, component = members.getComponent(i)
+            except (TypeError, RuntimeError):  # not a dag member
+                names.append(
+                    OpenMaya.MFnDependencyNode(members.getDependNode(i)).name()
+                )
                 continue
 
-            shaderName = None
-            for connection in [x for x in cmds.listConnections(shEngine)]:
-                if [f for f in SHADER_NODES if f in cmds.nodeType(connection, i=True)]:
-                    if cmds.objectType(connection) not in SHADER_TYPES:
-                        continue
-
-                    # Check for namespace:
-                    split = self.stripSuffix(connection).split(':')
-                    if len(split) == 1:  # no namespace
-                        shaderName = split[0]
-                        nameSpace = ''
-                    if len(split) > 1:
-                        shaderName = self.stripSuffix(
-                            connection).split(':')[-1]
-                        nameSpace = self.stripSuffix(
-                            connection).split(':')[0]
-                    if len(nameSpace) >= 1:
-                        shaderName = '%s:%s' % (nameSpace, shaderName)
-
-                    self.data[shaderName] = {
-                        'name': shaderName,
-                        'nameSpace': nameSpace,
-                        'type': cmds.objectType(connection),
-                        'usedBy': [],
-                        'count': 0,
-                        'shadingGroup': shEngine,
-                        'customString': '',
-                        'shader': True,
-                        'environment': False,
-                        'standIn': False,
-                        'light': False,
-                        'autoConnect': False
-                    }
-
-                    for sh_connection in cmds.sets(shEngine, q=True):
-                        if not cmds.ls(sh_connection, long=True):
-                            continue
-                        self.data[shaderName]['usedBy'].append(
-                            cmds.ls(sh_connection, long=True)[0]
-                        )
-                        self.data[shaderName]['count'] = len(
-                            self.data[shaderName]['usedBy']
-                        )
-
-    def _setEnvironmentsToData(self):
-        """ Collects scene environments
+            fullPathName = dagPath.fullPathName()
+            if component.isNull():
+                names.append(fullPathName)
+                continue
+            for string in members.getSelectionStrings(i):
+                names.append(fullPathName + string[string.find('.'):])
+        return names
+
+    @staticmethod
+    def _getConnectedShaders(shadingEngine):
+        """Returns the shader nodes connected to a shading engine.
+
+        Every SHADER_TYPES node is a shadingDependNode or THdependNode,
+        so matching the type name is enough to filter the connections.
         """
+        shaders = []
+        seen = set()
+        fnEngine = OpenMaya.MFnDependencyNode(shadingEngine)
+        for plug in fnEngine.getConnections():
+            for other in plug.connectedTo(True, True):
+                node = other.node()
+                handle = OpenMaya.MObjectHandle(node).hashCode()
+                if handle in seen:
+                    continue
+                seen.add(handle)
+                fnNode = OpenMaya.MFnDependencyNode(node)
+                if fnNode.typeName not in SHADER_TYPES:
+                    continue
+                shaders.append((fnNode.name(), fnNode.typeName))
+        return shaders
 
-        shapes = cmds.ls(dagObjects=True, shapes=True, long=True)
-        for item in [f for f in shapes if cmds.nodeType(f) in ENVIRONMENT_NODES]:
-            # Checking for namespace:
-            split = str(item).split('|')[-1].split(':')
-            if len(split) == 1:  # no namespace
-                shaderName = split[0]
-                nameSpace = ''
-            if len(split) > 1:
-                nameSpace = shaderName = str(item).split('|')[-1].split(':')[0]
-                shaderName = shaderName = str(
-                    item).split('|')[-1].split(':')[-1]
-            if len(nameSpace) >= 1:
-                shaderName = '%s:%s' % (nameSpace, shaderName)
+    def _setShadersToData(self):
+        """Collects scene shaders.
 
-            self.data[shaderName] = {
-                'name': shaderName,
-                'nameSpace': nameSpace,
-                'type': cmds.nodeType(item),
-                'usedBy': [cmds.ls(shaderName, long=True)[0]],
-                'count': 1,
-                'shadingGroup': 'renderSettings',
-                'customString': '%s (1)' % shaderName,
-                'shader': False,
-                'environment': True,
-                'standIn': False,
-                'light': False,
-                'autoConnect': False
-            }
-
-    def _setStandinsToData(self):
-        """ Collects scene environments
+        The shading engines are walked once with the OpenMaya iterators;
+        no cmds calls are made per engine or member.
         """
-        # StandIns
-        for item in cmds.ls(type='aiStandIn'):
+        self._engines = {}
+        self._owners = {}
 
-            # Checking for namespace:
-            split = str(item).split('|')[-1].split(':')
-            if len(split) == 1:  # no namespace
-                shaderName = split[0]
-                nameSpace = ''
-            if len(split) > 1:
-                nameSpace = shaderName = str(item).split('|')[-1].split(':')[0]
-                shaderName = shaderName = str(
-                    item).split('|')[-1].split(':')[-1]
+        it = OpenMaya.MItDependencyNodes(OpenMaya.MFn.kShadingEngine)
+        while not it.isDone():
+            self._setEngineToData(it.thisNode())
+            it.next()
+
+    def _setEngineToData(self, node, touched=None):
+        """Collects the shaders of a single shading engine.
+
+        touched: a dict the names written are added to, with whether they
+        were in self.data before.
+        """
+        handle = OpenMaya.MObjectHandle(node)
+        key = handle.hashCode()
+        names = []
+        self._engines[key] = (handle, names)
+
+        usedBy = self._getSetMembers(node)
+        if not usedBy:
+            return
+        usedBy = tuple(self._intern(f) for f in usedBy)
+        shEngine = OpenMaya.MFnDependencyNode(node).name()
+
+        for connection, shaderType in self._getConnectedShaders(node):
+            # Check for namespace:
+            split = self.stripSuffix(connection).split(':')
+            shaderName = split[-1]
+            nameSpace = split[0] if len(split) > 1 else ''
             if len(nameSpace) >= 1:
                 shaderName = '%s:%s' % (nameSpace, shaderName)
 
-            self.data[shaderName] = {
-                'name': shaderName,
-                'nameSpace': nameSpace,
-                'type': cmds.nodeType(item),
-                'usedBy': [cmds.ls(shaderName, long=True)[0]],
-                'count': 1,
-                'shadingGroup': 'renderSettings',
-                'customString': '%s (1)' % shaderName,
-                'shader': False,
-                'environment': False,
-                'standIn': True,
-                'light': False,
-                'autoConnect': False
-            }
-
-    def _setLightsToData(self):
-        """ Collects scene environments
+            if touched is not None:
+                touched.setdefault(shaderName, shaderName in self.data)
+            self.data[shaderName] = ShaderRecord(
+                shaderName,
+                self._intern(nameSpace),
+                self._intern(shaderType),
+                usedBy,
+                shEngine,
+                shader=True
+            )
+            names.append(shaderName)
+            self._owners.setdefault(shaderName, set()).add(key)
+
+    def _removeEngineFromData(self, key, touched):
+        """Removes the entries written by a shading engine, adding their
+        names to `touched`.
+
+        Returns the hashes of other engines that wrote the same shader names;
+        they have to be rescanned to restore their entries.
         """
+        rescan = set()
+        _, names = self._engines.pop(key, (None, ()))
+        for shaderName in names:
+            if self.data.pop(shaderName, None) is not None:
+                touched.setdefault(shaderName, True)
+            owners = self._owners.get(shaderName, set())
+            owners.discard(key)
+            if not owners:
+                self._owners.pop(shaderName, None)
+            rescan.update(owners)
+        return rescan
+
+    def _setSceneNodesToData(self, touched=None):
+        """Collects scene environments, standins and lights.
+
+        A single typed query lists every candidate shape with its type,
+        rather than listing all shapes and querying the type of each.
+        """
+        self._sceneNames = set()
+        nodeTypes = set(cmds.allNodeTypes())
+        types = [f for f in SCENE_NODES if f in nodeTypes]
+        if not types:
+            return
 
-        shapes = cmds.ls(dagObjects=True, shapes=True, long=True)
-        # Lights
-        for item in [f for f in shapes if cmds.nodeType(f) in LIGHT_NODES]:
-
+        result = cmds.ls(type=types, shapes=True, long=True, showType=True)
+        result = result or []
+        for item, nodeType in zip(result[0::2], result[1::2]):
             # Checking for namespace:
-            split = str(item).split('|')[-1].split(':')
-            if len(split) == 1:  # no namespace
-                shaderName = split[0]
-                nameSpace = ''
-            if len(split) > 1:
-                nameSpace = shaderName = str(item).split('|')[-1].split(':')[0]
-                shaderName = shaderName = str(
-                    item).split('|')[-1].split(':')[-1]
+            split = item.split('|')[-1].split(':')
+            shaderName = split[-1]
+            nameSpace = split[0] if len(split) > 1 else ''
             if len(nameSpace) >= 1:
                 shaderName = '%s:%s' % (nameSpace, shaderName)
 
-            self.data[shaderName] = {
-                'name': shaderName,
-                'nameSpace': nameSpace,
-                'type': cmds.nodeType(item),
-                'usedBy': [cmds.ls(shaderName, long=True)[0]],
-                'count': 1,
-                'shadingGroup': 'renderSettings',
-                'customString': '%s (1)' % shaderName,
-                'shader': False,
-                'environment': False,
-                'standIn': False,
-                'light': True,
-                'autoConnect': False
-            }
+            # aiSky and aiSkyDomeLight are both, lights take precedence
+            light = nodeType in LIGHT_NODES
+            environment = not light and nodeType in ENVIRONMENT_NODES
+
+            if touched is not None:
+                touched.setdefault(shaderName, shaderName in self.data)
+            self._sceneNames.add(shaderName)
+            self.data[shaderName] = ShaderRecord(
+                shaderName,
+                self._intern(nameSpace),
+                self._intern(nodeType),
+                (self._intern(item),),
+                'renderSettings',
+                customString='%s (1)' % shaderName,
+                environment=environment,
+                standIn=not light and not environment,
+                light=light
+            )
 
     def update(self):
-        """Populate self.data."""
-        self.data = {}
-        self._setShadersToData()
-        self._setEnvironmentsToData()
-        self._setStandinsToData()
-        self._setLightsToData()
+        """Populate self.data.
 
-    @staticmethod
-    def customStringToShaderName(string, properties=False):
-        """ Get the shader's name from a custom string
+        When the scene callbacks are active only the shading engines and
+        nodes that changed since the last call are rescanned.
         """
-        m = re.match(r'(.*\s+)([a-zA-Z0-9_:]+)(\s+)(.*)', string)
-        if m is None:
-            m = re.match(r'([a-zA-Z0-9_:]+)(\s+)(.*)', string)
-            if m is None:
-                print '# Couldn\'t get shader name from custom string.'
-                return None
-            if properties:
-                return m.group(3)
-            return m.group(1)
+        if self._callbacks and self._isValid:
+            changes = self._flush()
         else:
-            if properties:
-                return m.group(4)
-            return m.group(2)
+            changes = None
+            self.data = {}
+            self._strings = {}
+            self._dirty = {}
+            self._dirtyScene = False
+            self._setShadersToData()
+            self._setSceneNodesToData()
+            self._isValid = True
+
+        self.revision += 1
+        self._changeLog.append((self.revision, changes))
+
+    def changesSince(self, revision):
+        """Returns the (added, removed, changed) shader names since the
+        update() that set `revision`.
+
+        Returns None when they aren't known, after a full rescan or more
+        than CHANGE_LOG_SIZE updates ago; the caller reads self.data again.
+        """
+        if revision == self.revision:
+            return [], [], []
+        entries = [f for r, f in self._changeLog if r > revision]
+        if len(entries) != self.revision - revision or None in entries:
+            return None
 
-    @staticmethod
-    def isActive(string):
-        """ Check if the shader is active
+        existed = {}  # shader name: in self.data at `revision`
+        exists = {}
+        for added, removed, changed in entries:
+            for shaderName in added:
+                existed.setdefault(shaderName, False)
+                exists[shaderName] = True
+            for shaderName in removed:
+                existed.setdefault(shaderName, True)
+                exists[shaderName] = False
+            for shaderName in changed:
+                existed.setdefault(shaderName, True)
+                exists[shaderName] = True
+
+        added, removed, changed = [], [], []
+        for shaderName, before in existed.iteritems():
+            if not exists[shaderName]:
+                if before:
+                    removed.append(shaderName)
+            elif before:
+                changed.append(shaderName)
+            else:
+                added.append(shaderName)
+        return added, removed, changed
+
+    def _flush(self):
+        """Applies the pending changes to self.data.
+
+        Returns the (added, removed, changed) shader names. Rescanned entries
+        are new records, so every name rewritten counts as changed.
         """
-        m = re.match(r'(.*\s+)([a-zA-Z0-9_:]+)(\s+)(.*)', string)
+        pending = self._dirty
+        self._dirty = {}
+        touched = {}  # shader name: in self.data before the flush
+
+        queue = list(pending)
+        while queue:
+            for key in self._removeEngineFromData(queue.pop(), touched):
+                if key in pending:
+                    continue
+                pending[key] = self._engines[key][0]
+                queue.append(key)
+
+        for handle in pending.values():
+            if handle.isValid():
+                self._setEngineToData(handle.object(), touched)
+
+        if self._dirtyScene:
+            self._dirtyScene = False
+            for shaderName in self._sceneNames:
+                if self.data.pop(shaderName, None) is not None:
+                    touched.setdefault(shaderName, True)
+            self._setSceneNodesToData(touched)
+
+        added, removed, changed = [], [], []
+        for shaderName, existed in touched.iteritems():
+            if shaderName not in self.data:
+                if existed:
+                    removed.append(shaderName)
+            elif existed:
+                changed.append(shaderName)
+            else:
+                added.append(shaderName)
+        return added, removed, changed
+
+    # Scene callbacks
+
+    def addCallbacks(self):
+        """Registers the callbacks used to track scene changes."""
+        if self._callbacks:
+            return
+
+        self._callbacks.append(OpenMaya.MDGMessage.addNodeAddedCallback(
+            self._cbNodeAdded, 'dependNode'))
+        self._callbacks.append(OpenMaya.MDGMessage.addNodeRemovedCallback(
+            self._cbNodeRemoved, 'dependNode'))
+        self._callbacks.append(OpenMaya.MDGMessage.addConnectionCallback(
+            self._cbConnection))
+        self._callbacks.append(OpenMaya.MNodeMessage.addNameChangedCallback(
+            OpenMaya.MObject.kNullObj, self._cbNameChanged))
+
+        # Grouping or parenting changes the paths of the members
+        self._callbacks.append(OpenMaya.MDagMessage.addParentAddedCallback(
+            self._cbParentChanged))
+        self._callbacks.append(OpenMaya.MDagMessage.addParentRemovedCallback(
+            self._cbParentChanged))
+
+        # Bulk changes are cheaper to rescan than to track node by node
+        for message in (
+                OpenMaya.MSceneMessage.kBeforeNew,
+                OpenMaya.MSceneMessage.kBeforeOpen,
+                OpenMaya.MSceneMessage.kBeforeImport,
+                OpenMaya.MSceneMessage.kBeforeReference,
+                OpenMaya.MSceneMessage.kBeforeRemoveReference,
+        ):
+            self._callbacks.append(OpenMaya.MSceneMessage.addCallback(
+                message, self._cbInvalidate))
+
+        self._isValid = False
+
+    def removeCallbacks(self):
+        """Removes the scene callbacks. update() will rescan the scene."""
+        if self._callbacks:
+            OpenMaya.MMessage.removeCallbacks(self._callbacks)
+        self._callbacks = []
+        self._isValid = False
+
+    def _setEngineDirty(self, node):
+        handle = OpenMaya.MObjectHandle(node)
+        self._dirty[handle.hashCode()] = handle
+
+    def _setConnectedEnginesDirty(self, node):
+        """Marks the shading engines a node, or any of its dag children,
+        is connected to."""
+        nodes = [node]
+        while nodes:
+            node = nodes.pop()
+            for plug in OpenMaya.MFnDependencyNode(node).getConnections():
+                for other in plug.connectedTo(True, True):
+                    if other.node().hasFn(OpenMaya.MFn.kShadingEngine):
+                        self._setEngineDirty(other.node())
+            if node.hasFn(OpenMaya.MFn.kDagNode):
+                fnDagNode = OpenMaya.MFnDagNode(node)
+                nodes += [fnDagNode.child(i)
+                          for i in xrange(fnDagNode.childCount())]
+
+    def _setNodeDirty(self, node, connected=False):
+        if node.hasFn(OpenMaya.MFn.kShadingEngine):
+            self._setEngineDirty(node)
+        elif OpenMaya.MFnDependencyNode(node).typeName in SCENE_NODES:
+            self._dirtyScene = True
+        elif connected:
+            self._setConnectedEnginesDirty(node)
+
+    def _cbNodeAdded(self, node, clientData=None):
+        if self._isValid:
+            self._setNodeDirty(node)
+
+    def _cbNodeRemoved(self, node, clientData=None):
+        if self._isValid:
+            self._setNodeDirty(node, connected=True)
+
+    def _cbNameChanged(self, node, prevName, clientData=None):
+        if self._isValid:
+            self._setNodeDirty(node, connected=True)
+
+    def _cbParentChanged(self, child, parent, clientData=None):
+        if self._isValid:
+            self._setConnectedEnginesDirty(child.node())
+
+    def _cbConnection(self, srcPlug, destPlug, made, clientData=None):
+        if not self._isValid:
+            return
+        for plug in (srcPlug, destPlug):
+            if plug.node().hasFn(OpenMaya.MFn.kShadingEngine):
+                self._setEngineDirty(plug.node())
+
+    def _cbInvalidate(self, clientData=None):
+        self._isValid = False
+        self._dirty = {}
+
+    # Custom strings
+
+    _customStrings = {}  # custom string: (shader name, properties, active)
+
+    @classmethod
+    def resetCustomStrings(cls):
+        """Empties the custom string table, eg. when the list is rebuilt."""
+        cls._customStrings = {}
+
+    @classmethod
+    def registerCustomString(cls, string, shaderName, properties, active):
+        """Records what `string` parses to, so it is looked up instead."""
+        cls._customStrings[string] = (shaderName, properties, active)
+
+    @classmethod
+    def _parseCustomString(cls, string):
+        """Returns (shader name, properties, active) or None."""
+        parsed = cls._customStrings.get(string)
+        if parsed is not None:
+            return parsed
+        m = CUSTOMSTRING_PATTERN.match(string)
         if m is None:
-            m = re.match(r'([a-zA-Z0-9_:]+)(\s+)(.*)', string)
-            if m is None:
-                return None
-            return False
+            return None
+        if m.group(2) is not None:
+            parsed = (m.group(2), m.group(4), True)
         else:
-            return True
+            parsed = (m.group(5), m.group(7), False)
+        cls._customStrings[string] = parsed
+        return parsed
+
+    @classmethod
+    def customStringToShaderName(cls, string, properties=False):
+        """ Get the shader's name from a custom string
+        """
+        parsed = cls._parseCustomString(string)
+        if parsed is None:
+            print '# Couldn\'t get shader name from custom string.'
+            return None
+        if properties:
+            return parsed[1]
+        return parsed[0]
+
+    @classmethod
+    def isActive(cls, string):
+        """ Check if the shader is active
+        """
+        parsed = cls._parseCustomString(string)
+        if parsed is None:
+            return None
+        return parsed[2]
 
     @staticmethod
     def _getConnectedInputConnections(shaderName):
@@ -0,0 +1,455 @@
+"""
+The model of the shader list of the Render Setup Utility window.
+
+The model lists the rows of ``shaderList``, sorted as buildRows() sorts
+them, active shaders first, optionally grouped by the `prefix_suffix` naming convention used by
+ShaderUtility.getShaderGroups. refresh() applies the difference to the
+listed rows as row inserts, removals and dataChanged signals, so views
+keep their scroll position and selection and only the changed rows are
+repainted. The model reads the ShaderUtility changes since the revision
+it last applied, so other callers of ShaderUtility.update() don't take
+them from it.
+
+    SHADER_ROLE  the ShaderRecord of a shader
+    ROW_ROLE     the shaderList.Row of a shader, what the delegate paints
+
+"""
+
+# pylint: disable=C0103, E0401
+
+import bisect
+
+from PySide2 import QtCore
+
+import RenderSetupUtility.main.shaderList as shaderList
+import RenderSetupUtility.main.utilities as util
+import RenderSetupUtility.main.utility as utility
+from RenderSetupUtility.main.shaderUtility import ShaderUtility
+
+SHADER_ROLE = QtCore.Qt.UserRole + 1
+ROW_ROLE = QtCore.Qt.UserRole + 2
+
+
+def rowKey(row):
+    """The sort key of a Row: active shaders first, then natural order
+    of the custom string, as in shaderList.buildRows."""
+    return (0 if row.active else 1, util.natsortKey(row.customString))
+
+
+def rowState(row):
+    """What the delegate paints of a Row, to tell if it changed."""
+    return tuple(getattr(row, f) for f in shaderList.Row.__slots__)
+
+
+class Node(object):
+    """Class for displaying and navigating information in a tree hierarchy.
+
+    Children are kept sorted by their key and know their row, so finding
+    the row of a node is O(1).
+
+    """
+
+    def __init__(self, name, parentNode=None, key=None):
+        """__init__ method.
+
+        Attributes:
+            name (str): The name of the shader or group.
+            parentNode (Node): the parent of this node.
+            key (tuple): the sort key among the siblings.
+
+        """
+        super(Node, self).__init__()
+        self._name = name
+        self._key = key if key is not None else util.natsortKey(name)
+        self._children = []
+        self._keys = []  # sort keys of the children
+        self._parentNode = None
+        self._row = None
+
+        if parentNode:
+            parentNode.addChild(self)
+
+    @property
+    def name(self):
+        """The name of this node."""
+        return self._name
+
+    @property
+    def key(self):
+        """The sort key of this node."""
+        return self._key
+
+    def removeSelf(self):
+        """Removes itself from the parent's children."""
+        if self.parentNode:
+            self.parentNode.removeChild(self)
+
+    def insertRow(self, child):
+        """Returns the row `child` would be inserted at."""
+        return bisect.bisect_right(self._keys, child.key)
+
+    def removeChild(self, child):
+        """Remove the given node from the children."""
+        if child.parentNode is not self:
+            return
+        row = child.row
+        del self._children[row]
+        del self._keys[row]
+        for sibling in self._children[row:]:
+            sibling._row -= 1
+        child._parentNode = None
+        child._row = None
+
+    def setChildren(self, children):
+        """Replaces the children, sorting them once."""
+        self._children = sorted(children, key=lambda f: f.key)
+        self._keys = [f.key for f in self._children]
+        for row, child in enumerate(self._children):
+            child._parentNode = self
+            child._row = row
+
+    def addChild(self, child):
+        """Add a child node at its sorted row."""
+        row = self.insertRow(child)
+        self._children.insert(row, child)
+        self._keys.insert(row, child.key)
+        for sibling in self._children[row + 1:]:
+            sibling._row += 1
+        child._parentNode = self
+        child._row = row
+
+    @property
+    def children(self):
+        """Children of the node."""
+        return self._children
+
+    @property
+    def childCount(self):
+        """Children of the this node."""
+        return len(self._children)
+
+    @property
+    def parentNode(self):
+        """Parent of this node."""
+        return self._parentNode
+
+    def getChild(self, row):
+        """Child at the provided index/row."""
+        if 0 <= row < self.childCount:
+            return self._children[row]
+        return None
+
+    @property
+    def row(self):
+        """Row number of this node."""
+        return self._row
+
+    @property
+    def nodeType(self):
+        """Class name."""
+        return self.__class__.__name__
+
+
+class GroupNode(Node):
+    """The shaders sharing a name prefix, listed before the shaders."""
+
+    def __init__(self, name, parentNode=None):
+        super(GroupNode, self).__init__(
+            name, parentNode=parentNode, key=(-1, util.natsortKey(name)))
+
+
+class ShaderNode(Node):
+    """A listed shader and its shaderList.Row."""
+
+    def __init__(self, row, parentNode=None):
+        super(ShaderNode, self).__init__(
+            row.shaderName, parentNode=parentNode, key=rowKey(row))
+        self.item = row
+
+
+class ShadersModel(QtCore.QAbstractItemModel):
+    """Single-column model of the shader list rows.
+
+    The model starts empty, call refresh() to bring it up to date with
+    the scene and the active layer. Only the shaders matching the filter,
+    see setFilter(), are listed. With `grouped` shaders named
+    `prefix_suffix` are listed under a `prefix` group.
+    """
+
+    COLUMN_COUNT = 1
+    RESET_THRESHOLD = 500  # added and removed rows above which refresh() resets
+
+    def __init__(self, rsUtility=None, parent=None, grouped=False):
+        super(ShadersModel, self).__init__(parent=parent)
+        self._rootNode = Node('rootNode')
+        self._grouped = grouped
+        self._filterText = ''
+        self._nodes = {}  # shader name: ShaderNode
+        self._groups = {}  # prefix: GroupNode
+
+        self.rsUtility = rsUtility or utility.Utility()
+
+        # Without the callbacks every update() is a full rescan
+        self.shaderUtility = ShaderUtility()
+        self.shaderUtility.addCallbacks()
+        self._revision = None  # the model is empty until refresh()
+
+    @property
+    def rootNode(self):
+        """ The current root node of the model """
+        return self._rootNode
+
+    @property
+    def grouped(self):
+        """ True if shaders are listed under their name prefix """
+        return self._grouped
+
+    @property
+    def filterText(self):
+        """ The text of the filter field the listed rows match """
+        return self._filterText
+
+    @staticmethod
+    def groupName(shaderName):
+        """The group of `shaderName`, as in ShaderUtility.getShaderGroups,
+        or None if it has no prefix."""
+        if '_' not in shaderName:
+            return None
+        return shaderName.split('_', 1)[0].strip()
+
+    def _build(self, rows):
+        """Creates the nodes of `rows`, sorting each parent once."""
+        self._rootNode = Node(self._rootNode.name)
+        self._nodes = {}
+        self._groups = {}
+        children = {self._rootNode: []}
+        for row in rows:
+            node = ShaderNode(row)
+            self._nodes[row.shaderName] = node
+            prefix = self.groupName(row.shaderName) if self._grouped else None
+            if prefix is None:
+                children[self._rootNode].append(node)
+                continue
+            if prefix not in self._groups:
+                self._groups[prefix] = GroupNode(prefix)
+                children[self._groups[prefix]] = []
+                children[self._rootNode].append(self._groups[prefix])
+            children[self._groups[prefix]].append(node)
+        for parentNode, nodes in children.iteritems():
+            parentNode.setChildren(nodes)
+
+    def _parentFor(self, shaderName):
+        if not self._grouped:
+            return self._rootNode
+        prefix = self.groupName(shaderName)
+        if prefix is None:
+            return self._rootNode
+        group = self._groups.get(prefix)
+        if group is None:
+            group = GroupNode(prefix)
+            self._insertNode(group, self._rootNode)
+            self._groups[prefix] = group
+        return group
+
+    def _insertNode(self, node, parentNode):
+        row = parentNode.insertRow(node)
+        self.beginInsertRows(self.indexOf(parentNode), row, row)
+        parentNode.addChild(node)
+        self.endInsertRows()
+
+    def _removeNode(self, node):
+        parentNode = node.parentNode
+        self.beginRemoveRows(self.indexOf(parentNode), node.row, node.row)
+        parentNode.removeChild(node)
+        self.endRemoveRows()
+
+    def indexOf(self, node):
+        """Returns the QModelIndex of `node`."""
+        if node is None or node is self._rootNode:
+            return QtCore.QModelIndex()
+        return self.createIndex(node.row, 0, node)
+
+    def indexOfShader(self, shaderName):
+        """Returns the QModelIndex of `shaderName`, invalid if not listed."""
+        return self.indexOf(self._nodes.get(shaderName))
+
+    def shaderCount(self):
+        """The number of listed shaders."""
+        return len(self._nodes)
+
+    def setFilter(self, filterText):
+        """Sets the text of the filter field, applied by the next refresh()."""
+        self._filterText = filterText or ''
+
+    def refresh(self, shaderNames=None):
+        """Updates ShaderUtility and applies the changed rows to the model.
+
+        Without `shaderNames` every row is built again, eg. after the
+        active layer or the filter changed. Otherwise only the rows of
+        `shaderNames`, and of the shaders ShaderUtility saw change, are,
+        eg. after an override edit.
+
+        Small changes are applied row by row. When most of the list
+        changed, or the shader changes aren't known, eg. after opening a
+        scene, the model is reset instead.
+        """
+        self.shaderUtility.addCallbacks()  # in case they were removed
+        self.shaderUtility.update()
+        changes = None
+        if self._revision is not None:
+            changes = self.shaderUtility.changesSince(self._revision)
+        self._revision = self.shaderUtility.revision
+
+        if shaderNames is None or changes is None:
+            rows = shaderList.filterList(
+                self.shaderUtility,
+                shaderList.setCustomStrings(self.rsUtility, self.shaderUtility),
+                self._filterText)
+            if changes is None:
+                self._reset(rows)
+                return
+            updates = dict.fromkeys(self._nodes)
+            updates.update((f.shaderName, f) for f in rows)
+        else:
+            names = set(shaderNames)
+            for f in changes:
+                names.update(f)
+            data = self.shaderUtility.data
+            built = [shaderList.buildRow(self.rsUtility, self.shaderUtility, f)
+                     for f in names if f in data]
+            updates = dict.fromkeys(names)
+            updates.update((f.shaderName, f) for f in shaderList.filterList(
+                self.shaderUtility, built, self._filterText))
+
+        self._apply(updates)
+
+    def _reset(self, rows):
+        self.beginResetModel()
+        self._build(rows)
+        self.endResetModel()
+
+    def _apply(self, updates):
+        """Applies the {shader name: Row, or None to remove} updates."""
+        removed = []
+        moved = []
+        added = []
+        changed = []
+        for shaderName, row in updates.iteritems():
+            node = self._nodes.get(shaderName)
+            if node is None:
+                if row is not None:
+                    added.append(row)
+            elif row is None:
+                removed.append(node)
+            elif rowKey(row) != node.key:
+                moved.append(row)
+            elif rowState(row) != rowState(node.item):
+                changed.append(row)
+            else:
+                node.item = row
+
+        if len(removed) + len(added) + len(moved) > max(
+                self.RESET_THRESHOLD, len(self._nodes) / 2):
+            rows = [f.item for f in self._nodes.itervalues()
+                    if f.name not in updates]
+            rows.extend(f for f in updates.itervalues() if f is not None)
+            self._reset(rows)
+            return
+
+        # A row whose sort key changed moves
+        for row in moved:
+            removed.append(self._nodes[row.shaderName])
+            added.append(row)
+
+        for node in removed:
+            del self._nodes[node.name]
+            parentNode = node.parentNode
+            self._removeNode(node)
+            if isinstance(parentNode, GroupNode) and not parentNode.childCount:
+                del self._groups[parentNode.name]
+                self._removeNode(parentNode)
+
+        for row in added:
+            node = ShaderNode(row)
+            self._nodes[row.shaderName] = node
+            self._insertNode(node, self._parentFor(row.shaderName))
+
+        # One signal per parent spanning its changed rows
+        spans = {}
+        for row in changed:
+            node = self._nodes[row.shaderName]
+            node.item = row
+            first, last = spans.get(node.parentNode, (node.row, node.row))
+            spans[node.parentNode] = (min(first, node.row), max(last, node.row))
+        for parentNode, (first, last) in spans.iteritems():
+            self.dataChanged.emit(
+                self.createIndex(first, 0, parentNode.getChild(first)),
+                self.createIndex(last, 0, parentNode.getChild(last)))
+
+    def setGrouped(self, grouped):
+        """Lists the shaders grouped by name prefix, or flat."""
+        if grouped == self._grouped:
+            return
+        self._grouped = grouped
+        self._reset([f.item for f in self._nodes.itervalues()])
+
+    def rowCount(self, parent):
+        """Row count."""
+        if not parent.isValid():
+            parentNode = self.rootNode
+        else:
+            parentNode = parent.internalPointer()
+        return parentNode.childCount
+
+    def columnCount(self, parent):  # pylint: disable=W0613
+        """Column count."""
+        return self.__class__.COLUMN_COUNT
+
+    def parent(self, index):
+        """The parent of the node."""
+        if not index.isValid():
+            return QtCore.QModelIndex()
+        node = index.internalPointer()
+        if not node:
+            return QtCore.QModelIndex()
+        return self.indexOf(node.parentNode)
+
+    def index(self, row, column, parent):
+        """Returns a QModelIndex()."""
+        if not parent.isValid():
+            parentNode = self.rootNode
+        else:
+            parentNode = parent.internalPointer()
+
+        childItem = parentNode.getChild(row)
+        if not childItem:
+            return QtCore.QModelIndex()
+        return self.createIndex(row, column, childItem)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        """The custom string, or group name, the ShaderRecord for
+        SHADER_ROLE and the shaderList.Row for ROW_ROLE."""
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if not isinstance(node, ShaderNode):
+            if role == QtCore.Qt.DisplayRole:
+                return node.name
+            return None
+        if role == QtCore.Qt.DisplayRole:
+            return node.item.customString
+        if role == ROW_ROLE:
+            return node.item
+        if role == SHADER_ROLE:
+            return self.shaderUtility.data.get(node.name)
+        return None
+
+    def hasChildren(self, parent=QtCore.QModelIndex()):
+        """Only the root and groups have children."""
+        if not parent.isValid():
+            return True
+        return parent.internalPointer().childCount > 0
+
+    def headerData(self, section, orientation, role):  # pylint: disable=W0613, R0201
+        """Static header data."""
+        return 'ShaderName'
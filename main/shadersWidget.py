@@ -0,0 +1,105 @@
+"""
+The shader list of the Render Setup Utility window.
+
+A QTreeView of ShadersModel. The window mounts it in place of a
+textScrollList and reads the selection from it; its delegate,
+ui.WindowStyle, paints the shaderList.Row of each index.
+"""
+
+# pylint: disable=C0103, E0401
+
+from PySide2 import QtCore, QtWidgets
+from maya.app.general.mayaMixin import MayaQWidgetBaseMixin
+
+from RenderSetupUtility.main.shadersModel import ShadersModel, ROW_ROLE
+
+
+def _path(index):
+    """The rows from the root to `index`, to sort indexes in list order."""
+    rows = []
+    while index.isValid():
+        rows.append(index.row())
+        index = index.parent()
+    return rows[::-1]
+
+
+class ShadersWidget(MayaQWidgetBaseMixin, QtWidgets.QTreeView):
+    """Lists the shaders of ShadersModel.
+
+    Rows have a uniform height so the view only lays out and paints the
+    visible rows, however many shaders the scene has.
+
+    selectionEdited is emitted when the user changes the selection, not
+    when refresh() or selectShaders() do, and deleteKeyPressed when
+    Delete or Backspace is pressed.
+    """
+
+    selectionEdited = QtCore.Signal()
+    deleteKeyPressed = QtCore.Signal()
+
+    def __init__(self, rsUtility=None, parent=None, grouped=False):
+        super(ShadersWidget, self).__init__(parent=parent)
+        self._updating = False
+        self.setModel(ShadersModel(rsUtility=rsUtility, parent=self,
+                                   grouped=grouped))
+        self.setHeaderHidden(True)
+        self.setUniformRowHeights(True)
+        self.setRootIsDecorated(grouped)
+        if not grouped:
+            self.setIndentation(0)
+        self.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+
+    def refresh(self, shaderNames=None):
+        """Applies the changes since the last refresh, see
+        ShadersModel.refresh()."""
+        self._updating = True
+        try:
+            self.model().refresh(shaderNames)
+        finally:
+            self._updating = False
+
+    def setFilter(self, filterText):
+        """Lists the shaders matching `filterText` from the next refresh."""
+        self.model().setFilter(filterText)
+
+    def setGrouped(self, grouped):
+        """Groups the shaders by name prefix."""
+        self.model().setGrouped(grouped)
+        self.setRootIsDecorated(grouped)
+        self.setIndentation(self.style().pixelMetric(
+            QtWidgets.QStyle.PM_TreeViewIndentation) if grouped else 0)
+
+    def selectedItems(self):
+        """The custom strings of the selected shaders, in list order."""
+        indexes = sorted(self.selectionModel().selectedRows(), key=_path)
+        return [f.data() for f in indexes if f.data(ROW_ROLE) is not None]
+
+    def selectShaders(self, shaderNames):
+        """Selects the listed shaders of `shaderNames` only."""
+        selection = QtCore.QItemSelection()
+        for shaderName in shaderNames or ():
+            index = self.model().indexOfShader(shaderName)
+            if index.isValid():
+                selection.select(index, index)
+        self._updating = True
+        try:
+            self.selectionModel().select(
+                selection, QtCore.QItemSelectionModel.ClearAndSelect
+                | QtCore.QItemSelectionModel.Rows)
+        finally:
+            self._updating = False
+
+    def setVisibleRows(self, count, rowHeight):
+        """Sizes the list to show `count` rows of `rowHeight` pixels."""
+        self.setFixedHeight(count * rowHeight + self.frameWidth() * 2)
+
+    def selectionChanged(self, selected, deselected):
+        super(ShadersWidget, self).selectionChanged(selected, deselected)
+        if not self._updating:
+            self.selectionEdited.emit()
+
+    def keyPressEvent(self, event):
+        if event.key() in (QtCore.Qt.Key_Delete, QtCore.Qt.Key_Backspace):
+            self.deleteKeyPressed.emit()
+            return
+        super(ShadersWidget, self).keyPressEvent(event)
@@ -14,7 +14,6 @@ in pure Qt with the appropiate model/view methodology.
 
 """
 
-import base64
 import functools
 import os
 import os.path as path
@@ -39,9 +38,13 @@ import maya.OpenMayaUI as OpenMayaUI
 import RenderSetupUtility
 import RenderSetupUtility.ac.aeCommand as aeCommand
 import RenderSetupUtility.ac.autoConnect as autoConnect
+import RenderSetupUtility.ac.exr as exr
+import RenderSetupUtility.ac.placeholderSequence as placeholderSequence
 import RenderSetupUtility.ac.psCommand as psCommand
-import RenderSetupUtility.ac.templates as templates
+import RenderSetupUtility.main.refresh as refresh
 import RenderSetupUtility.main.renderOutput as renderOutput
+import RenderSetupUtility.main.shaderList as shaderList
+import RenderSetupUtility.main.shadersModel as shadersModel
 from RenderSetupUtility.main.renderOutput import IMAGES
 import RenderSetupUtility.main.utilities as util
 import RenderSetupUtility.main.utility as utility
@@ -49,6 +52,7 @@ import RenderSetupUtility.main.utility as utility
 from RenderSetupUtility.main.shaderUtility import SHADER_OVERRIDE_OPTIONS
 from RenderSetupUtility.main.shaderUtility import SHADER_TYPES
 from RenderSetupUtility.main.shaderUtility import ShaderUtility
+from RenderSetupUtility.main.shadersWidget import ShadersWidget
 
 
 
@@ -58,11 +62,14 @@ WINDOW_BACKGROUND = (0.22, 0.22, 0.22)
 FRAME_BACKGROUND = (0.245, 0.245, 0.245)
 FRAME_MARGIN = 1
 SCROLLBAR_THICKNESS = 6
-ACTIVEITEM_PREFIX = ' '
+ACTIVEITEM_PREFIX = shaderList.ACTIVEITEM_PREFIX
 COLLECTION_SUFFIX = '_collection'
 MIN_NUMBER_OF_ROWS = 6
 MAX_NUMBER_OF_ROWS = 12
 
+# The parts of the window updateUI can rebuild independently
+REFRESH_SECTIONS = ('layers', 'shaders', 'overrides', 'output', 'timing')
+
 
 windowID = 'RenderSetupUtilityWindow'
 windowWorkspaceControl = 'WorkspaceControl'
@@ -118,40 +125,13 @@ def selectOptionMenuItem(inMenuName, inName, rl=True):
             cmds.optionMenu(inMenuName, e=True, select=index + 1)
 
 
-def _setTextScrollListVisibleItemNumber():
-    q.getQItem('%s_ShaderScrollList' % windowID, QtWidgets.QWidget)
-    allItems = cmds.textScrollList(q.fullPath, query=True,
-                                   allItems=True)
-
-    if allItems:
-        if MIN_NUMBER_OF_ROWS < len(allItems) < MAX_NUMBER_OF_ROWS:
-            cmds.textScrollList('%s_ShaderScrollList' % windowID,
-                                edit=True, enable=True,
-                                numberOfRows=len(allItems))
-            cmds.textField('%s_filterShaderList' % windowID, edit=True,
-                           enable=True)
-            return
-        if len(allItems) >= MAX_NUMBER_OF_ROWS:
-            cmds.textScrollList('%s_ShaderScrollList' % windowID,
-                                edit=True, enable=True,
-                                numberOfRows=MAX_NUMBER_OF_ROWS)
-            cmds.textField('%s_filterShaderList' % windowID, edit=True,
-                           enable=True)
-            return
-        if len(allItems) <= MIN_NUMBER_OF_ROWS:
-            cmds.textScrollList('%s_ShaderScrollList' % windowID,
-                                edit=True, enable=True,
-                                numberOfRows=MIN_NUMBER_OF_ROWS)
-            cmds.textField('%s_filterShaderList' % windowID, edit=True,
-                           enable=True)
-            return
-    else:
-        cmds.textScrollList(q.fullPath, edit=True, enable=True,
-                            numberOfRows=MIN_NUMBER_OF_ROWS)
-
-        q.getQItem('%s_filterShaderList' % windowID, QtWidgets.QWidget)
-        cmds.textField(q.fullPath, edit=True, enable=True)
-        return
+def _setShaderListVisibleRows():
+    """Sizes the shader list to MIN_NUMBER_OF_ROWS to MAX_NUMBER_OF_ROWS rows."""
+    numItems = window.shadersWidget.model().shaderCount()
+    window.shadersWidget.setVisibleRows(
+        min(max(numItems, MIN_NUMBER_OF_ROWS), MAX_NUMBER_OF_ROWS),
+        WindowStyle.ROW_HEIGHT)
+    cmds.textField('%s_filterShaderList' % windowID, edit=True, enable=True)
 
 
 def _outputTemplate():
@@ -359,36 +339,7 @@ def setPropertyOverridesMode():
 
 
 def _hasOverride(shaderName):
-    c = rsUtility.collection(shaderName.replace(':', '_'), isQuery=True)
-
-    if c.hasChildren():
-        pass
-    else:
-        return False
-
-    for child in c.getChildren():
-        if child.typeName() == 'collection' \
-            and '{0}{1}'.format(shaderName.replace(':', '_'),
-                                COLLECTION_SUFFIX) in child.name():
-            for o in child.getOverrides():
-                if o.typeName() == 'shaderOverride':
-                    cnxs = cmds.listConnections(o.name())
-
-                    overrideShader = [cnx for cnx in cnxs
-                                      if '_collection' not in cnx and '_msg'
-                                      not in cnx]
-                    if overrideShader:
-                        pass
-                    else:
-                        return False
-
-                    shaderName = \
-                        shaderUtility.stripSuffix(overrideShader[0])
-                    overrideShader = overrideShader[0]
-                    if [s for s in SHADER_OVERRIDE_OPTIONS if s['suffix'
-                                                                ] in overrideShader]:
-                        return True
-    return False
+    return shaderList.hasShaderOverride(rsUtility, shaderUtility, shaderName)
 
 
 def getShaderOverrideMode(shaderName):
@@ -517,22 +468,20 @@ def setShaderOverrideMode(query=False):
 
 
 def getListSelection():
-    sel = cmds.textScrollList('%s_ShaderScrollList' % windowID,
-                              query=True, selectItem=True)
-    if sel is None:
+    if window is None or window.shadersWidget is None:
         return []
-    else:
-        return sel
+    return window.shadersWidget.selectedItems()
 
 
 def rsSelectActiveLayer(arg):
     rsUtility.switchLayer(arg, switchLayer=False)
-    window.updateUI(updateRenderSetup=False)
+    requestRefresh(updateRenderSetup=False,
+                   sections=('layers', 'shaders', 'overrides'))
 
 
 def rsSelectVisibleLayer(arg):
     rsUtility.switchLayer(arg, switchLayer=True)
-    window.updateUI(updateRenderSetup=True)
+    requestRefresh(updateRenderSetup=True)
 
 
 def _filterInvalidInput(name):
@@ -688,7 +637,7 @@ def rsSetFPSMenu(arg):
 def rsShaderGroups(arg):
     text = cmds.textField('%s_filterShaderList' % windowID, edit=True,
                           text=arg)
-    window.updateUI(updateRenderSetup=False)
+    requestRefresh(updateRenderSetup=False, sections=('shaders', 'overrides'))
 
 
 def rsOpenRenderSetupWindow(arg):
@@ -725,7 +674,7 @@ def rsAddNewLayer(item):
         if len(text) > 0:
             rsUtility.layer(text)
         cmds.deleteUI(windowNewLayerID, window=True)
-        window.updateUI(updateRenderSetup=True)
+        requestRefresh(updateRenderSetup=True)
 
     def rsuNewLayerWindow_textField01(arg):
         if len(arg) == 0:
@@ -797,52 +746,51 @@ def rsAddCollection(arg):
     sel = getListSelection()
     _currentSelection = []
 
+    addOverrides = cmds.checkBox('rsArnoldPropertyOverridesCheckBox',
+                                 query=True, value=True)
+    specs = []
     for s in sel:
-
         shaderName = shaderUtility.customStringToShaderName(s)
         _currentSelection.append(shaderName)
 
-        rsUtility.activeLayer.collection(shaderName.replace(':', '_'),
-                                         addOverrides=cmds.checkBox('rsArnoldPropertyOverridesCheckBox', query=True, value=True))
-
-        # Add used shapes to the active collection
+        # The used shapes become the collection's only members and are
+        # removed from the other collections of the layer
 
-        rsUtility.activeCollection.setSelection(shaderUtility.data[shaderName]['usedBy'
-                                                                               ], DEFAULT_FILTER_TYPE)
+        specs.append({
+            'name': shaderName.replace(':', '_'),
+            'members': shaderUtility.data[shaderName]['usedBy'],
+            'filterType': DEFAULT_FILTER_TYPE,
+            'addOverrides': addOverrides
+        })
 
-        # Remove objects from other collections:
+    with rsUtility.deferredApply():
+        rsUtility.addCollections(specs)
 
-        cl = rsUtility.activeLayer.getCollections()
-        for c in cl:
-            if c.name() != rsUtility.activeCollection.name():
-                if c.typeName() == 'collection':
-                    c.getSelector().staticSelection.remove(shaderUtility.data[shaderName]['usedBy'
-                                                                                          ])
+        for shaderName in _currentSelection:
+            if _hasOverride(shaderName) is False:
 
-        if _hasOverride(shaderName) is False:
+                # Shader override
 
-            # Shader override
+                shaderOverrideCB = cmds.checkBox('%s_shaderOverrideCheckbox'
+                                                 % windowID, query=True, value=True)
 
-            shaderOverrideCB = cmds.checkBox('%s_shaderOverrideCheckbox'
-                                             % windowID, query=True, value=True)
+                if shaderOverrideCB:
+                    choice = cmds.optionMenu('%s_optionMenu02' % windowID,
+                                             query=True, value=True)
 
-            if shaderOverrideCB:
-                choice = cmds.optionMenu('%s_optionMenu02' % windowID,
-                                         query=True, value=True)
+                    # Create the shader override shader
 
-                # Create the shader override shader
+                    overrideShader = \
+                        shaderUtility.duplicateShader(shaderName,
+                                                      choice=choice, applyOp=shaderOverrideCB)
 
-                overrideShader = \
-                    shaderUtility.duplicateShader(shaderName,
-                                                  choice=choice, applyOp=shaderOverrideCB)
+                    o = rsUtility.addShaderOverride()
+                    o.setSource(overrideShader + '.outColor')
 
-                o = rsUtility.addShaderOverride()
-                o.setSource(overrideShader + '.outColor')
-
-                selectedShaderOverride = choice
+                    selectedShaderOverride = choice
 
     currentSelection = _currentSelection
-    window.updateUI(updateRenderSetup=True)
+    requestRefresh(updateRenderSetup=True)
     q.widget.setUpdatesEnabled(True)
 
 
@@ -860,7 +808,7 @@ def rsRemoveCollection(arg):
         rsUtility.activeLayer.removeCollection(shaderName.replace(':',
                                                                   '_'))
 
-    window.updateUI(updateRenderSetup=True)
+    requestRefresh(updateRenderSetup=True)
     q.widget.setUpdatesEnabled(True)
 
 
@@ -909,7 +857,7 @@ def rsRenameShader(arg):
         _currentSelection = []
         currentSelection = _currentSelection.append(shaderName)
 
-        window.updateUI()
+        requestRefresh()
         cmds.deleteUI(windowRenameID, window=True)
 
     def rsuRenameWindow_textField01(arg):
@@ -983,7 +931,7 @@ def rsSelectShapes(*args):
 def rsRefreshUI(*args):
     """ Refresh button """
 
-    window.updateUI()
+    requestRefresh()
 
 
 def duplicateShader(*args):
@@ -1051,6 +999,7 @@ def rsIncrementOutputVersion(args):
     """
 
     lyr = rsUtility.activeLayer.name()
+    rsRenderOutput.invalidateVersions(lyr)
     versions = rsRenderOutput.getVersions(lyr)
 
     global rsRenderOutput
@@ -1122,22 +1071,10 @@ def rsMakeComp(args):
         SCENE_NAME = (sn.split('.')[0])[:-4]
     else:
         SCENE_NAME = 'untitled_maya_scene'
-    OUTPUT_OPTION = [w for w in renderOutput.SIZE_TEMPLATE
-                     if currentWidth == w['width'] and currentHeight
-                     == w['height']]
-    # Check output templates
-    if OUTPUT_OPTION == []:
-        raise RuntimeError(
-            'The current output size is not one of the defined templates. This is unsupported.\n\
-            To continue, select one of the templated output formats.'
-        )
-    TEMPLATE = None
     IMAGE_PATHS = []
     FOOTAGE_NAMES = []
     MAYA_CAMERA = None
 
-    TEMPLATE = OUTPUT_OPTION[0]['suffix']
-
     if pathControlSelection == renderOutput.OUTPUT_TEMPLATES[0]:
         print '# Output path not yet set #'
         raise RuntimeError('Path template is not set. To continue, select one of the output path templates.')
@@ -1146,8 +1083,6 @@ def rsMakeComp(args):
     VERSION = cmds.optionMenu('%s_outputVersionMenu' % windowID,
                               query=True, value=True)
 
-    # Decode the exr template file
-    decoded_exr_template_file = base64.b64decode(templates.EXR_TEMPLATES[TEMPLATE])
     PADDING = str(int(START_FRAME)).zfill(4)
 
     BASE_PATH = rsRenderOutput.pathStr(
@@ -1236,6 +1171,7 @@ def rsMakeComp(args):
         )
 
     def write_exrs(aov):
+        image_paths = []
         for n in xrange(DURATION):
             IMAGE_PATH = '{path}_{padding}.{ext}'.format(
                 path=BASE_PATH,
@@ -1244,17 +1180,18 @@ def rsMakeComp(args):
             )
 
             if 'layout' in LAYER_NAME:
-                image_path = os.path.normpath(IMAGE_PATH.replace('<AOV>', ''))
+                image_paths.append(os.path.normpath(IMAGE_PATH.replace('<AOV>', '')))
             else:
-                image_path = os.path.normpath(IMAGE_PATH.replace('<AOV>', aov))
-
-            if not os.path.exists(os.path.dirname(image_path)):
-                os.makedirs(os.path.dirname(image_path))
-
-            with open(image_path, 'w') as exr_file:
-                exr_file = open(image_path, 'w')
-                exr_file.write(decoded_exr_template_file)
+                image_paths.append(os.path.normpath(IMAGE_PATH.replace('<AOV>', aov)))
 
+        # A black exr of the current size, with the channels of the aov
+        data = exr.placeholder(
+            currentWidth, currentHeight, exr.aovChannels(aov))
+        hardlinks = cmds.checkBox('%s_hardlinkPlaceholders' % windowID,
+                                  query=True, value=True)
+        report = placeholderSequence.writeSequence(
+            data, image_paths, hardlinks=hardlinks)
+        print '# {aov}: {report}'.format(aov=aov or 'beauty', report=report)
 
     # LOOP THROUGH AOVS
     AOVs = rsRenderOutput.get_active_Arnold_AOVs()
@@ -1322,7 +1259,9 @@ def rsMakeComp(args):
             )
 
     # House cleaning
-    rsUtility.removeMissingSelections()
+    pruned = rsUtility.removeMissingSelections()
+    if pruned:
+        print '# Removed {} missing objects from the collections.'.format(pruned)
 
     # Export Camera from scene
     MAYA_CAMERA = autoConnect.exportCamera()
@@ -1563,14 +1502,20 @@ def rsShaderScrollList_onSelect(*args):
     currentSelection = _currentSelection
 
 
-def postMenuCommand(*args):
-    sel = getListSelection()
-    if sel == []:
-        for item in cmds.popupMenu(args[0], query=True, itemArray=True):
-            cmds.menuItem(item, edit=True, enable=False)
-    if sel != []:
-        for item in cmds.popupMenu(args[0], query=True, itemArray=True):
-            cmds.menuItem(item, edit=True, enable=True)
+def rsShaderScrollList_contextMenu(point):
+    """Shows the shader list menu, its items are enabled with a selection."""
+
+    enable = getListSelection() != []
+    menu = QtWidgets.QMenu(window.shadersWidget)
+    menu.addAction('Duplicate Shader', duplicateShader).setEnabled(enable)
+    menu.addSeparator()
+    menu.addAction('Graph Shader').setEnabled(enable)
+    menu.addSeparator()
+    menu.addAction('Select Shader').setEnabled(enable)
+    menu.addSeparator()
+    menu.addAction('Select Assigned Shapes').setEnabled(enable)
+    menu.addAction('Select Assigned Transforms').setEnabled(enable)
+    menu.exec_(window.shadersWidget.viewport().mapToGlobal(point))
 
 
 def rsArnoldPropertyOverridesCheckBox(arg):
@@ -1583,6 +1528,7 @@ def setOverrideValue(arg, index=None):
     setPropertyOverridesMode()
 
     sel = getListSelection()
+    shaderNames = []
 
     for s in sel:
         if propertyOverridesMode is True:
@@ -1591,16 +1537,14 @@ def setOverrideValue(arg, index=None):
                 shaderName.replace(':', '_'), isQuery=True)
             c.setOverrideValue(rsUtility.overrideAttributes[index]['long'
                                                                    ], arg)
+            shaderNames.append(shaderName)
 
     rsUtility.overrideAttributes[index]['default'] = arg
 
-    def update():
-        if propertyOverridesMode is True:
-            window.updateUI(updateRenderSetup=True)
-        else:
-            window.updateUI(updateRenderSetup=False)
+    # Only the edited rows and the override panel change
 
-    cmds.evalDeferred(update)
+    requestRefresh(updateRenderSetup=propertyOverridesMode is True,
+                   sections=('overrides',), shaders=shaderNames)
 
 
 def rsShaderOverrideCheckbox(arg):
@@ -1845,29 +1789,6 @@ def addSeparator(
     )
 
 
-def addTextScrollList(
-    inTitle,
-    inArr,
-    doubleClickCommand,
-    selectCommand,
-    deleteKeyCommand,
-    enable=True,
-    visible=True,
-):
-    cmds.textScrollList(
-        inTitle,
-        append=inArr,
-        numberOfItems=len(inArr),
-        numberOfRows=MIN_NUMBER_OF_ROWS,
-        doubleClickCommand=doubleClickCommand,
-        selectCommand=selectCommand,
-        deleteKeyCommand=deleteKeyCommand,
-        allowMultiSelection=True,
-        enable=enable,
-        visible=visible,
-    )
-
-
 def addCheckBox(
     inTitle,
     label,
@@ -2115,7 +2036,7 @@ class CustomRenamer(object):
             cmds.rename(name, '%s%s#' % (self.newName, suffix),
                         ignoreShape=False)
 
-        self.updateUI(updateWindow=True)
+        requestRefresh()
 
     def setOptionMenu1(self, value=''):
         cmds.optionMenu('%s_optionMenu01' % self.windowID, query=True,
@@ -2382,7 +2303,7 @@ class CustomRenamer(object):
 
         if dagSel != []:
             self.doIt()
-            self.updateUI(updateWindow=True)
+            requestRefresh()
 
     def assignShader(self, *args):
         self.makeNameString()
@@ -2405,7 +2326,7 @@ class CustomRenamer(object):
             pass
         cmds.select(sel)
 
-        self.updateUI(updateWindow=True)
+        requestRefresh()
 
     def createShader(self, *args):
         self.makeNameString()
@@ -2448,7 +2369,7 @@ class CustomRenamer(object):
             ac = autoConnect.AutoConnect()
             ac.createPSDFile(newShader, apply=True)
 
-        self.updateUI(updateWindow=True)
+        requestRefresh()
 
     def updateUI(self, updateWindow=False):
         """
@@ -2535,7 +2456,7 @@ class CustomRenamer(object):
         # Update the main Render Setup Window to reflect new group assignments
 
         if updateWindow:
-            cmds.evalDeferred(window.updateUI)
+            requestRefresh()
 
 
 class RenderSetupUtilityWindow(MayaQWidgetDockableMixin,
@@ -2568,6 +2489,7 @@ class RenderSetupUtilityWindow(MayaQWidgetDockableMixin,
         self.setLayout(QVBoxLayout)
 
         self.gwCustomRenamer = None
+        self.shadersWidget = None
 
     def deleteInstances(self):
 
@@ -2602,6 +2524,10 @@ class RenderSetupUtilityWindow(MayaQWidgetDockableMixin,
                     obj.setParent(None)
                     obj.deleteLater()
 
+    def dockCloseEventTriggered(self):
+        # The scene isn't tracked while the window is closed
+        shaderUtility.removeCallbacks()
+
     def createUI(self):
         """
         Create the Render Setup Utility window
@@ -2712,7 +2638,7 @@ class RenderSetupUtilityWindow(MayaQWidgetDockableMixin,
 
         addTextField('%s_filterShaderList' % windowID, 'Search',
                      rsFilterShaderList_off, rsFilterShaderList_off,
-                     window.updateUI)
+                     lambda *args: requestRefresh(sections=('shaders', 'overrides')))
         addOptionMenu('rsShaderGroups', '|', (), rsShaderGroups)
 
         # ###########################
@@ -2721,30 +2647,28 @@ class RenderSetupUtilityWindow(MayaQWidgetDockableMixin,
         cmds.setParent('%s_frameLayout02' % windowID)
         addRowLayout('%s_rowLayout04' % windowID, 1, columnAlign1='both', columnAttach1='both', columnWidth1=WINDOW_WIDTH
                      + 12)
-        addTextScrollList('%s_ShaderScrollList' % windowID, (),
-                          rsShaderScrollList_doubleClick,
-                          rsShaderScrollList_onSelect,
-                          rsShaderScrollList_deleteKey)
+        cmds.columnLayout('%s_columnLayout22' % windowID,
+                          columnAttach=('both', 0), adjustableColumn=True)
+
+        # The list is a view of shadersModel.ShadersModel, the rows are
+        # updated in place instead of being removed and appended
+
+        self.shadersWidget = ShadersWidget(rsUtility=rsUtility)
+        self.shadersWidget.setObjectName('%s_ShaderScrollList' % windowID)
+        OpenMayaUI.MQtUtil.addWidgetToMayaLayout(
+            long(shiboken2.getCppPointer(self.shadersWidget)[0]),
+            long(OpenMayaUI.MQtUtil.findLayout('%s_columnLayout22' % windowID)))
+        self.shadersWidget.doubleClicked.connect(
+            lambda *args: rsShaderScrollList_doubleClick())
+        self.shadersWidget.selectionEdited.connect(rsShaderScrollList_onSelect)
+        self.shadersWidget.deleteKeyPressed.connect(
+            rsShaderScrollList_deleteKey)
 
         # Add popup menu:
 
-        cmds.popupMenu('rsShaderScrollListPopupMenu',
-                       parent='%s_ShaderScrollList' % windowID,
-                       allowOptionBoxes=False, markingMenu=True,
-                       postMenuCommand=postMenuCommand)
-        cmds.menuItem('%s_popupMenuItem02' % windowID,
-                      label='Duplicate Shader', command=duplicateShader)
-        cmds.menuItem(divider=True)
-        cmds.menuItem('%s_popupMenuItem04' % windowID,
-                      label='Graph Shader')
-        cmds.menuItem(divider=True)
-        cmds.menuItem('%s_popupMenuItem03' % windowID,
-                      label='Select Shader')
-        cmds.menuItem(divider=True)
-        cmds.menuItem('%s_popupMenuItem05' % windowID,
-                      label='Select Assigned Shapes')
-        cmds.menuItem('%s_popupMenuItem06' % windowID,
-                      label='Select Assigned Transforms')
+        self.shadersWidget.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
+        self.shadersWidget.customContextMenuRequested.connect(
+            rsShaderScrollList_contextMenu)
 
         # ##################################################
         # Arnold Property Overrides
@@ -2903,6 +2827,20 @@ class RenderSetupUtilityWindow(MayaQWidgetDockableMixin,
         addText('%s_text90' % windowID, 'Send to After Effects:')
         addButton('makeCompButton', 'Send to After Effects', rsMakeComp)
 
+        # Placeholder frames linked to the first one, on shares without
+        # reflinks, eg. NFS and SMB, every frame is written otherwise
+        cmds.setParent('%s_frameLayout03' % windowID)
+        addRowLayout('%s_rowLayout13' % windowID, 2,
+                     columnAlign2=('left', 'both'),
+                     columnAttach2=('left', 'right'),
+                     columnWidth2=((WINDOW_WIDTH - FRAME_MARGIN * 2)
+                                   * 0.75, (WINDOW_WIDTH - FRAME_MARGIN * 2) * 0.25))
+        addText('%s_text91' % windowID,
+                'Hardlink Placeholder Frames', 'plainLabelFont')
+        addCheckBox('%s_hardlinkPlaceholders' % windowID, '',
+                    lambda *args: None, lambda *args: None,
+                    value=placeholderSequence.HARDLINKS)
+
         # #################################################
         # Render Setup /
         # Output settings
@@ -2969,35 +2907,65 @@ class RenderSetupUtilityWindow(MayaQWidgetDockableMixin,
         addTextField('%s_setOutFrame' % windowID, '', setOutFrame,
                      setOutFrame, setOutFrame)
 
-    def updateUI(self, updateRenderSetup=False):
+    def updateUI(self, updateRenderSetup=False, sections=None, shaders=None):
         """
         Update Render Setup Window and values
-        """
 
-        global rsUtility
-        global currentSelection
-        global propertyOverridesMode
+        sections: the REFRESH_SECTIONS to rebuild, all of them by default.
+        shaders: shader names whose list items are refreshed in place when
+        the 'shaders' section isn't rebuilt, eg. after an override edit.
+        """
 
-        shaderUtility.update()
+        if sections is None:
+            sections = REFRESH_SECTIONS
+        sections = set(sections)
+        renderSetupChanged = bool(sections & set(('layers', 'shaders')))
 
         q.getQItem(windowID, QtWidgets.QWidget)
         q.widget.setUpdatesEnabled(False)  # Pause qt draw temporarily
 
-        self.gwCustomRenamer.updateUI(updateWindow=False)
-
         # Update Render layer Setup
 
         if updateRenderSetup is True:
             if rsUtility.activeLayer.needsRefresh():
                 rsUtility.activeLayer.apply()
 
-        # Housekeeping:
-
-        rsUtility.removeMissingSelections()
+        if renderSetupChanged:
+            self._updateHousekeeping()
+        if 'layers' in sections:
+            self._updateLayers()
+        if 'shaders' in sections:
+            self._updateShaders()
+        elif shaders:
+            self._updateRows(shaders)
+        if 'overrides' in sections:
+            self._updateOverrides()
+        if 'output' in sections:
+            self._updateOutput()
+        if 'timing' in sections:
+            self._updateTiming()
 
         # Reapply custom QT style:
 
-        windowStyle.apply(windowStyle)
+        if renderSetupChanged:
+            windowStyle.apply(windowStyle)
+
+        q.getQItem(windowID, QtWidgets.QWidget)
+        q.widget.setUpdatesEnabled(True)  # Pause qt draw temporarily
+
+    def _updateHousekeeping(self):
+        shaderUtility.update()
+        self.gwCustomRenamer.updateUI(updateWindow=False)
+
+        # Render Setup may have been edited elsewhere
+        rsUtility.invalidateCollections()
+        rsUtility.invalidateMemberIndex()
+        rsUtility.invalidateOverrides()
+        pruned = rsUtility.removeMissingSelections()
+        if pruned:
+            print '# Removed {} missing objects from the collections.'.format(pruned)
+
+    def _updateLayers(self):
 
         # #############################################
         # Active/Visible Render Layer
@@ -3008,19 +2976,16 @@ class RenderSetupUtilityWindow(MayaQWidgetDockableMixin,
         for l in renderSetup.instance().getRenderLayers():
             listItem.append(l.name())
 
-            q.getQItem('%s_selectVisibleLayer' % windowID,
-                       QtWidgets.QWidget)
+        q.getQItem('%s_selectVisibleLayer' % windowID,
+                   QtWidgets.QWidget)
 
-            resetOptionMenu(q.fullPath, util.natsort(listItem), rl=True)
-            selectOptionMenuItem(q.fullPath, currentName)
+        resetOptionMenu(q.fullPath, util.natsort(listItem), rl=True)
+        selectOptionMenuItem(q.fullPath, currentName)
 
         # #############################################
         # Active/Visible Render Layer
 
-        listItem = []
         currentName = rsUtility.activeLayer.name()
-        for l in renderSetup.instance().getRenderLayers():
-            listItem.append(l.name())
 
         q.getQItem('%s_selectActiveLayer' % windowID, QtWidgets.QWidget)
 
@@ -3042,146 +3007,45 @@ class RenderSetupUtilityWindow(MayaQWidgetDockableMixin,
             q.getQItem('rsRemoveCollection', QtWidgets.QWidget)
             cmds.button(q.fullPath, edit=True, enable=True)
 
+    def _updateShaders(self):
+
         # #############################################
         # Collections
 
-        customStrings = []
-        cleanList = []
-        q.getQItem('%s_ShaderScrollList' % windowID, QtWidgets.QWidget)
-        cmds.textScrollList(q.fullPath, edit=True, removeAll=True)
-
-        def _spacer(inString):
-            num = int(30 - len(inString))
-            if num > 0:
-
-                # return util.addChars(' ', num)
-
-                return '   '
-            else:
-                return ' '
-
-        # Loop through shader list
-
-        for shaderName in shaderUtility.data.keys():
-            c = rsUtility.activeLayer.collection(
-                shaderName.replace(':', '_'), isQuery=True)
-
-            # Mark item as inactive if not in the collections list
-
-            if c is None:
-
-                # Set the custom string of the shader.
-                # The custom string used by the Qt delegate for custom display and to indicate if the item is active or inactive.
-
-                shaderUtility.data[shaderName]['customString'] = \
-                    '%s%s%s)' % (shaderName, ' ', '('
-                                 + str(len(shaderUtility.data[shaderName]['usedBy'
-                                                                          ])))
-            else:
-
-                # Mark item as active if in the collections list
-
-                # Get current override values
+        q.getQItem('%s_filterShaderList' % windowID, QtWidgets.QWidget)
+        filter = cmds.textField(q.fullPath, query=True, text=True)
 
-                for (index, item) in \
-                        enumerate(rsUtility.overrideAttributes):
-                    try:
+        # Only the rows that changed are inserted, removed or repainted
 
-                        rsUtility.overrideAttributes[index][item['default'
-                                                                 ]] = c.getOverrideValue(item['long'])
-                    except:
-                        print '# Couldn\'t get attribute value for ' \
-                            + item['long'] + '.'
+        self.shadersWidget.setFilter(filter)
+        self.shadersWidget.refresh()
 
-                def _get(item):
-                    val = c.getOverrideValue(item['long'])
-                    if val is None:
-                        return ''
-                    else:
-                        return item['custom'][1 - val]
-
-                # Add warning if usedBy doesn't match collection selection
-
-                WARNING = ''
-                if c.selection.asList() \
-                        != list(shaderUtility.data[shaderName]['usedBy']):
-                    WARNING = '!!'
-                SHADER_OVERRIDE = ''
-                if _hasOverride(shaderName):
-                    SHADER_OVERRIDE = '#'
-                shaderUtility.data[shaderName]['customString'] = \
-                    '%s%s%s%s%s%s%s%s%s%s%s%s%s%s%s%s%s' % (
-                    ACTIVEITEM_PREFIX,
-                    shaderName,
-                    _spacer(ACTIVEITEM_PREFIX + shaderName),
-                    _get(rsUtility.overrideAttributes[5]),
-                    _get(rsUtility.overrideAttributes[0]),
-                    _get(rsUtility.overrideAttributes[1]),
-                    _get(rsUtility.overrideAttributes[2]),
-                    _get(rsUtility.overrideAttributes[3]),
-                    _get(rsUtility.overrideAttributes[4]),
-                    _get(rsUtility.overrideAttributes[6]),
-                    _get(rsUtility.overrideAttributes[7]),
-                    _get(rsUtility.overrideAttributes[8]),
-                    _get(rsUtility.overrideAttributes[9]),
-                    _get(rsUtility.overrideAttributes[10]),
-                    str(len(shaderUtility.data[shaderName]['usedBy'])),
-                    WARNING,
-                    SHADER_OVERRIDE,
-                )
-            customStrings.append(shaderUtility.data[shaderName]['customString'
-                                                                ])
-            cleanList.append(shaderName)
+        # Re-Set selected items from saved selection.
 
-        q.getQItem('%s_filterShaderList' % windowID, QtWidgets.QWidget)
-        filter = cmds.textField(q.fullPath, query=True, text=True)
-        filteredList = []
-        if filter != '<Lights>' and filter != '<Environment>' \
-                and filter != '<Shaders>' and filter != '<StandIns>':
-            filteredList = [s for s in customStrings if filter.lower()
-                            in s.lower()]
-        else:
-            if filter == '<Lights>':
-                filteredList = [s for s in customStrings
-                                if shaderUtility.data[shaderUtility.customStringToShaderName(s)]['light'
-                                                                                                 ]]
-            if filter == '<Environment>':
-                filteredList = [s for s in customStrings
-                                if shaderUtility.data[shaderUtility.customStringToShaderName(s)]['environment'
-                                                                                                 ]]
-            if filter == '<Shaders>':
-                filteredList = [s for s in customStrings
-                                if shaderUtility.data[shaderUtility.customStringToShaderName(s)]['shader'
-                                                                                                 ]]
-            if filter == '<StandIns>':
-                filteredList = [s for s in customStrings
-                                if shaderUtility.data[shaderUtility.customStringToShaderName(s)]['standIn'
-                                                                                                 ]]
-
-        q.getQItem('%s_ShaderScrollList' % windowID, QtWidgets.QWidget)
-
-        for item in util.natsort(filteredList, filterOn=True):
-            cmds.textScrollList(q.fullPath, edit=True, append=item)
+        self.shadersWidget.selectShaders(currentSelection)
 
-        # Re-Set selected items from saved selection.
+        # Set height
 
-        matches = set([])
+        _setShaderListVisibleRows()
 
-        if currentSelection is not None:
-            matches = set(currentSelection).intersection(set(cleanList))
-        for match in matches:
-            cmds.textScrollList(q.fullPath, edit=True,
-                                selectItem=shaderUtility.data[match]['customString'
-                                                                     ])
+        # #############################################
+        # Filter list
 
-        # Set height
+        resetOptionMenu('rsShaderGroups',
+                        util.natsort(shaderUtility.getShaderGroups().keys(),
+                                     cache=True),
+                        rl=False)
+        filterListText = cmds.textField('%s_filterShaderList'
+                                        % windowID, query=True, text=True)
+        selectOptionMenuItem('rsShaderGroups', filterListText, rl=False)
 
-        _setTextScrollListVisibleItemNumber()
+    def _updateRows(self, shaderNames):
+        """Rebuilds the list rows of `shaderNames`, keeping the selection."""
 
-        # Style scrollist
+        self.shadersWidget.refresh(shaderNames)
 
-        numItems = len(filteredList)
-        windowStyle.apply(windowStyle)
+    def _updateOverrides(self):
+        global propertyOverridesMode
 
         # Checkboxes
 
@@ -3196,15 +3060,7 @@ class RenderSetupUtilityWindow(MayaQWidgetDockableMixin,
         resetOptionMenu(menuName, listItem, rl=False)
         setShaderOverrideMode()
 
-        # #############################################
-        # Filter list
-
-        resetOptionMenu('rsShaderGroups',
-                        util.natsort(shaderUtility.getShaderGroups().keys()),
-                        rl=False)
-        filterListText = cmds.textField('%s_filterShaderList'
-                                        % windowID, query=True, text=True)
-        selectOptionMenuItem('rsShaderGroups', filterListText, rl=False)
+    def _updateOutput(self):
 
         # ############################################
         # Render output templates
@@ -3233,6 +3089,8 @@ class RenderSetupUtilityWindow(MayaQWidgetDockableMixin,
 
         _outputTemplate()
 
+    def _updateTiming(self):
+
         # Playback speed
         # Populate list
 
@@ -3260,9 +3118,6 @@ class RenderSetupUtilityWindow(MayaQWidgetDockableMixin,
                        text=int(cmds.getAttr('defaultRenderGlobals.endFrame'
                                              )))
 
-        q.getQItem(windowID, QtWidgets.QWidget)
-        q.widget.setUpdatesEnabled(True)  # Pause qt draw temporarily
-
 
 class WindowStyle(QtWidgets.QStyledItemDelegate):
 
@@ -3275,6 +3130,37 @@ class WindowStyle(QtWidgets.QStyledItemDelegate):
     FONT_PIXEL_SIZE_OFFSET = ROW_HEIGHT / 2 / 2 + 2
     ROW_WIDTH = WINDOW_WIDTH - FRAME_MARGIN * 2 - 6
 
+    LEAD_RECTANGLE_WIDTH = 4
+    TEXT_SPACER = 4
+
+    # (pixel size, bold) of the fonts used to paint rows
+    FONTS = {
+        'name': (FONT_PIXEL_SIZE, False),
+        'nameBold': (FONT_PIXEL_SIZE, True),
+        'small': (10, False),
+    }
+    BRUSHES = {
+        'selected': (82, 133, 166),
+        'active': (90, 90, 90),
+        'activeEnvironment': (70, 70, 90),
+        'activeLight': (150, 100, 50),
+        'activeMarker': (255, 170, 100),
+        'activeNameSpace': (75, 75, 75),
+        'inactive': (55, 55, 55),
+        'inactiveEnvironment': (40, 40, 70),
+        'inactiveLight': (65, 65, 35),
+        'inactiveNameSpace': (50, 50, 50),
+        'mask': (50, 50, 50),
+        'separator': (50, 50, 50),
+    }
+    PENS = {
+        'activeName': (210, 210, 210),
+        'activeNameSpace': (150, 150, 150),
+        'inactiveName': (150, 150, 150),
+        'inactiveNameSpace': (100, 100, 100),
+        'attributes': (150, 150, 150),
+    }
+
     def __init__(self, parent=None, *args):
         super(WindowStyle, self).__init__(parent=parent)
 
@@ -3288,6 +3174,33 @@ class WindowStyle(QtWidgets.QStyledItemDelegate):
         cmds.resourceManager(saveAs=['out_shadingEngine.png',
                                      self.shaderOverrideIcon])
 
+        # Painting objects are made once and reused for every row
+        self.warningImage = QtGui.QImage(self.warningIcon)
+        self.shaderOverrideImage = QtGui.QImage(self.shaderOverrideIcon)
+        self.fonts = {}
+        self.metrics = {}
+        for key, (pixelSize, bold) in self.FONTS.iteritems():
+            font = QtGui.QFont()
+            font.setFamily('Segoe UI')
+            font.setPixelSize(pixelSize)
+            font.setItalic(False)
+            font.setBold(bold)
+            self.fonts[key] = font
+            self.metrics[key] = QtGui.QFontMetrics(font)
+        self.brushes = dict((k, QtGui.QBrush(QtGui.QColor(*v)))
+                            for k, v in self.BRUSHES.iteritems())
+        self.pens = dict((k, QtGui.QPen(QtGui.QColor(*v)))
+                         for k, v in self.PENS.iteritems())
+        self.noPen = QtGui.QPen(QtCore.Qt.NoPen)
+        self._widths = {}
+
+    def _width(self, font, text):
+        """Returns the cached width of `text` drawn with `font`."""
+        key = (font, text)
+        if key not in self._widths:
+            self._widths[key] = self.metrics[font].width(text)
+        return self._widths[key]
+
     def sizeHint(self, option, index):
         return QtCore.QSize(self.__class__.ROW_WIDTH,
                             self.__class__.ROW_HEIGHT)
@@ -3302,85 +3215,48 @@ class WindowStyle(QtWidgets.QStyledItemDelegate):
         Main paint function for the Render Setup Utility
         """
 
-        q.getQItem('%s_ShaderScrollList' % windowID,
-                   QtWidgets.QListWidget)
+        # The shaderList.Row of the index, None for the group rows
+
+        row = index.data(shadersModel.ROW_ROLE)
+        if row is None or row.shaderName not in shaderUtility.data:
+            return False
 
         # Reset pen
 
         painter.save()
-        painter.setPen(QtGui.QPen(QtCore.Qt.NoPen))
-
-        # Set font
-
-        font = QtGui.QFont()
-        font.setFamily('Segoe UI')
-        font.setPixelSize(self.__class__.FONT_PIXEL_SIZE)
-        font.setItalic(False)
-        painter.setFont(font)
+        painter.setPen(self.noPen)
 
         # UI Properties
 
-        leadRectangleWidth = 4
-        textSpacer = 4
+        leadRectangleWidth = self.LEAD_RECTANGLE_WIDTH
+        textSpacer = self.TEXT_SPACER
         leadTextMargin = leadRectangleWidth * 2 + textSpacer
-
-        # Items
-
-        allItems = cmds.textScrollList('%s_ShaderScrollList'
-                                       % windowID, query=True, allItems=True)
-        item = allItems[index.row()]
-        value = index.data(QtCore.Qt.DisplayRole)
-
-        # Check weather the shader is in part of the ShaderUtility.
-        # I noticed sometimes with updateUI there is a latency whilst the shaderUtility updates,
-        # hence I get paint errors.
-
-        try:
-            shaderUtility.data[shaderUtility.customStringToShaderName(item)]
-        except:
-            return False
-
-        # Getting information about the item
-
-        shaderName = shaderUtility.customStringToShaderName(value,
-                                                            properties=False)
-        nameSpace = shaderUtility.data[shaderName]['nameSpace']
-        shaderType = shaderUtility.data[shaderName]['type']
-        attr = shaderUtility.customStringToShaderName(value,
-                                                      properties=True)
+        textTop = option.rect.top() + self.FONT_PIXEL_SIZE_OFFSET
+        textHeight = option.rect.height() - self.FONT_PIXEL_SIZE_OFFSET
 
         # Getting visual width of the text to be drawn
         # in Maya 2017 update 4 I'm not getting the ':' anymore..
 
-        shaderNameWidth = \
-            QtGui.QFontMetrics(font).width(shaderName.split(':')[-1])
-
-        font.setBold(False)
-        font.setPixelSize(10)
-        painter.setFont(font)
-        nameSpaceWidth = QtGui.QFontMetrics(font).width(nameSpace)
+        nameSpace = row.nameSpace
+        nameSpaceWidth = self._width('small', nameSpace)
+        selected = option.state & QtWidgets.QStyle.State_Selected
 
         # Draw active items
 
-        if shaderUtility.isActive(item):
-            if 'M-' in attr:
+        if row.active:
+            if row.mask:
                 mOffset = leadRectangleWidth
             else:
                 mOffset = 0
 
-            if option.state & QtWidgets.QStyle.State_Selected:
-                painter.setBrush(QtGui.QBrush(QtGui.QColor(82, 133,
-                                                           166)))
+            if selected:
+                painter.setBrush(self.brushes['selected'])
+            elif row.environment:
+                painter.setBrush(self.brushes['activeEnvironment'])
+            elif row.light:
+                painter.setBrush(self.brushes['activeLight'])
             else:
-                if shaderUtility.data[shaderName]['environment']:
-                    painter.setBrush(QtGui.QBrush(QtGui.QColor(70, 70,
-                                                               90)))
-                elif shaderUtility.data[shaderName]['light']:
-                    painter.setBrush(QtGui.QBrush(QtGui.QColor(150,
-                                                               100, 50)))
-                else:
-                    painter.setBrush(QtGui.QBrush(QtGui.QColor(90, 90,
-                                                               90)))
+                painter.setBrush(self.brushes['active'])
 
             # Background rectangle
 
@@ -3388,7 +3264,7 @@ class WindowStyle(QtWidgets.QStyledItemDelegate):
 
             # 'Active' marker
 
-            painter.setBrush(QtGui.QBrush(QtGui.QColor(255, 170, 100)))
+            painter.setBrush(self.brushes['activeMarker'])
             painter.drawRect(QtCore.QRect(option.rect.left(),
                                           option.rect.top(), leadRectangleWidth,
                                           option.rect.height()))
@@ -3400,9 +3276,8 @@ class WindowStyle(QtWidgets.QStyledItemDelegate):
                 # Draw background rectangle for namespace
 
                 if nameSpace != '':
-                    painter.setPen(QtGui.QPen(QtCore.Qt.NoPen))
-                    painter.setBrush(QtGui.QBrush(QtGui.QColor(75, 75,
-                                                               75)))
+                    painter.setPen(self.noPen)
+                    painter.setBrush(self.brushes['activeNameSpace'])
                     painter.drawRect(QtCore.QRect(leadRectangleWidth
                                                   + mOffset, option.rect.top(),
                                                   nameSpaceWidth + leadRectangleWidth * 2,
@@ -3410,118 +3285,85 @@ class WindowStyle(QtWidgets.QStyledItemDelegate):
 
                 # Draw namespace
 
-                painter.setPen(QtGui.QPen(QtGui.QColor(150, 150, 150)))
-                font.setBold(False)
-                font.setPixelSize(10)
-                painter.setFont(font)
+                painter.setPen(self.pens['activeNameSpace'])
+                painter.setFont(self.fonts['small'])
 
                 painter.drawText(QtCore.QRect(leadTextMargin
                                               - leadRectangleWidth + mOffset,
-                                              option.rect.top()
-                                              + self.__class__.FONT_PIXEL_SIZE_OFFSET,
+                                              textTop,
                                               option.rect.width(),
-                                              option.rect.height()
-                                              - self.__class__.FONT_PIXEL_SIZE_OFFSET),
-                                 QtCore.Qt.AlignLeft, '%s' % nameSpace)  # vertical offset
+                                              textHeight),
+                                 QtCore.Qt.AlignLeft, nameSpace)  # vertical offset
 
             # Draw shader name
 
-            painter.setPen(QtGui.QPen(QtGui.QColor(210, 210, 210)))
-            font.setBold(True)
-            font.setPixelSize(self.__class__.FONT_PIXEL_SIZE)
-            painter.setFont(font)
-
-            painter.drawText(QtCore.QRect(((leadRectangleWidth if nameSpace
-                                            != '' else 0)) + leadRectangleWidth * 3
-                                          + nameSpaceWidth + mOffset,
-                                          option.rect.top()
-                                          + self.__class__.FONT_PIXEL_SIZE_OFFSET,
-                                          option.rect.width(), option.rect.height()
-                                          - self.__class__.FONT_PIXEL_SIZE_OFFSET),
-                             QtCore.Qt.AlignLeft, '%s'
-                             % shaderName.split(':')[-1])  # adding text spacing then there's a name space drawn
+            nameLeft = ((leadRectangleWidth if nameSpace != '' else 0)) \
+                + leadRectangleWidth * 3 + nameSpaceWidth + mOffset
+            painter.setPen(self.pens['activeName'])
+            painter.setFont(self.fonts['nameBold'])
+
+            painter.drawText(QtCore.QRect(nameLeft, textTop,
+                                          option.rect.width(), textHeight),
+                             QtCore.Qt.AlignLeft, row.shortName)  # adding text spacing then there's a name space drawn
 
             # Draw warning icon
 
-            if '!!' in attr:
-                QIcon = QtGui.QImage(self.warningIcon)
-                if shaderUtility.data[shaderName]['environment'] \
-                        is False:
-                    painter.drawImage(QtCore.QPoint(((leadRectangleWidth if nameSpace
-                                                      != '' else 0)) + leadRectangleWidth * 3
-                                                    + nameSpaceWidth + mOffset
-                                                    + QtGui.QFontMetrics(font).width('%s'
-                                                                                     % shaderName.split(':')[-1]) + 1,
-                                                    option.rect.top()
-                                                    + self.__class__.ROW_HEIGHT / 2
-                                                    - QIcon.height() / 2), QIcon)
-                attr = attr.replace('!!', '')
+            if row.warning and row.environment is False:
+                icon = self.warningImage
+                painter.drawImage(QtCore.QPoint(nameLeft
+                                                + self._width('nameBold', row.shortName) + 1,
+                                                option.rect.top()
+                                                + self.ROW_HEIGHT / 2
+                                                - icon.height() / 2), icon)
 
             # If the item is a mask append a small black rectangle to mark it
 
-            if 'M-' in attr:
-                painter.setPen(QtGui.QPen(QtCore.Qt.NoPen))
-                painter.setBrush(QtGui.QBrush(QtGui.QColor(50, 50, 50)))
+            if row.mask:
+                painter.setPen(self.noPen)
+                painter.setBrush(self.brushes['mask'])
                 painter.drawRect(QtCore.QRect(leadRectangleWidth,
                                               option.rect.top(), leadRectangleWidth,
                                               option.rect.height()))
 
             # Arnold shader override and attributes
 
-            painter.setPen(QtGui.QPen(QtGui.QColor(150, 150, 150)))
-            font.setBold(False)
-            font.setPixelSize(10)
-            painter.setFont(font)
+            painter.setPen(self.pens['attributes'])
+            painter.setFont(self.fonts['small'])
 
-            if '#' in attr:  # check if the item is being overriden by a shader
+            if row.shaderOverride:  # check if the item is being overriden by a shader
 
                 # Shader override icon
 
-                QIcon = QtGui.QImage(self.shaderOverrideIcon)
+                icon = self.shaderOverrideImage
                 painter.drawImage(QtCore.QPoint(option.rect.width()
-                                                - QIcon.width() - leadRectangleWidth,
+                                                - icon.width() - leadRectangleWidth,
                                                 option.rect.top()
-                                                + self.__class__.ROW_HEIGHT / 2
-                                                - QIcon.height() / 2), QIcon)
-
-                # Remove shader override character and draw arnold attributes
-
-                attr = attr.replace('#', '')
+                                                + self.ROW_HEIGHT / 2
+                                                - icon.height() / 2), icon)
 
-                painter.drawText(QtCore.QRect(0, option.rect.top()
-                                              + self.__class__.FONT_PIXEL_SIZE_OFFSET,
-                                              option.rect.width() - QIcon.width()
+                painter.drawText(QtCore.QRect(0, textTop,
+                                              option.rect.width() - icon.width()
                                               - leadRectangleWidth * 2,
-                                              option.rect.height()
-                                              - self.__class__.FONT_PIXEL_SIZE_OFFSET),
-                                 QtCore.Qt.AlignRight,
-                                 '{0}-{1}'.format(shaderType, attr))
+                                              textHeight),
+                                 QtCore.Qt.AlignRight, row.label)
             else:
-                painter.drawText(QtCore.QRect(0, option.rect.top()
-                                              + self.__class__.FONT_PIXEL_SIZE_OFFSET,
+                painter.drawText(QtCore.QRect(0, textTop,
                                               option.rect.width()
                                               - leadRectangleWidth,
-                                              option.rect.height()
-                                              - self.__class__.FONT_PIXEL_SIZE_OFFSET),
-                                 QtCore.Qt.AlignRight,
-                                 '{0}-{1}'.format(shaderType, attr))
+                                              textHeight),
+                                 QtCore.Qt.AlignRight, row.label)
 
         # !!! Draw inactive items
 
-        if shaderUtility.isActive(item) is False:
-            if option.state & QtWidgets.QStyle.State_Selected:
-                painter.setBrush(QtGui.QBrush(QtGui.QColor(82, 133,
-                                                           166)))
+        else:
+            if selected:
+                painter.setBrush(self.brushes['selected'])
+            elif row.environment:
+                painter.setBrush(self.brushes['inactiveEnvironment'])
+            elif row.light:
+                painter.setBrush(self.brushes['inactiveLight'])
             else:
-                if shaderUtility.data[shaderName]['environment']:
-                    painter.setBrush(QtGui.QBrush(QtGui.QColor(40, 40,
-                                                               70)))
-                elif shaderUtility.data[shaderName]['light']:
-                    painter.setBrush(QtGui.QBrush(QtGui.QColor(65, 65,
-                                                               35)))
-                else:
-                    painter.setBrush(QtGui.QBrush(QtGui.QColor(55, 55,
-                                                               55)))
+                painter.setBrush(self.brushes['inactive'])
 
             painter.drawRect(option.rect)
 
@@ -3532,71 +3374,48 @@ class WindowStyle(QtWidgets.QStyledItemDelegate):
                 # Draw background rectangle for namespace
 
                 if nameSpace != '':
-                    painter.setPen(QtGui.QPen(QtCore.Qt.NoPen))
-                    painter.setBrush(QtGui.QBrush(QtGui.QColor(50, 50,
-                                                               50)))
+                    painter.setPen(self.noPen)
+                    painter.setBrush(self.brushes['inactiveNameSpace'])
                     painter.drawRect(QtCore.QRect(0, option.rect.top(),
                                                   nameSpaceWidth + leadRectangleWidth * 2,
                                                   option.rect.height()))
 
                 # Draw namespace rectangle and text
 
-                painter.setPen(QtGui.QPen(QtGui.QColor(100, 100, 100)))
-                font.setBold(False)
-                font.setPixelSize(10)
-                painter.setFont(font)
+                painter.setPen(self.pens['inactiveNameSpace'])
+                painter.setFont(self.fonts['small'])
 
-                painter.drawText(QtCore.QRect(textSpacer,
-                                              option.rect.top()
-                                              + self.__class__.FONT_PIXEL_SIZE_OFFSET,
-                                              option.rect.width(),
-                                              option.rect.height()
-                                              - self.__class__.FONT_PIXEL_SIZE_OFFSET),
-                                 QtCore.Qt.AlignLeft, '%s' % nameSpace)  # vertical offset
+                painter.drawText(QtCore.QRect(textSpacer, textTop,
+                                              option.rect.width(), textHeight),
+                                 QtCore.Qt.AlignLeft, nameSpace)  # vertical offset
 
             # Draw shader name
 
-            painter.setPen(QtGui.QPen(QtGui.QColor(150, 150, 150)))
-            font.setBold(False)
-            font.setPixelSize(self.__class__.FONT_PIXEL_SIZE)
-            painter.setFont(font)
+            painter.setPen(self.pens['inactiveName'])
+            painter.setFont(self.fonts['name'])
 
             painter.drawText(QtCore.QRect(((textSpacer if nameSpace
                                             != '' else 0)) + textSpacer
                                           + nameSpaceWidth + leadRectangleWidth,
-                                          option.rect.top()
-                                          + self.__class__.FONT_PIXEL_SIZE_OFFSET,
-                                          option.rect.width(), option.rect.height()
-                                          - self.__class__.FONT_PIXEL_SIZE_OFFSET),
-                             QtCore.Qt.AlignLeft, '%s'
-                             % shaderName.split(':')[-1])  # adding text spacing then there's a name space drawn
-
-            try:
-
-                # Arnold shader override and attributes
+                                          textTop,
+                                          option.rect.width(), textHeight),
+                             QtCore.Qt.AlignLeft, row.shortName)  # adding text spacing then there's a name space drawn
 
-                painter.setPen(QtGui.QPen(QtGui.QColor(150, 150, 150)))
-                font.setBold(False)
-                font.setPixelSize(10)
-                painter.setFont(font)
+            # Arnold shader override and attributes
 
-                painter.drawText(QtCore.QRect(0, option.rect.top()
-                                              + self.__class__.FONT_PIXEL_SIZE_OFFSET,
-                                              option.rect.width()
-                                              - leadRectangleWidth,
-                                              option.rect.height()
-                                              - self.__class__.FONT_PIXEL_SIZE_OFFSET),
-                                 QtCore.Qt.AlignRight,
-                                 '{0}-{1}'.format(shaderType,
-                                                  attr[1:][:-1]))
-            except:
+            painter.setPen(self.pens['attributes'])
+            painter.setFont(self.fonts['small'])
 
-                raise RuntimeError('Error drawing text.')
+            painter.drawText(QtCore.QRect(0, textTop,
+                                          option.rect.width()
+                                          - leadRectangleWidth,
+                                          textHeight),
+                             QtCore.Qt.AlignRight, row.label)
 
         # Separators
 
-        painter.setPen(QtGui.QPen(QtCore.Qt.NoPen))
-        painter.setBrush(QtGui.QBrush(QtGui.QColor(50, 50, 50)))
+        painter.setPen(self.noPen)
+        painter.setBrush(self.brushes['separator'])
         painter.drawRect(QtCore.QRect(option.rect.left(),
                                       option.rect.top(), option.rect.width(), 1))
 
@@ -3620,16 +3439,13 @@ class WindowStyle(QtWidgets.QStyledItemDelegate):
                 }'
                                    )
 
-        q.getQItem('%s_ShaderScrollList' % windowID,
-                   QtWidgets.QListWidget)
-
-        QSize = QtCore.QSize(delegate.ROW_WIDTH, delegate.ROW_HEIGHT)
+        # One delegate paints every row, the view has uniform row heights
+        # so the row size comes from its sizeHint once
 
-        for i in range(q.widget.count()):
-            q.widget.setItemDelegateForRow(i, delegate)
-            q.widget.item(i).setSizeHint(QSize)
+        if window.shadersWidget.itemDelegate() is not delegate:
+            window.shadersWidget.setItemDelegate(delegate)
 
-        q.widget.setStyleSheet('QListWidget {\
+        window.shadersWidget.setStyleSheet('QTreeView {\
                 padding:0;\
                 margin:0;\
                 color: rgb(200,200,200);\
@@ -3895,6 +3711,7 @@ def _cb_kBeforeNew(clientData):
     window = None
     global windowStyle
     windowStyle = None
+    refreshScheduler.cancel()
 
     for cb in _cbs:
         OpenMaya.MSceneMessage.removeCallback(cb)
@@ -3932,6 +3749,7 @@ def _cb_kBeforeOpen(clientData):
     window = None
     global windowStyle
     windowStyle = None
+    refreshScheduler.cancel()
 
     for cb in _cbs:
         OpenMaya.MSceneMessage.removeCallback(cb)
@@ -3945,6 +3763,31 @@ def _cb_kBeforeOpen(clientData):
     _del()
 
 
+# Refreshes requested while handling an action run once, when Maya is idle.
+# The sections and shaders of the requests are merged, so each section is
+# rebuilt once.
+
+def _refreshWindow(updateRenderSetup=False, sections=None, shaders=None, **flags):
+    if window is not None:
+        window.updateUI(updateRenderSetup=updateRenderSetup,
+                        sections=sections, shaders=shaders)
+
+
+refreshScheduler = refresh.RefreshScheduler()
+refreshScheduler.addStage('window', _refreshWindow)
+
+
+def requestRefresh(updateRenderSetup=False, sections=REFRESH_SECTIONS,
+                   shaders=()):
+    """Refreshes `sections` of the window once the current action is done.
+
+    shaders: the shaders whose list items to refresh when the 'shaders'
+    section isn't rebuilt.
+    """
+    refreshScheduler.request('window', updateRenderSetup=updateRenderSetup,
+                             sections=sections, shaders=shaders)
+
+
 def createUI(eventsFilters=False):
 
     # Let's make sure arnold is loaded and that the arnold options are created.
@@ -3964,6 +3807,21 @@ def createUI(eventsFilters=False):
 
     rsUtility = utility.Utility()
     rsRenderOutput = renderOutput.RenderOutput()
+    if renderOutput.PREFETCH_VERSIONS:
+        try:
+            rsRenderOutput.prefetchVersions(
+                [l.name() for l in renderSetup.instance().getRenderLayers()])
+        except RuntimeError:
+            pass  # no workspace folder
+
+    # List the texture folders while the window is built
+    sceneInfo = autoConnect.SceneInfo()
+    if sceneInfo.sourceImages:
+        autoConnect.AutoConnect.sourceImagesIndex.prefetch(
+            sceneInfo.sourceImages)
+
+    # Only rescan the shaders that changed when the window refreshes
+    shaderUtility.addCallbacks()
 
     window = RenderSetupUtilityWindow()
     window.show(dockable=True)  # creates the workspace control
@@ -2,7 +2,6 @@
 Collection of utility functions.
 """
 
-import copy
 import re
 
 import maya.cmds as cmds
@@ -39,50 +38,46 @@ def getIndex(a, b):
     return [i + 1 for i, item in enumerate(a) if item in set(b)]
 
 
-def natsort(inList, filterOn=False):
+NATSORT_PATTERN = re.compile(r'(\d+|\D+)')
+NATSORT_CACHE_SIZE = 200000
+
+# Keys shared by natsort(cache=True) calls, eg. shader names that are
+# sorted again on every refresh
+_natsortKeys = {}
+
+
+def natsortKey(s):
+    """ Natural sort key: the runs of digits of the string as integers.
+    """
+    return tuple(int(f) if f.isdigit() else f
+                 for f in NATSORT_PATTERN.findall(s))
+
+
+def _cachedNatsortKey(s):
+    key = _natsortKeys.get(s)
+    if key is None:
+        if len(_natsortKeys) >= NATSORT_CACHE_SIZE:
+            _natsortKeys.clear()
+        key = _natsortKeys[s] = natsortKey(s)
+    return key
+
+
+def natsort(inList, filterOn=False, cache=False):
     """ Custom natural sorting for lists.
+
+    With filterOn the items starting with a space (active shaders) are
+    listed first. With cache the keys are kept for later calls.
     """
-    def try_int(s):
-        """ Is it an integer? """
-        try:
-            return int(s)
-        except:
-            return s
-
-    def natsort_key(s):
-        """"""
-        return map(try_int, re.findall(r'(\d+|\D+)', s))
-
-    def natcmp(a, b):
-        """"""
-        return (natsort_key(a) > natsort_key(b)) - (natsort_key(a) < natsort_key(b))
-
-    def natcasecmp(a, b):
-        """"""
-        return natcmp(a.lower(), b.lower())
-
-    def natsort(seq, cmp=natcmp, reverse=False):
-        """"""
-        if reverse:
-            seq.sort(cmp, reverse=True)
-        else:
-            seq.sort(cmp)
-
-    def natsorted(seq, cmp=natcmp, reverse=False):
-        """"""
-        temp = copy.copy(seq)
-        natsort(temp, cmp, reverse)
-        return temp
-
-    # Custom:
-    first = []
-    second = []
-    for s in inList:
-        if s[:1] == ' ':
-            first.append(s)
-        else:
-            second.append(s)
+    key = _cachedNatsortKey if cache else natsortKey
+
     if filterOn is True:
-        return natsorted(first) + natsorted(second)
+        first = []
+        second = []
+        for s in inList:
+            if s[:1] == ' ':
+                first.append(s)
+            else:
+                second.append(s)
+        return sorted(first, key=key) + sorted(second, key=key)
     else:
-        return natsorted(inList)
+        return sorted(inList, key=key)
@@ -2,6 +2,9 @@
 Module doc stub.
 """
 
+import contextlib
+import re
+
 import maya.api.OpenMaya as OpenMaya
 import maya.app.renderSetup.model.collection as collection
 import maya.app.renderSetup.model.renderSetup as renderSetup
@@ -158,6 +161,12 @@ class Utility(object):
 
         self.overrideAttributes = OVERRIDE_ATTRIBUTES
 
+        self._applyDepth = 0  # nesting of deferredApply()
+        self._memberIndex = {}  # layer name: {member: set(collection names)}
+        self._templateDepth = 0  # nesting of overrideTemplate()
+        self._overrideMaps = {}  # collection name: {attribute: [overrides]}
+        self._collectionMaps = {}  # layer name: ({name: c}, {base name: c})
+
         def addLayer(inName):
             lyrs = renderSetup.instance().getRenderLayers()
 
@@ -177,6 +186,7 @@ class Utility(object):
                 ll = l.lightsCollectionInstance()
 
                 c = l.createCollection(EMPTY_COLLECTION)
+                self.invalidateCollections(l.name())
                 c.setSelfEnabled(False)
                 sel = c.getSelector()
                 sel.setPattern('*')
@@ -218,32 +228,34 @@ class Utility(object):
                 self._extendActiveCollection(valid=False)
                 return self.activeCollection
 
-            colls = self.activeLayer.getCollections()
-
             if inValue is None:
                 self._extendActiveCollection(valid=False)
-                return colls
+                return self.activeLayer.getCollections()
 
             # Find collection in the current layer
 
-            found = [c for c in colls if '{0}{1}'.format(
-                inValue, COLLECTION_SUFFIX) in c.name()]
+            found = self._findCollection(
+                self.activeLayer, '{0}{1}'.format(inValue, COLLECTION_SUFFIX))
 
-            if found != []:
-                self._extendActiveCollection(inCollection=found[0], valid=True)
+            if found is not None:
+                self._extendActiveCollection(inCollection=found, valid=True)
                 return self.activeCollection
 
-            if found == [] and isQuery is True:
+            if found is None and isQuery is True:
                 self._extendActiveCollection(valid=False)
                 return self.activeCollection
 
-            if found == [] and isQuery is False:
+            if found is None and isQuery is False:
                 return self.addCollection('{0}{1}'.format(inValue, COLLECTION_SUFFIX), addOverrides=addOverrides)
                 return self.activeCollection
 
         def addCollection(inValue, addOverrides=True):
             '''
             Adds a new collection and the default overrides.
+
+            A list of names shares one override template mesh. Calls made
+            inside overrideTemplate() share it with the other collections
+            of the block.
             '''
 
             l = self.activeLayer
@@ -256,6 +268,7 @@ class Utility(object):
                               '\' already exists in \'' + self.activeLayer.name() + '\'')
                         return None
                 c = l.createCollection(inValue)
+                self.invalidateCollections(l.name())
                 self._extendActiveCollection(c, valid=True)
 
                 # Add overrides
@@ -263,45 +276,50 @@ class Utility(object):
                     self._addArnoldPropertyOverrides()
                 return self.activeCollection
             if type(inValue) is list or tuple:
-                for string in inValue:
-                    for item in colls:
+                with self.overrideTemplate():
+                    for string in inValue:
                         exists = False
-                        if item.name() == string:
-                            exists = True
-                            print('# Collection \'' + item.name() +
-                                  '\' already exists in \'' + self.activeLayer.name() + '\'')
-                            break
-                    if exists is False:
-                        c = l.createCollection(string)
-                        self._extendActiveCollection(c, valid=True)
-                        self._addArnoldPropertyOverrides()
+                        for item in colls:
+                            if item.name() == string:
+                                exists = True
+                                print('# Collection \'' + item.name() +
+                                      '\' already exists in \'' + self.activeLayer.name() + '\'')
+                                break
+                        if exists is False:
+                            c = l.createCollection(string)
+                            self.invalidateCollections(l.name())
+                            self._extendActiveCollection(c, valid=True)
+                            self._addArnoldPropertyOverrides()
                 return self.activeCollection
 
         def removeCollection(inValue):
             """
-            Get and delete collection by name.
+            Get and delete collection by name, with or without COLLECTION_SUFFIX.
             Checks for incremented maya object names.
             """
 
-            colls = self.activeLayer.getCollections()
-
-            found = [c for c in colls if inValue in c.name()]
+            found = self._findCollection(
+                self.activeLayer, '{0}{1}'.format(inValue, COLLECTION_SUFFIX))
+            if found is None:
+                found = self._findCollection(self.activeLayer, inValue)
 
-            if found != []:
-                collection.delete(found[0])
+            if found is not None:
+                self.invalidateOverrides(found.name())
+                collection.delete(found)
+                self.invalidateCollections(self.activeLayer.name())
+                self.invalidateMemberIndex(self.activeLayer.name())
                 return True
 
-            if found == []:
-                print('# Couldn\'t find collection to delete.')
-                return False
+            print('# Couldn\'t find collection to delete.')
+            return False
 
         def setSelection(inValue, inFilterType):
             # 0 = All, 1 = Transforms, 2 = Shapes, 4 = Lights, 7 = Cameras
             self.activeCollection.getSelector().setFilterType(inFilterType)
-            self.activeCollection.selection.set(inValue)
+            self._setIndexedSelection(self.activeCollection, inValue)
 
         def removeSelection(inValue):
-            self.activeCollection.selection.remove(s)
+            self._removeIndexedSelection(self.activeCollection, inValue)
 
         def overrides(inValue=None):
             if self.activeCollection is None:
@@ -309,51 +327,54 @@ class Utility(object):
             if self.activeLayer is None:
                 return None
 
-            ov = self.activeCollection.getOverrides()
-
             # Return whole list
             if inValue is None:
-                return ov
+                return self.activeCollection.getOverrides()
             # Return by index
             if type(inValue) is int:
                 try:
-                    return ov[inValue]
+                    return self.activeCollection.getOverrides()[inValue]
                 except:
                     print('# Couldn\'t get override of that index.')
                     return None
             # Return by name
             if isinstance(inValue, basestring):
-                found = False
-                for o in ov:
-                    try:
-                        if o.attributeName() == inValue:
-                            found = True
-                            return o
-                    except:
-                        print('# Couldn\'t get override based on that name.')
-                if found is False:
-                    return None
+                found = self._getOverrideMap(self.activeCollection).get(inValue)
+                if found:
+                    return found[0]
+                return None
 
         def setOverrideValue(inName, inValue=None):
-            ov = self.activeCollection.overrides()
-
-            for o in ov:
+            found = self._getOverrideMap(self.activeCollection).get(inName, ())
+            for o in found:
                 try:
-                    if o.attributeName() == inName:
-                        o.setAttrValue(inValue)
+                    o.setAttrValue(inValue)
                 except:
                     print('# Couldn\'t set override attribute value.')
                     return None
 
         def getOverrideValue(inName):
-            ov = self.activeCollection.overrides()
-            for o in ov:
+            found = self._getOverrideMap(self.activeCollection).get(inName)
+            if not found:
+                return None
+            try:
+                return found[0].getAttrValue()
+            except:
+                print('# Couldn\'t get override attribute value.')
+                return None
+
+        def getOverrideValues():
+            """
+            Returns an {attribute: value} dict of the collection's overrides,
+            read in a single pass over the override map.
+            """
+            values = {}
+            for attr, found in self._getOverrideMap(self.activeCollection).iteritems():
                 try:
-                    if o.attributeName() == inName:
-                        return o.getAttrValue()
+                    values[attr] = found[0].getAttrValue()
                 except:
                     print('# Couldn\'t get override attribute value.')
-                    return None
+            return values
 
         def _extendActiveLayer(inLayer=None, valid=True):
             if inLayer.name() == self.defaultName:
@@ -380,6 +401,7 @@ class Utility(object):
                 self.activeCollection.overrides = overrides
                 self.activeCollection.setOverrideValue = setOverrideValue
                 self.activeCollection.getOverrideValue = getOverrideValue
+                self.activeCollection.getOverrideValues = getOverrideValues
                 self.activeCollection.setSelection = setSelection
                 self.activeCollection.removeSelection = removeSelection
                 self.activeCollection.selection = inCollection.getSelector().staticSelection
@@ -408,15 +430,17 @@ class Utility(object):
                 raise RuntimeError(
                     'An error occured adding default overrides.')
 
-            if cmds.objExists(TEMP_NAME):
-                p = cmds.listRelatives(TEMP_NAME, allParents=True)[0]
-                cmds.delete(p)
+            # Kept for the next collection inside overrideTemplate()
+            if self._templateDepth == 0:
+                self._deleteOverrideTemplate()
 
         def _addArnoldPropertyOverrides():
             '''
             Adds a list of absolute overrides of Arnold properties.
             '''
 
+            self.invalidateOverrides(self.activeCollection.name())
+
             # Add temp polyObject
             if cmds.objExists(TEMP_NAME):
                 pass
@@ -437,15 +461,16 @@ class Utility(object):
                 self.activeCollection.overrides = overrides
                 print('# An error occured adding default overrides.')
 
-            if cmds.objExists(TEMP_NAME):
-                p = cmds.listRelatives(TEMP_NAME, allParents=True)[0]
-                cmds.delete(p)
+            # Kept for the next collection inside overrideTemplate()
+            if self._templateDepth == 0:
+                self._deleteOverrideTemplate()
 
         def _addShaderOverride():
             '''
             Adds a ShaderOverride to the activeCollection.
             '''
             SHADER_OVERRIDE_DEFAULTNAME = '%sShaderOverride#' % self.activeCollection.name()
+            self.invalidateOverrides(self.activeCollection.name())
             o = self.activeCollection.createOverride(
                 SHADER_OVERRIDE_DEFAULTNAME, 'shaderOverride')
             return o
@@ -468,22 +493,357 @@ class Utility(object):
         # Set activeLayer on init
         self._extendActiveLayer(
             renderSetup.instance().getVisibleRenderLayer(), valid=True)
+
     # Methods
 
+    @contextlib.contextmanager
+    def deferredApply(self):
+        """
+        Defers re-applying the visible render layer until the block exits.
+
+        Render Setup re-applies the visible layer after every edit of its
+        collections. When the active layer is the visible one, the default
+        layer is made visible inside this block instead and the active layer
+        is switched back, and so applied, once at the end. Edits of a layer
+        that isn't visible aren't applied, so nothing is switched. Blocks
+        can be nested.
+        """
+
+        rs = renderSetup.instance()
+        visible = rs.getVisibleRenderLayer()
+        switch = (self._applyDepth == 0
+                  and visible.name() != self.defaultName
+                  and self.activeLayer is not None
+                  and visible.name() == self.activeLayer.name())
+
+        self._applyDepth += 1
+        if switch:
+            rs.switchToLayer(rs.getDefaultRenderLayer())
+        try:
+            yield
+        finally:
+            self._applyDepth -= 1
+            if switch:
+                rs.switchToLayer(visible)
+
+    @contextlib.contextmanager
+    def overrideTemplate(self):
+        """
+        Keeps the override template mesh alive until the block exits.
+
+        The Arnold property overrides are finalized against a temporary
+        mesh, which is otherwise created and deleted for every collection.
+        Inside this block it is created once and deleted at the end, so
+        the scene is left as it was. Blocks can be nested.
+
+        Only the mesh is shared. Each override is still created and
+        finalized on its own, finalize() reads the attribute type from the
+        live plug and can't be given it from an earlier override.
+        """
+
+        self._templateDepth += 1
+        try:
+            yield
+        finally:
+            self._templateDepth -= 1
+            if self._templateDepth == 0:
+                self._deleteOverrideTemplate()
+
+    @staticmethod
+    def _deleteOverrideTemplate():
+        """Deletes the override template mesh if it exists."""
+        if cmds.objExists(TEMP_NAME):
+            p = cmds.listRelatives(TEMP_NAME, allParents=True)[0]
+            cmds.delete(p)
+
+    def _findCollection(self, layer, name):
+        """
+        Returns the collection of a layer called `name`, or None.
+
+        Names are matched exactly. When no collection has the exact name,
+        a collection Maya renamed by appending digits, eg. 'name1' when
+        'name' was taken by another node, is returned instead.
+
+        The name maps of each layer are built once and dropped by
+        invalidateCollections() when collections are created or deleted.
+        A cached collection deleted or renamed outside of this class drops
+        the maps of its layer, which are then built again.
+        """
+
+        maps = self._collectionMaps.get(layer.name())
+        if maps is not None:
+            exact, incremented = maps
+            c = exact.get(name)
+            if c is not None:
+                stale = c.name() != name
+            else:
+                c = incremented.get(name)
+                stale = c is not None and re.sub(r'\d+$', '', c.name()) != name
+            if c is not None and (stale or not cmds.objExists(c.name())):
+                maps = None
+        if maps is None:
+            exact = {}
+            incremented = {}
+            for c in layer.getCollections():
+                collectionName = c.name()
+                exact[collectionName] = c
+                base = re.sub(r'\d+$', '', collectionName)
+                if base != collectionName:
+                    incremented.setdefault(base, c)
+            maps = (exact, incremented)
+            self._collectionMaps[layer.name()] = maps
+
+        exact, incremented = maps
+        if name in exact:
+            return exact[name]
+        return incremented.get(name)
+
+    def invalidateCollections(self, layerName=None):
+        """
+        Drops the collection name maps of a layer, or of every layer.
+        """
+
+        if layerName is None:
+            self._collectionMaps = {}
+        else:
+            self._collectionMaps.pop(layerName, None)
+
+    def _getOverrideMap(self, inCollection):
+        """
+        Returns the {attribute name: [overrides]} map of a collection.
+
+        getOverrides() is scanned once per collection; the map is dropped
+        by invalidateOverrides() when overrides are created or deleted.
+        """
+
+        name = inCollection.name()
+        overrideMap = self._overrideMaps.get(name)
+        if overrideMap is not None:
+            return overrideMap
+
+        overrideMap = {}
+        for o in inCollection.getOverrides():
+            try:
+                attr = o.attributeName()
+            except:
+                continue
+            overrideMap.setdefault(attr, []).append(o)
+        self._overrideMaps[name] = overrideMap
+        return overrideMap
+
+    def invalidateOverrides(self, collectionName=None):
+        """
+        Drops the override map of a collection, or of every collection.
+        """
+
+        if collectionName is None:
+            self._overrideMaps = {}
+        else:
+            self._overrideMaps.pop(collectionName, None)
+
+    def invalidateMemberIndex(self, layerName=None):
+        """
+        Drops the member index of a layer, or of every layer.
+
+        The index only tracks the edits made through this class, so it has
+        to be invalidated whenever Render Setup may have been edited
+        elsewhere, eg. before the ui refreshes.
+        """
+
+        if layerName is None:
+            self._memberIndex = {}
+        else:
+            self._memberIndex.pop(layerName, None)
+
+    def _getMemberIndex(self, layer):
+        """
+        Returns the {member: set(collection names)} index of a layer.
+
+        The static selections of the layer's collections are read once;
+        afterwards the index is kept up to date by the selection edits.
+        """
+
+        index = self._memberIndex.get(layer.name())
+        if index is not None:
+            return index
+
+        index = {}
+        for c in layer.getCollections():
+            if c.typeName() != 'collection':
+                continue
+            name = c.name()
+            for member in c.getSelector().staticSelection.asList():
+                index.setdefault(member, set()).add(name)
+        self._memberIndex[layer.name()] = index
+        return index
+
+    def _setIndexedSelection(self, inCollection, members):
+        """Sets the static selection of a collection of the active layer."""
+
+        selection = inCollection.getSelector().staticSelection
+        index = self._memberIndex.get(self.activeLayer.name())
+        if index is not None:
+            name = inCollection.name()
+            for member in selection.asList():
+                owners = index.get(member)
+                if owners is not None:
+                    owners.discard(name)
+                    if not owners:
+                        del index[member]
+            for member in members:
+                index.setdefault(member, set()).add(name)
+        selection.set(members)
+
+    def _removeIndexedSelection(self, inCollection, members):
+        """Removes members from a collection of the active layer."""
+
+        index = self._memberIndex.get(self.activeLayer.name())
+        if index is not None:
+            name = inCollection.name()
+            for member in members:
+                owners = index.get(member)
+                if owners is not None:
+                    owners.discard(name)
+                    if not owners:
+                        del index[member]
+        inCollection.getSelector().staticSelection.remove(members)
+
+    @staticmethod
+    def _membersToRemove(index, owner, result):
+        """Returns the {collection name: [members]} not owning the members."""
+
+        remove = {}
+        for member, i in owner.iteritems():
+            keep = result[i].name()
+            for name in index.get(member, ()):
+                if name != keep:
+                    remove.setdefault(name, []).append(member)
+        return remove
+
+    def addCollections(self, specs):
+        """
+        Adds or updates a batch of collections in the active layer.
+
+        specs: a list of dicts with the keys
+            'name': the collection name without COLLECTION_SUFFIX
+            'members': the objects to set as the static selection
+            'filterType': the selector filter type, defaults to 2 (shapes)
+            'addOverrides': add the Arnold property overrides to new
+                            collections, defaults to True
+
+        Each collection's static selection is set to its members, and the
+        members are removed from every other collection of the layer, as
+        if the specs were added one by one: when specs share a member, the
+        last one keeps it. The member index finds the collections holding
+        the members, so only those selectors are edited, each only once,
+        and the layer is applied once. New collections share one override
+        template mesh.
+
+        Returns the collections in the order of the specs.
+        """
+
+        if self.activeLayer is None or self.activeLayer.name() == self.defaultName:
+            return []
+
+        # The last spec adding a member keeps it
+        owner = {}
+        for i, spec in enumerate(specs):
+            for member in spec['members']:
+                owner[member] = i
+
+        cmds.undoInfo(openChunk=True, chunkName='addCollections')
+        try:
+            with self.deferredApply(), self.overrideTemplate():
+                index = self._getMemberIndex(self.activeLayer)
+                colls = [c for c in self.activeLayer.getCollections()
+                         if c.typeName() == 'collection']
+
+                result = []
+                for i, spec in enumerate(specs):
+                    name = '{0}{1}'.format(spec['name'], COLLECTION_SUFFIX)
+                    c = self._findCollection(self.activeLayer, name)
+                    if c is not None:
+                        self._extendActiveCollection(c, valid=True)
+                    else:
+                        c = self.activeLayer.createCollection(name)
+                        self.invalidateCollections(self.activeLayer.name())
+                        self._extendActiveCollection(c, valid=True)
+                        if spec.get('addOverrides', True):
+                            self._addArnoldPropertyOverrides()
+                        colls.append(c)
+                    result.append(c)
+
+                    members = [f for f in spec['members'] if owner[f] == i]
+                    c.getSelector().setFilterType(spec.get('filterType', 2))
+                    self._setIndexedSelection(c, members)
+
+                # Remove the members from the collections not owning them
+                byName = dict((c.name(), c) for c in colls)
+                remove = self._membersToRemove(index, owner, result)
+                if any(name not in byName for name in remove):
+                    # A collection was deleted or renamed outside of this
+                    # class, read the selections again
+                    self.invalidateMemberIndex(self.activeLayer.name())
+                    index = self._getMemberIndex(self.activeLayer)
+                    remove = self._membersToRemove(index, owner, result)
+
+                for name, members in remove.iteritems():
+                    self._removeIndexedSelection(byName[name], members)
+        finally:
+            cmds.undoInfo(closeChunk=True)
+
+        return result
+
     def removeMissingSelections(self):
-        lyrs = renderSetup.instance().getRenderLayers()
-        for l in lyrs:
-            cl = l.getCollections()
-            for c in cl:
-                if c.typeName() == 'collection':
-                    selector = c.getSelector()
-                    items = selector.staticSelection.asList()
-                    validList = []
-                    if selector.hasMissingObjects():
-                        for item in items:
-                            if cmds.objExists(item):
-                                validList.append(item)
-                            selector.staticSelection.set(validList)
+        """
+        Removes the objects that no longer exist from the static selection
+        of the collections of every layer.
+
+        The paths of all layers are checked with a single ls. A long dag
+        path ls doesn't list is missing. Paths ls may list in another form,
+        components and short or non-dag names, fall back to objExists.
+        Each selector is rewritten once.
+
+        Returns the number of entries removed.
+        """
+
+        selectors = []
+        paths = set()
+        for l in renderSetup.instance().getRenderLayers():
+            for c in l.getCollections():
+                if c.typeName() != 'collection':
+                    continue
+                selector = c.getSelector()
+                if not selector.hasMissingObjects():
+                    continue
+                items = selector.staticSelection.asList()
+                selectors.append((l.name(), selector, items))
+                paths.update(items)
+
+        if not paths:
+            return 0
+
+        existing = set(cmds.ls(list(paths), long=True))
+        missing = set()
+        for f in paths:
+            if f in existing:
+                continue
+            if f.startswith('|') and '.' not in f:
+                missing.add(f)
+            elif not cmds.objExists(f):
+                missing.add(f)
+        if not missing:
+            return 0
+
+        pruned = 0
+        for layerName, selector, items in selectors:
+            validList = [f for f in items if f not in missing]
+            if len(validList) == len(items):
+                continue
+            self.invalidateMemberIndex(layerName)
+            selector.staticSelection.set(validList)
+            pruned += len(items) - len(validList)
+        return pruned
 
     def layer(self, inValue=None):
         lyrs = renderSetup.instance().getRenderLayers()
@@ -0,0 +1,84 @@
+"""
+Structural checks of the placeholder exr files written by ``ac.exr``.
+
+Runs without Maya:
+
+    python -m unittest RenderSetupUtility.tests.test_exr
+
+``bench.exr`` also decodes every chunk of every output size.
+"""
+
+# pylint: disable=C0103
+
+import struct
+import unittest
+import zlib
+
+from ..ac import exr
+
+
+def readHeader(data):
+    """Returns the {name: (type, value)} attributes and the offset table
+    position of an exr file."""
+    attributes = {}
+    i = 8
+    while data[i:i + 1] != b'\0':
+        end = data.index(b'\0', i)
+        name = data[i:end]
+        i = end + 1
+        end = data.index(b'\0', i)
+        attributeType = data[i:end]
+        size = struct.unpack('<i', data[end + 1:end + 5])[0]
+        attributes[name] = (attributeType, data[end + 5:end + 5 + size])
+        i = end + 5 + size
+    return attributes, i + 1
+
+
+class PlaceholderTest(unittest.TestCase):
+
+    SIZES = ((960, 540), (1920, 1080), (1, 1), (3, 17))
+
+    def checkFile(self, width, height, channels):
+        data = exr.placeholder(width, height, channels)
+        self.assertEqual(data[:4], exr.MAGIC)
+        self.assertEqual(struct.unpack('<i', data[4:8])[0], exr.VERSION)
+
+        attributes, offsetTable = readHeader(data)
+        window = struct.pack('<4i', 0, 0, width - 1, height - 1)
+        self.assertEqual(attributes[b'compression'],
+                         (b'compression', struct.pack('<B', exr.ZIP_COMPRESSION)))
+        self.assertEqual(attributes[b'dataWindow'], (b'box2i', window))
+        self.assertEqual(attributes[b'displayWindow'], (b'box2i', window))
+        self.assertEqual(attributes[b'channels'][0], b'chlist')
+        for name, _ in channels:
+            self.assertIn(name.encode('ascii') + b'\0', attributes[b'channels'][1])
+
+        lineSize = width * sum(exr.PIXEL_SIZE[f[1]] for f in channels)
+        count = (height + exr.ZIP_SCANLINES - 1) // exr.ZIP_SCANLINES
+        offsets = struct.unpack('<%dQ' % count,
+                                data[offsetTable:offsetTable + 8 * count])
+        end = offsetTable + 8 * count
+        for i, offset in enumerate(offsets):
+            self.assertEqual(offset, end)
+            y, length = struct.unpack('<ii', data[offset:offset + 8])
+            self.assertEqual(y, i * exr.ZIP_SCANLINES)
+            size = lineSize * min(exr.ZIP_SCANLINES, height - y)
+            chunk = data[offset + 8:offset + 8 + length]
+            if length < size:
+                self.assertEqual(len(zlib.decompress(chunk)), size)
+            else:
+                self.assertEqual(chunk, b'\0' * size)
+            end = offset + 8 + length
+        self.assertEqual(end, len(data))
+
+    def test_rgba(self):
+        for width, height in self.SIZES:
+            self.checkFile(width, height, exr.RGBA)
+
+    def test_aovs(self):
+        for channels in set(exr.AOV_CHANNELS.values()):
+            for width, height in self.SIZES:
+                self.checkFile(width, height, channels)
+
+    def test_invalidSize(self):
+        self.assertRaises(ValueError, exr.placeholder, 0, 1080)
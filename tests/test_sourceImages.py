@@ -0,0 +1,39 @@
+"""
+Checks of the texture file name matching of ``ac.sourceImages``.
+
+Runs without Maya:
+
+    python -m unittest RenderSetupUtility.tests.test_sourceImages
+
+"""
+
+# pylint: disable=C0103
+
+import unittest
+
+from ..ac import sourceImages
+
+
+class MatchAttributeTest(unittest.TestCase):
+
+    def assertMatches(self, fileName, attribute):
+        item = sourceImages.matchAttribute(fileName)
+        self.assertIsNotNone(item, fileName)
+        self.assertEqual(item['attribute'], attribute)
+
+    def test_suffix(self):
+        self.assertMatches('shader_color.tif', 'color')
+        self.assertMatches('shader_KsColor.tx', 'KsColor')
+        self.assertMatches('shader_Ks.exr', 'Ks')
+        self.assertMatches('shader_kd_opacity.png', 'opacity')
+
+    def test_frameAndVersion(self):
+        self.assertMatches('shader_color_1001.tif', 'color')
+        self.assertMatches('shader_color_v002.exr', 'color')
+        self.assertMatches('shader_Kd_v02.tx', 'Kd')
+        self.assertMatches('shader_color.1001.tif', 'color')
+
+    def test_noSuffix(self):
+        for fileName in ('shader.psd', 'color_shader.tif', 'shader_bump.tx',
+                         'shader_color_final.tif', 'shader_1001.tif'):
+            self.assertIsNone(sourceImages.matchAttribute(fileName), fileName)
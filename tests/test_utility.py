@@ -0,0 +1,83 @@
+"""
+Checks of ``main.utility`` against the in-memory Maya of ``bench.fakeMaya``.
+
+Runs without Maya:
+
+    python -m unittest RenderSetupUtility.tests.test_utility
+
+"""
+
+# pylint: disable=C0103, E0401
+
+import sys
+import unittest
+
+try:
+    from .. import bench
+    from ..main.utility import Utility, COLLECTION_SUFFIX
+    import maya.app.renderSetup.model.collection as collection
+except ImportError:
+    # The modules import the package as RenderSetupUtility
+    raise unittest.SkipTest('RenderSetupUtility is not on the path')
+
+
+def spec(name, members):
+    return {'name': name, 'members': members, 'addOverrides': False}
+
+
+@unittest.skipIf(sys.version_info[0] > 2, 'Maya runs the utility in Python 2')
+class AddCollectionsTest(unittest.TestCase):
+
+    def setUp(self):
+        bench.newScene(force=True)
+        self.rsUtility = Utility()
+        self.rsUtility.addLayer('testLayer')
+        self.a, self.b = self.rsUtility.addCollections(
+            [spec('a', ['|x']), spec('b', ['|y'])])
+
+    def members(self, c):
+        return c.getSelector().staticSelection.asList()
+
+    def test_deletedCollection(self):
+        # Deleted outside of the utility, the member index still lists it
+        collection.delete(self.a)
+        b, = self.rsUtility.addCollections([spec('b', ['|x'])])
+        self.assertEqual(b.name(), 'b%s' % COLLECTION_SUFFIX)
+        self.assertEqual(self.members(b), ['|x'])
+
+    def test_renamedCollection(self):
+        self.a.setName('renamed')
+        b, = self.rsUtility.addCollections([spec('b', ['|x'])])
+        self.assertEqual(self.members(b), ['|x'])
+        self.assertEqual(self.members(self.a), [])
+
+    def test_sharedMembers(self):
+        a, b = self.rsUtility.addCollections(
+            [spec('a', ['|y', '|z']), spec('b', ['|z'])])
+        self.assertEqual(self.members(a), ['|y'])
+        self.assertEqual(self.members(b), ['|z'])
+
+
+@unittest.skipIf(sys.version_info[0] > 2, 'Maya runs the utility in Python 2')
+class FindCollectionTest(unittest.TestCase):
+
+    def setUp(self):
+        bench.newScene(force=True)
+        self.rsUtility = Utility()
+        self.layer = self.rsUtility.addLayer('testLayer')
+        self.c = self.layer.createCollection('a%s' % COLLECTION_SUFFIX)
+
+    def find(self, name):
+        return self.rsUtility._findCollection(self.layer, name)
+
+    def test_deletedCollection(self):
+        name = 'a%s' % COLLECTION_SUFFIX
+        self.assertIs(self.find(name), self.c)
+        collection.delete(self.c)
+        self.assertIsNone(self.find(name))
+
+    def test_renamedCollection(self):
+        self.assertIs(self.find('a%s' % COLLECTION_SUFFIX), self.c)
+        self.c.setName('b%s' % COLLECTION_SUFFIX)
+        self.assertIsNone(self.find('a%s' % COLLECTION_SUFFIX))
+        self.assertIs(self.find('b%s' % COLLECTION_SUFFIX), self.c)